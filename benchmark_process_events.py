@@ -0,0 +1,104 @@
+import subprocess
+import sys
+import time
+from system_info import SystemInfo
+from process_events import ProcessEventTracker
+
+# compara o custo de manter a lista de processos atual relendo /proc
+# inteiro (get_process_table) com o de aplicar os eventos do kernel
+# (ProcessEventTracker.poll: le os eventos e so os processos novos). para
+# cada quantidade de processos sinteticos (filhos "sleep" criados pelo
+# script), cada rodada inicia e encerra `churn` processos curtos e mede a
+# mediana dos dois custos. os eventos exigem CAP_NET_ADMIN (netlink) ou
+# linux 5.3+ (pidfd); sem eles so a releitura eh medida
+#
+# uso: python3 benchmark_process_events.py [processos ...] [--mode auto|netlink|pidfd] [--churn N]
+
+default_counts = [0, 500, 2000, 8000]
+default_churn = 10
+repetitions = 20
+
+
+def median(times):
+    times.sort()
+    return times[len(times) // 2]
+
+
+# inicia e espera `churn` processos curtos, gerando inicios e saidas
+def spawn_churn(churn):
+    processes = [subprocess.Popen(["true"]) for _ in range(churn)]
+    for process in processes:
+        process.wait()
+
+
+def measure(sys_info, tracker, churn):
+    scan_times = []
+    event_times = []
+    events = 0
+    for _ in range(repetitions):
+        spawn_churn(churn)
+        start = time.perf_counter()
+        table = sys_info.get_process_table()
+        scan_times.append(time.perf_counter() - start)
+        if tracker is None:
+            continue
+        tracker.on_full_scan(table)
+
+        spawn_churn(churn)
+        time.sleep(0.05)  # entrega dos eventos pelo kernel
+        start = time.perf_counter()
+        result = tracker.poll()
+        event_times.append(time.perf_counter() - start)
+        if result is not None and result[0] == 'events':
+            events += len(result[1][0]) + len(result[1][1])
+    event_time = median(event_times) if event_times else None
+    return median(scan_times), event_time, events / repetitions
+
+
+def main(args):
+    counts = default_counts
+    mode = "auto"
+    churn = default_churn
+    for option in ("--mode", "--churn"):
+        if option in args:
+            index = args.index(option)
+            value = args[index + 1]
+            args = args[:index] + args[index + 2:]
+            if option == "--mode":
+                mode = value
+            else:
+                churn = int(value)
+    if args:
+        counts = [int(c) for c in args]
+
+    sys_info = SystemInfo()
+    tracker = ProcessEventTracker(sys_info, mode)
+    if tracker.mode == "scan":
+        tracker.close()
+        tracker = None
+    print(f"event source: {tracker.mode if tracker else 'none (scan only)'}, churn: {churn} processes per round")
+
+    children = []
+    try:
+        print("synthetic  total    full rescan    events    changes/round")
+        for count in sorted(counts):
+            # cria apenas os processos que faltam para chegar a `count`
+            while len(children) < count:
+                children.append(subprocess.Popen(["sleep", "600"]))
+            total = len(sys_info.get_process_table())
+            if tracker is not None:
+                tracker.poll()  # descarta os eventos da criacao dos processos sinteticos
+            scan_time, event_time, changes = measure(sys_info, tracker, churn)
+            event_text = f"{event_time * 1000:>6.2f} ms" if event_time is not None else "       -"
+            print(f"{count:>9}  {total:>5}    {scan_time * 1000:>8.2f} ms  {event_text}    {changes:>13.1f}")
+    finally:
+        if tracker is not None:
+            tracker.close()
+        for child in children:
+            child.kill()
+        for child in children:
+            child.wait()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,58 @@
+import subprocess
+import sys
+import time
+from system_info import SystemInfo
+
+# compara a latencia da leitura de processos sequencial e paralela. para cada
+# quantidade de processos sinteticos (filhos "sleep" criados pelo script),
+# mede a mediana de varias leituras da tabela com cada numero de workers
+#
+# uso: python3 benchmark_process_scan.py [processos ...] [--workers 1,2,4,8]
+
+default_counts = [0, 500, 2000, 8000]
+default_workers = [1, 2, 4, 8]
+repetitions = 20
+
+
+def median_scan_time(sys_info, workers):
+    sys_info.set_process_scan_workers(workers)
+    sys_info.get_process_table()  # aquecimento
+    times = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        sys_info.get_process_table()
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def main(args):
+    counts = default_counts
+    workers_list = default_workers
+    if "--workers" in args:
+        index = args.index("--workers")
+        workers_list = [int(w) for w in args[index + 1].split(",")]
+        args = args[:index] + args[index + 2:]
+    if args:
+        counts = [int(c) for c in args]
+
+    sys_info = SystemInfo()
+    children = []
+    try:
+        print("synthetic  total    " + "  ".join(f"{w:>2} worker(s)" for w in workers_list))
+        for count in sorted(counts):
+            # cria apenas os processos que faltam para chegar a `count`
+            while len(children) < count:
+                children.append(subprocess.Popen(["sleep", "600"]))
+            total = len(sys_info.get_process_table())
+            results = [median_scan_time(sys_info, w) * 1000 for w in workers_list]
+            print(f"{count:>9}  {total:>5}    " + "  ".join(f"{r:>9.2f} ms" for r in results))
+    finally:
+        for child in children:
+            child.kill()
+        for child in children:
+            child.wait()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,152 @@
+import threading
+import time
+
+# estatisticas de tempo de um coletor
+class CollectorStats:
+    def __init__(self):
+        self.runs = 0           # execucoes concluidas
+        self.errors = 0         # execucoes que lancaram excecao
+        self.skipped = 0        # ciclos descartados (execucao anterior ainda em andamento)
+        self.last_time = 0.0    # duracao da ultima execucao (s)
+        self.max_time = 0.0
+        self.total_time = 0.0
+        self.last_error = None
+
+    def as_dict(self):
+        return {
+            "runs": self.runs,
+            "errors": self.errors,
+            "skipped": self.skipped,
+            "last_time": self.last_time,
+            "max_time": self.max_time,
+            "avg_time": self.total_time / self.runs if self.runs else 0.0,
+            "last_error": self.last_error,
+        }
+
+
+class Collector:
+    def __init__(self, name, interval, func, callback, group):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self.callback = callback
+        self.group = group
+        self.deadline = 0.0
+        self.in_flight = False
+        self.stats = CollectorStats()
+
+
+# agendador unico das coletas em segundo plano. cada coletor tem o seu
+# intervalo; os prazos sao alinhados a multiplos do intervalo a partir de uma
+# origem comum, entao coletores com intervalos compativeis disparam no mesmo
+# instante, e os do mesmo grupo rodam juntos em uma unica tarefa do executor
+# (compartilhando o instante da amostra). um coletor nunca tem mais de uma
+# execucao em andamento: ciclos que vencem enquanto ele ainda roda sao
+# descartados em vez de acumulados
+class CollectorScheduler:
+    def __init__(self, executor):
+        self.executor = executor
+        self._collectors = {}
+        self._condition = threading.Condition()
+        self._origin = time.monotonic()
+        self._running = False
+        self._thread = None
+
+    # func() coleta os dados e callback(resultado) os entrega (ex.: na fila
+    # de resultados). intervalo em segundos
+    def add(self, name, interval, func, callback, group=None):
+        with self._condition:
+            collector = Collector(name, interval, func, callback, group)
+            collector.deadline = self._next_deadline(interval, time.monotonic())
+            self._collectors[name] = collector
+            self._condition.notify()
+
+    def remove(self, name):
+        with self._condition:
+            self._collectors.pop(name, None)
+
+    def __contains__(self, name):
+        with self._condition:
+            return name in self._collectors
+
+    # antecipa a proxima execucao de um coletor para agora
+    def run_now(self, name):
+        with self._condition:
+            collector = self._collectors.get(name)
+            if collector is not None:
+                collector.deadline = time.monotonic()
+                self._condition.notify()
+
+    def stats(self):
+        with self._condition:
+            return {name: c.stats.as_dict() for name, c in self._collectors.items()}
+
+    def start(self):
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._loop, name="collector-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+
+    # proximo multiplo do intervalo (a partir da origem) depois de `now`
+    def _next_deadline(self, interval, now):
+        periods = int((now - self._origin) / interval) + 1
+        return self._origin + periods * interval
+
+    def _loop(self):
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                now = time.monotonic()
+                due = [c for c in self._collectors.values() if c.deadline <= now]
+                if not due:
+                    next_deadline = min((c.deadline for c in self._collectors.values()), default=now + 1.0)
+                    self._condition.wait(next_deadline - now)
+                    continue
+
+                batches = {}
+                for collector in due:
+                    # pula os ciclos vencidos: o proximo prazo eh sempre no futuro
+                    collector.deadline = self._next_deadline(collector.interval, now)
+                    if collector.in_flight:
+                        collector.stats.skipped += 1
+                        continue
+                    collector.in_flight = True
+                    key = collector.group if collector.group is not None else collector.name
+                    batches.setdefault(key, []).append(collector)
+
+            for batch in batches.values():
+                self.executor.submit(self._run_batch, batch)
+
+    def _run_batch(self, batch):
+        for collector in batch:
+            start = time.perf_counter()
+            error = None
+            try:
+                result = collector.func()
+            except Exception as e:
+                result = None
+                error = str(e)
+            elapsed = time.perf_counter() - start
+
+            with self._condition:
+                stats = collector.stats
+                stats.last_time = elapsed
+                stats.max_time = max(stats.max_time, elapsed)
+                if error is None:
+                    stats.runs += 1
+                    stats.total_time += elapsed
+                else:
+                    stats.errors += 1
+                    stats.last_error = error
+                collector.in_flight = False
+
+            if result is not None:
+                collector.callback(result)
@@ -1,43 +1,96 @@
+import os
+import signal
+import time
 import tkinter as tk
 from tkinter import ttk
 from concurrent.futures import ThreadPoolExecutor
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from system_info import SystemInfo
-import queue
-import threading
+from system_info import SystemInfo, PROCESS_STATES
+from metric_history import MetricHistory
+from render_scheduler import RenderScheduler
+from collector_scheduler import CollectorScheduler
+from result_dispatcher import ResultDispatcher
+from metric_recorder import MetricRecorder, snapshot_columns, snapshot_values
+from disk_usage import DiskUsageAnalyzer, format_size
+from process_events import ProcessEventTracker
 
 cycle_time = 1000  # milissegundos
 cycle_time_graphs = 500  # milissegundos
 cycle_time_processes = 1000  # milissegundos
-cycle_time_files = 1000  # milissegundos
+# com eventos do netlink a lista de processos fica sempre atual; a releitura
+# completa so atualiza os valores (cpu, memoria, I/O) e pode ser mais espacada
+cycle_time_processes_with_events = 3000  # milissegundos
+cycle_time_process_events = 200  # milissegundos
+process_event_mode = "auto"  # "auto", "netlink", "pidfd" ou "scan" (ver ProcessEventTracker)
+cycle_time_files = 1000  # milissegundos (verificacao de mudancas nos diretorios abertos)
 cycle_time_process_detail = 500  # milissegundos
+cycle_time_top_processes = 500  # milissegundos
+top_processes_count = 10  # linhas do painel de processos da janela principal
+# sinais oferecidos na janela de processos (o primeiro eh o padrao)
+process_signal_options = {"SIGKILL": signal.SIGKILL, "SIGTERM": signal.SIGTERM, "SIGINT": signal.SIGINT,
+                          "SIGHUP": signal.SIGHUP, "SIGSTOP": signal.SIGSTOP, "SIGCONT": signal.SIGCONT}
+top_sort_options = {"CPU": "cpu", "Memory": "rss", "Disk I/O": "io", "Threads": "threads"}
+# campos variaveis da janela de detalhes: (aba, campo de ProcessDynamicInfo, rotulo)
+process_detail_fields = (
+    ("basic", "state", "State"),
+    ("basic", "threads", "Threads"),
+    ("basic", "cpuUsage", "CPU %"),
+    ("resources", "vmRSS", "Resident Memory (RAM)"),
+    ("resources", "vmSize", "Virtual Memory"),
+    ("resources", "vmPeak", "Peak Virtual Memory"),
+    ("resources", "rssAnon", "Anonymous Memory"),
+    ("resources", "rssFile", "File-backed Memory"),
+    ("resources", "rssShmem", "Shared Memory"),
+    ("resources", "vmData", "Data"),
+    ("resources", "vmStk", "Stack"),
+    ("resources", "vmExe", "Code (Text)"),
+    ("resources", "vmLib", "Libraries"),
+    ("resources", "vmSwap", "Swap"),
+    ("resources", "voluntarySwitches", "Voluntary Context Switches"),
+    ("resources", "involuntarySwitches", "Involuntary Context Switches"),
+)
 last_selected_process = None
 processes_thread = 5
 last_thread_num = 0
+cpu_average_window = 10  # amostras na media movel do grafico de cpu
+graphs_fps = 10  # maximo de redesenhos dos graficos por segundo
+files_placeholder = "//"  # sufixo do item vazio de diretorios ainda nao carregados
+network_patterns = []  # interfaces do grafico de rede (fnmatch, "!" exclui); vazio = interfaces fisicas
+network_groups = []  # pares (rotulo, padrao fnmatch) somados em uma unica linha, ex.: ("containers", "veth*")
 
 class DashboardApp:
-    def __init__(self, root):
+    # snapshot_reader: SnapshotReader de um coletor (main.py --collector); sem
+    # ele, os snapshots sao coletados neste processo. record_path: diretorio
+    # onde todas as amostras sao gravadas (main.py --record)
+    def __init__(self, root, snapshot_reader=None, record_path=None):
         self.root = root
+        self.snapshot_reader = snapshot_reader
         self.root.title("System Dashboard")
         self.root.geometry("1200x600")
         self.root.resizable(True, True)
         self.root.minsize(800, 600)
         self.heading_click_locked = False 
 
-        self.cpu_usage_history = []
-        self.mem_usage_history = []
-        self.swap_usage_history = []
-        self.disk_read_history = []
-        self.disk_write_history = []
-        self.network_receive_history = []
-        self.network_transmit_history = []
         self.cpu_core_lines = []
         self.max_history_length = 50
 
         self.sys_info = SystemInfo()
-        self.num_cores = len(self.sys_info.get_cpu_usage_per_core())
-        self.cpu_core_usage_histories = [[] for _ in range(self.num_cores)]
+        self.num_cores = self.sys_info.get_core_count()
+        self.sys_info.set_network_patterns(network_patterns)
+
+        self.recorder = None
+        if record_path is not None:
+            self.recorder = MetricRecorder(record_path, snapshot_columns(self.num_cores))
+
+        # historicos circulares: uma linha por core, (memoria, swap) e
+        # (leitura, escrita); a rede tem um historico (download, upload) por
+        # interface ou grupo, criado quando ela aparece
+        self.cpu_core_usage_history = MetricHistory(self.num_cores, self.max_history_length)
+        self.memory_history = MetricHistory(2, self.max_history_length)
+        self.disk_history = MetricHistory(2, self.max_history_length)
+        self.network_histories = {}
+        self.network_lines = {}
 
         self.label_vars = {}
         self.labels = {}
@@ -54,43 +107,47 @@ class DashboardApp:
         # com threads para N campos + thread para processos 
         self.executor = ThreadPoolExecutor(max_workers=len(self.sys_info.fields) + processes_thread)
 
-        self.result_queue = queue.Queue()
+        # resultados das threads de trabalho sao publicados por topico e
+        # entregues em lote na thread da interface
+        self.dispatcher = ResultDispatcher(self.root)
+        self.subscribe_main_topics()
+
+        # todas as coletas periodicas passam por um unico agendador, que
+        # submete as tarefas ao executor nos intervalos de cada coletor
+        self.scheduler = CollectorScheduler(self.executor)
 
         self.setup_widgets()
 
         self.process_window = None
+        self.process_events = None  # ProcessEventTracker enquanto a janela de processos estiver aberta
         self.files_window = None
 
-        self.initialize_cpu_core_histories()
-        self.initialize_memory_histories()
-        self.initialize_network_histories()
-        self.initialize_disk_histories()
-        self.process_queue()
+        self.initialize_histories()
+        self.scheduler.start()
         
         self.files_history = []
         self.files_history_index = -1
+        # o cache do analisador de disco sobrevive ao fechamento da janela
+        self.disk_usage = DiskUsageAnalyzer(self.sys_info)
+        self.disk_usage_generation = 0
 
     #funcoes de inicializacao de historicos dos graficos
-    def initialize_cpu_core_histories(self):
-        core_usages = self.sys_info.get_cpu_usage_per_core()
-        for core_index, usage in enumerate(core_usages):
-            # inicializa o historico de uso de cada nucleo com zeros
-            self.cpu_core_usage_histories[core_index] = [0] * self.max_history_length
-    def initialize_memory_histories(self):
-        mem_usage = self.sys_info.get_memory_usage()
-        swap_usage = self.sys_info.get_swap_usage()
-        self.mem_usage_history = [mem_usage] * self.max_history_length
-        self.swap_usage_history = [swap_usage] * self.max_history_length
-    def initialize_network_histories(self):
-        receive_rate = self.sys_info.get_network_receive_rate()
-        transmit_rate = self.sys_info.get_network_transmit_rate()
-        self.network_receive_history = [receive_rate] * self.max_history_length
-        self.network_transmit_history = [transmit_rate] * self.max_history_length
-    def initialize_disk_histories(self):
-        disk_read = self.sys_info.get_disk_read()
-        disk_write = self.sys_info.get_disk_write()
-        self.disk_read_history = [disk_read] * self.max_history_length
-        self.disk_write_history = [disk_write] * self.max_history_length
+    def initialize_histories(self):
+        if self.snapshot_reader is not None:
+            # conectado a um coletor: o historico recente ja esta publicado
+            history = self.snapshot_reader.history(self.max_history_length)
+            if history:
+                self.fill_histories(history[0])
+                self.on_snapshots(history)
+                self.on_network_rates(self.snapshot_network_rates(history))
+                return
+        self.fill_histories(self.sys_info.snapshot())
+
+    def fill_histories(self, snapshot):
+        # o historico de uso de cada nucleo comeca com zeros
+        self.cpu_core_usage_history.fill(0)
+        self.memory_history.fill([snapshot.memoryUsage, snapshot.swapUsage])
+        self.disk_history.fill([snapshot.diskRead, snapshot.diskWrite])
 
     def setup_widgets(self): 
         # configuracao principal da grade
@@ -113,8 +170,18 @@ class DashboardApp:
             label = tk.Label(frame, textvariable=self.label_vars[field], font=("Arial", 12), anchor="center", bg="white")
             label.pack(fill="x", padx=5)
             self.labels[field] = label
-            # agendar atualizacoes
-            self.update_field(field)
+            # campos imutaveis sao lidos uma unica vez; os do snapshot sao
+            # atualizados pelo coletor do snapshot e os demais tem o seu proprio
+            if field in self.sys_info.static_fields:
+                self.label_vars[field].set(f"{field}:\n{self.sys_info.get_info(field)}")
+            elif field not in self.sys_info.snapshot_fields:
+                self.add_field_collector(field)
+
+        row = len(self.sys_info.fields)
+        if self.snapshot_reader is not None:
+            self.setup_collector_status(info_frame, row)
+            row += 1
+        self.setup_top_panel(info_frame, row=row)
 
         # botao para mostrar processos
         self.process_button = tk.Button(self.root, text="Show Processes", command=self.show_processes)
@@ -132,6 +199,95 @@ class DashboardApp:
 
         self.setup_graphs()
 
+    # estado do coletor no modo --attach: sem ele os graficos param, entao o
+    # motivo fica visivel. o leitor reanexa sozinho quando o coletor volta
+    def setup_collector_status(self, parent, row):
+        frame = tk.Frame(parent, bg="white", padx=10, pady=5)
+        frame.grid(row=row, column=0, sticky="ew", pady=3)
+        self.collector_status_var = tk.StringVar()
+        self.collector_status_label = tk.Label(frame, textvariable=self.collector_status_var, font=("Arial", 12),
+                                               anchor="center", bg="white")
+        self.collector_status_label.pack(fill="x", padx=5)
+        self.collector_status = None
+
+        reader = self.snapshot_reader
+        self.dispatcher.subscribe('collector_status', self.on_collector_status, latest_only=True)
+        self.scheduler.add(
+            "collector_status", cycle_time / 1000, lambda: (reader.connected, reader.pid),
+            lambda status: self.dispatcher.publish('collector_status', status), group="system")
+
+    def on_collector_status(self, status):
+        if status == self.collector_status:
+            return
+        self.collector_status = status
+        connected, pid = status
+        if connected:
+            self.collector_status_var.set(f"Collector: running (pid {pid})")
+            self.collector_status_label.config(fg="black")
+        else:
+            self.collector_status_var.set("Collector not running: waiting for it to restart")
+            self.collector_status_label.config(fg="red")
+
+    # painel com os processos que mais usam o recurso escolhido. a biblioteca
+    # seleciona e ordena as linhas (get_top_processes) sobre a ultima leitura
+    # completa de /proc, refeita no maximo a cada 2 s, entao o custo na
+    # interface eh o de atualizar poucas linhas, qualquer que seja o numero
+    # de processos. conectado a um coletor (--attach) o painel nao eh criado:
+    # o coletor nao publica processos e a leitura local de /proc eh o que o
+    # modo attach evita
+    def setup_top_panel(self, parent, row):
+        frame = tk.Frame(parent, bg="white", padx=10, pady=5)
+        frame.grid(row=row, column=0, sticky="ew", pady=3)
+        if self.snapshot_reader is not None:
+            tk.Label(frame, text="Top Processes: not available when attached to a collector",
+                     font=("Arial", 10), bg="white").pack(side=tk.LEFT)
+            return
+
+        header = tk.Frame(frame, bg="white")
+        header.pack(fill="x")
+        tk.Label(header, text="Top Processes by", font=("Arial", 12), bg="white").pack(side=tk.LEFT)
+        self.top_sort_key = "cpu"
+        self.top_sort_var = tk.StringVar(value="CPU")
+        sort_box = ttk.Combobox(header, textvariable=self.top_sort_var, values=list(top_sort_options),
+                                state="readonly", width=10)
+        sort_box.pack(side=tk.LEFT, padx=5)
+        sort_box.bind("<<ComboboxSelected>>", self.on_top_sort_changed)
+
+        columns = ("PID", "Name", "CPU %", "Memory", "Disk I/O")
+        column_widths = {"PID": 60, "Name": 140, "CPU %": 60, "Memory": 80, "Disk I/O": 80}
+        self.top_treeview = ttk.Treeview(frame, columns=columns, show="headings", height=top_processes_count)
+        for col in columns:
+            self.top_treeview.heading(col, text=col)
+            self.top_treeview.column(col, anchor='center', width=column_widths[col])
+        self.top_treeview.pack(fill="x", pady=(5, 0))
+
+        # fora do grupo "system": quando a leitura de /proc eh refeita, uma
+        # tabela grande nao pode atrasar os snapshots dos graficos
+        self.dispatcher.subscribe('top_processes', self.on_top_processes, latest_only=True)
+        self.scheduler.add(
+            "top_processes", cycle_time_top_processes / 1000,
+            lambda: self.sys_info.get_top_processes(self.top_sort_key, top_processes_count),
+            lambda table: self.dispatcher.publish('top_processes', table))
+
+    def on_top_sort_changed(self, event=None):
+        # a chave fica em um atributo comum: a coleta roda fora da thread do tk
+        self.top_sort_key = top_sort_options[self.top_sort_var.get()]
+        self.scheduler.run_now("top_processes")
+
+    # as linhas do painel sao posicoes (0..n-1) e so tem os valores trocados
+    def on_top_processes(self, table):
+        tree = self.top_treeview
+        rows = table.rows()
+        for index, (pid, _, name, _, _, _, _, rss, cpu, read_rate, write_rate) in enumerate(rows):
+            values = (pid, name, f"{cpu:.1f}", format_size(rss * 1024), f"{format_size(read_rate + write_rate)}/s")
+            if tree.exists(str(index)):
+                tree.item(str(index), values=values)
+            else:
+                tree.insert('', 'end', iid=str(index), values=values)
+        extra = [str(index) for index in range(len(rows), top_processes_count) if tree.exists(str(index))]
+        if extra:
+            tree.delete(*extra)
+
     def setup_graphs(self):
         # criar figura para graficos
         self.fig, ((self.cpu_ax, self.mem_ax), (self.net_ax, self.disk_ax)) = plt.subplots(2, 2, figsize=(12, 8))
@@ -144,13 +300,11 @@ class DashboardApp:
         # inicializar objetos de linha
         self.mem_line, = self.mem_ax.plot([], [], color="salmon", label="Memory Usage")
         self.swap_line, = self.mem_ax.plot([], [], color="blue", label="Swap Usage")
-        self.net_receive_line, = self.net_ax.plot([], [], color="lightgreen", label="Download")
-        self.net_transmit_line, = self.net_ax.plot([], [], color="orange", label="Upload")
         self.disk_read_line, = self.disk_ax.plot([], [], color="purple", label="Disk Read")
         self.disk_write_line, = self.disk_ax.plot([], [], color="red", label="Disk Write")
 
         self.cpu_ax.set_ylim(0, 100)
-        self.cpu_ax.set_title("CPU Usage (MHz)")
+        self.cpu_ax.set_title("CPU Usage (%)")
         self.cpu_ax.set_xticks([])
 
         self.mem_ax.set_ylim(0, 100)
@@ -160,7 +314,6 @@ class DashboardApp:
 
         self.net_ax.set_title("Network Usage (KB/s)")
         self.net_ax.set_xticks([])
-        self.net_ax.legend()
 
         self.disk_ax.set_title("Disk Usage (MB/s)")
         self.disk_ax.set_ylim(0, 100)
@@ -173,162 +326,164 @@ class DashboardApp:
 
         self.cpu_ax.legend()
 
-        # agenda as atualizacoes dos graficos
-        self.root.after(cycle_time, self.update_cpu_graph)
-        self.root.after(cycle_time, self.update_memory_graph)
-        self.root.after(cycle_time, self.update_network_graph)
-        self.root.after(cycle_time, self.update_disk_graph)
-        
-
-    # para cada campo uma tarefa eh submetida 
-    # ao executor para obter informacoes do sistema periodicamente
-    def update_field(self, field):
-        def worker():
-            value = self.sys_info.get_info(field) # coleta de dados 
-            self.result_queue.put(('field', field, value)) # coloca o resultado na fila
-        self.executor.submit(worker) # submete a tarefa ao executor
-        self.root.after(cycle_time, self.update_field, field)
-
-    # a funcao process_queue eh chamada periodicamente para processar itens na 
-    # fila de resultados (result_queue)
+        # o eixo x eh fixo; os limites so mudam aqui para evitar redesenhos completos
+        for ax in (self.cpu_ax, self.mem_ax, self.net_ax, self.disk_ax):
+            ax.set_xlim(0, self.max_history_length)
+
+        # redesenho agrupado e limitado por quadro, com blitting das linhas
+        self.render_scheduler = RenderScheduler(self.root, self.canvas, fps=graphs_fps)
+        self.render_scheduler.register(self.cpu_ax, self.cpu_core_lines)
+        self.render_scheduler.register(self.mem_ax, [self.mem_line, self.swap_line])
+        # as linhas de rede sao registradas conforme as interfaces aparecem
+        self.render_scheduler.register(self.net_ax, [])
+        self.render_scheduler.register(self.disk_ax, [self.disk_read_line, self.disk_write_line])
+
+        # uma unica coleta (snapshot) por ciclo alimenta todos os graficos e
+        # os campos dinamicos
+        self.scheduler.add(
+            "snapshot", cycle_time_graphs / 1000, self.collect_snapshots,
+            self.publish_snapshots, group="system")
+
+    # snapshots novos: lidos da memoria compartilhada do coletor, sem acessar
+    # /proc, ou coletados localmente. junto vem as taxas de rede de cada
+    # snapshot ({interface ou grupo: (download, upload)})
+    def collect_snapshots(self):
+        if self.snapshot_reader is not None:
+            snapshots = self.snapshot_reader.read_new()
+            if not snapshots:
+                return None
+            network = self.snapshot_network_rates(snapshots)
+        else:
+            snapshots = [self.sys_info.snapshot()]
+            # o snapshot acabou de ler /proc/net/dev: esta chamada reutiliza a mesma leitura
+            network = [self.sys_info.get_network_stats().rates(network_groups)]
+        if self.recorder is not None:
+            # apenas enfileira; a gravacao em disco eh feita em lote pelo gravador
+            for snapshot in snapshots:
+                self.recorder.append(snapshot_values(snapshot, self.num_cores))
+        return snapshots, network
+
+    # o coletor publica apenas os totais de rede
+    @staticmethod
+    def snapshot_network_rates(snapshots):
+        return [{"total": (snapshot.networkReceiveRate, snapshot.networkTransmitRate)} for snapshot in snapshots]
+
+    def publish_snapshots(self, result):
+        snapshots, network = result
+        for snapshot in snapshots:
+            self.dispatcher.publish('snapshot', snapshot)
+        for rates in network:
+            self.dispatcher.publish('network', rates)
+
+    # para cada campo fora do snapshot um coletor eh registrado no agendador;
+    # como os prazos sao alinhados, ele roda junto com o snapshot (grupo "system")
+    def add_field_collector(self, field):
+        self.scheduler.add(
+            f"field:{field}", cycle_time / 1000, lambda: self.sys_info.get_info(field),
+            lambda value: self.dispatcher.publish('field', (field, value)), group="system")
+
+    # topicos tratados pela janela principal. os resultados publicados pelas
+    # threads de trabalho chegam aqui na thread principal, sem polling:
     # - comunicacao segura entre threads de trabalho e a thread principal
-    # - atualizacao eficiente da interface grafica sem bloquear a thread principal
-    # - sincronizacao das operacoes realizadas pelas threads de trabalho com a
-    #   thread principal
-    def process_queue(self):
-        # processa itens na fila de resultados
-        while not self.result_queue.empty():
-            item = self.result_queue.get()
-            if item[0] == 'update_processes':
-                # atualiza a lista de processos
-                self.update_processes()
-            elif item[0] == 'kill_process_error':
-                # exibe mensagem de erro caso falhe ao matar um processo
-                error_message = item[1]
-                tk.messagebox.showerror("Error", f"Unexpected error: {error_message}")
-            elif item[0] == 'field':
-                # atualiza campos de texto na interface
-                field, value = item[1], item[2]
-                self.label_vars[field].set(f"{field}:\n{value}")
-            elif item[0] == 'cpu':
-                # atualiza graficos de uso da CPU
-                core_usages = item[1]
-                for core_index, usage in enumerate(core_usages):
-                    self.cpu_core_usage_histories[core_index].append(usage)
-                    if len(self.cpu_core_usage_histories[core_index]) > self.max_history_length:
-                        self.cpu_core_usage_histories[core_index].pop(0)
-                self.refresh_cpu_graph()
-            elif item[0] == 'memory':
-                # atualiza graficos de memoria e swap
-                mem_usage, swap_usage = item[1], item[2]
-                self.mem_usage_history.append(mem_usage)
-                self.swap_usage_history.append(swap_usage)
-                if len(self.mem_usage_history) > self.max_history_length:
-                    self.mem_usage_history.pop(0)
-                if len(self.swap_usage_history) > self.max_history_length:
-                    self.swap_usage_history.pop(0)
-                self.refresh_memory_graph()
-            elif item[0] == 'network':
-                # atualiza graficos de rede
-                receive_rate, transmit_rate = item[1], item[2]
-                self.network_receive_history.append(receive_rate)
-                self.network_transmit_history.append(transmit_rate)
-                if len(self.network_receive_history) > self.max_history_length:
-                    self.network_receive_history.pop(0)
-                if len(self.network_transmit_history) > self.max_history_length:
-                    self.network_transmit_history.pop(0)
-                self.refresh_network_graph()
-            elif item[0] == 'disk':
-                # atualiza graficos de disco
-                disk_read, disk_write = item[1], item[2]
-                self.disk_read_history.append(disk_read)
-                self.disk_write_history.append(disk_write)
-                if len(self.disk_read_history) > self.max_history_length:
-                    self.disk_read_history.pop(0)
-                if len(self.disk_write_history) > self.max_history_length:
-                    self.disk_write_history.pop(0)
-                self.refresh_disk_graph()
-            elif item[0] == 'processes_update':
-                # atualiza a arvore de processos na interface
-                processes = item[1]
-                self.refresh_process_tree(processes)
-            elif item[0] == 'files_update':
-                # atualiza a arvore de arquivos na interface
-                files = item[1]
-                self.refresh_files_tree(files)                
-        self.root.after(100, self.process_queue)
-
-    # funcoes que submetem tarefas de coletar informacoes ao executor para 
-    # obter dados e coloca-los na fila de resultados.
-    def update_cpu_graph(self):
-        def worker():
-            core_usages = self.sys_info.get_cpu_usage_per_core()  # coleta de dados 
-            self.result_queue.put(('cpu', core_usages))  # coloca o resultado na fila
-        self.executor.submit(worker) # submete a tarefa ao executor
-        self.root.after(cycle_time_graphs, self.update_cpu_graph)
+    # - a interface so eh acordada quando ha dados novos
+    # - tudo o que chegou ate o loop do tk acordar eh tratado em um unico lote
+    def subscribe_main_topics(self):
+        self.dispatcher.subscribe('update_processes', lambda _: self.scheduler.run_now("processes"), latest_only=True)
+        self.dispatcher.subscribe('kill_process_error', self.on_kill_process_error)
+        self.dispatcher.subscribe('field', self.on_field_update)
+        self.dispatcher.subscribe('snapshot', self.on_snapshots, batch=True)
+        self.dispatcher.subscribe('network', self.on_network_rates, batch=True)
+
+    def on_kill_process_error(self, error_message):
+        # exibe mensagem de erro caso falhe ao matar um processo
+        tk.messagebox.showerror("Error", f"Unexpected error: {error_message}")
+
+    def on_field_update(self, item):
+        # atualiza campos de texto na interface
+        field, value = item
+        self.label_vars[field].set(f"{field}:\n{value}")
+
+    # atualiza campos e graficos a partir dos snapshots do lote: todas as
+    # amostras entram nos historicos, mas os rotulos e graficos sao
+    # atualizados uma unica vez
+    def on_snapshots(self, snapshots):
+        for snapshot in snapshots:
+            self.cpu_core_usage_history.append(snapshot.core_values())
+            self.memory_history.append([snapshot.memoryUsage, snapshot.swapUsage])
+            self.disk_history.append([snapshot.diskRead, snapshot.diskWrite])
+        snapshot = snapshots[-1]
+        for field in self.sys_info.snapshot_fields:
+            value = self.sys_info.format_snapshot_field(field, snapshot)
+            self.label_vars[field].set(f"{field}:\n{value}")
+        self.refresh_cpu_graph()
+        self.refresh_memory_graph()
+        self.refresh_disk_graph()
+
     def refresh_cpu_graph(self):
-        xdata = range(len(self.cpu_core_usage_histories[0]))
+        xdata = self.cpu_core_usage_history.xdata
+        # media movel das ultimas amostras de cada core (vetorizada)
+        avg_ydata = self.cpu_core_usage_history.rolling_mean(cpu_average_window)
         for core_index, line in enumerate(self.cpu_core_lines):
-            ydata = self.cpu_core_usage_histories[core_index]
-            # calcular a media usando os ultimos 10 valores
-            avg_ydata = [sum(ydata[max(0, i - 9):i + 1]) / min(10, i + 1) for i in range(len(ydata))]            
-            line.set_data(xdata[-len(avg_ydata):], avg_ydata)
-        self.cpu_ax.set_xlim(0, self.max_history_length)
-        self.cpu_ax.set_ylim(0, max(max(core_data) for core_data in self.cpu_core_usage_histories) * 1.1)
-        self.canvas.draw_idle()
+            line.set_data(xdata, avg_ydata[core_index])
+        self.render_scheduler.mark_dirty(self.cpu_ax)
  
-    # funcoes de atualizacao e refresh dos graficos de memoria
-    def update_memory_graph(self):
-        def worker():
-            mem_usage = self.sys_info.get_memory_usage() # coleta de dados
-            swap_usage = self.sys_info.get_swap_usage() # coleta de dados
-            self.result_queue.put(('memory', mem_usage, swap_usage)) # coloca o resultado na fila
-        self.executor.submit(worker) # submete a tarefa ao executor
-        self.root.after(cycle_time_graphs, self.update_memory_graph)
+    # funcoes de refresh dos graficos de memoria
     def refresh_memory_graph(self):
-        xdata = range(len(self.mem_usage_history))
-        self.mem_line.set_data(xdata, self.mem_usage_history)
-        self.swap_line.set_data(xdata, self.swap_usage_history)
-        self.mem_ax.set_xlim(0, self.max_history_length)
-        self.canvas.draw_idle()
+        xdata = self.memory_history.xdata
+        self.mem_line.set_data(xdata, self.memory_history.row(0))
+        self.swap_line.set_data(xdata, self.memory_history.row(1))
+        self.render_scheduler.mark_dirty(self.mem_ax)
  
-    # funcoes de atualizacao e refresh dos graficos de rede
-    def update_network_graph(self):
-        def worker():
-            receive_rate = self.sys_info.get_network_receive_rate() # coleta de dados
-            transmit_rate = self.sys_info.get_network_transmit_rate() # coleta de dados
-            self.result_queue.put(('network', receive_rate, transmit_rate)) # coloca o resultado na fila
-        self.executor.submit(worker) # submete a tarefa ao executor
-        self.root.after(cycle_time_graphs, self.update_network_graph)
+    # taxas de rede do lote: uma amostra por snapshot. interfaces que
+    # aparecem ganham linhas; as que somem ficam com taxa zero
+    def on_network_rates(self, samples):
+        for rates in samples:
+            for label in sorted(rates.keys() - self.network_histories.keys()):
+                self.add_network_line(label)
+            for label, history in self.network_histories.items():
+                history.append(rates.get(label, (0.0, 0.0)))
+        self.refresh_network_graph()
+
+    # download (linha cheia) e upload (tracejada) de uma interface, na mesma cor
+    def add_network_line(self, label):
+        self.network_histories[label] = MetricHistory(2, self.max_history_length)
+        color = f"C{len(self.network_lines) % 10}"
+        receive_line, = self.net_ax.plot([], [], color=color, label=f"{label} Download")
+        transmit_line, = self.net_ax.plot([], [], color=color, linestyle="--", label=f"{label} Upload")
+        self.network_lines[label] = (receive_line, transmit_line)
+        self.net_ax.legend(loc="upper left", fontsize="small")
+        # registrar forca um redesenho completo, que inclui a nova legenda
+        self.render_scheduler.register(self.net_ax, [receive_line, transmit_line])
+
+    # funcoes de refresh dos graficos de rede
     def refresh_network_graph(self):
-        xdata = range(len(self.network_receive_history))
-        self.net_receive_line.set_data(xdata, self.network_receive_history)
-        self.net_transmit_line.set_data(xdata, self.network_transmit_history)
-        self.net_ax.set_xlim(0, self.max_history_length)
-        max_rate = max(max(self.network_receive_history), max(self.network_transmit_history)) * 1.1
-        if max_rate == 0:
-            max_rate = 1  # definir um limite minimo para y
-        self.net_ax.set_ylim(0, max_rate)
-        self.canvas.draw_idle()
+        if not self.network_histories:
+            return
+        for label, history in self.network_histories.items():
+            receive_line, transmit_line = self.network_lines[label]
+            receive_line.set_data(history.xdata, history.row(0))
+            transmit_line.set_data(history.xdata, history.row(1))
+        max_value = max(history.max() for history in self.network_histories.values())
+        rescaled = self.update_ylim(self.net_ax, max_value)
+        self.render_scheduler.mark_dirty(self.net_ax, full_redraw=rescaled)
  
-    # funcoes de atualizacao e refresh do grafico de disco
-    def update_disk_graph(self):
-        def worker():
-            disk_read = self.sys_info.get_disk_read() # coleta de dados
-            disk_write = self.sys_info.get_disk_write() # coleta de dados
-            self.result_queue.put(('disk', disk_read, disk_write)) # coloca o resultado na fila
-        self.executor.submit(worker) # submete a tarefa ao executor
-        self.root.after(cycle_time_graphs, self.update_disk_graph)
+    # funcoes de refresh do grafico de disco
     def refresh_disk_graph(self):
-        xdata = range(len(self.disk_read_history))
-        self.disk_read_line.set_data(xdata, self.disk_read_history)
-        self.disk_write_line.set_data(xdata, self.disk_write_history)
-        self.disk_ax.set_xlim(0, self.max_history_length)
-        max_disk_usage = max(max(self.disk_read_history), max(self.disk_write_history)) * 1.1
-        if max_disk_usage == 0:
-            max_disk_usage = 1  # limite minimo para y
-        self.disk_ax.set_ylim(0, max_disk_usage + 1e-9)  
-        self.canvas.draw_idle()
+        xdata = self.disk_history.xdata
+        self.disk_read_line.set_data(xdata, self.disk_history.row(0))
+        self.disk_write_line.set_data(xdata, self.disk_history.row(1))
+        rescaled = self.update_ylim(self.disk_ax, self.disk_history.max())
+        self.render_scheduler.mark_dirty(self.disk_ax, full_redraw=rescaled)
+
+    # ajusta o limite y apenas quando o maximo sai da faixa atual (acima do
+    # limite ou abaixo da metade dele), ja que cada mudanca exige redesenho completo
+    def update_ylim(self, ax, max_value):
+        top = ax.get_ylim()[1]
+        target = max(max_value * 1.1, 1)  # limite minimo para y
+        if target > top or target < top / 2:
+            ax.set_ylim(0, target)
+            return True
+        return False
 
     def unlock_heading_click(self):
         self.heading_click_locked = False
@@ -340,7 +495,7 @@ class DashboardApp:
 
         self.process_window = tk.Toplevel(self.root)
         self.process_window.title("Process Tree")
-        self.process_window.geometry("800x400")
+        self.process_window.geometry("1000x400")
         self.process_window.resizable(True, True)
 
         self.process_window.protocol("WM_DELETE_WINDOW", self.close_process_window)
@@ -349,9 +504,15 @@ class DashboardApp:
         process_tree_frame = ttk.Frame(self.process_window)
         process_tree_frame.pack(fill='both', expand=True)
 
-        columns = ("PID", "PPID", "Name", "Uid", "State", "Threads", "Physical Memory", "Virtual Memory")
-        self.process_treeview = ttk.Treeview(process_tree_frame, columns=columns, show="tree headings")
+        columns = ("PID", "PPID", "Name", "Uid", "State", "Threads", "CPU %", "Disk Read", "Disk Write",
+                   "Physical Memory", "Virtual Memory")
+        self.process_treeview = ttk.Treeview(process_tree_frame, columns=columns, show="tree headings",
+                                             selectmode="extended")
+        self.process_columns = columns
+        # modelo da arvore: pid -> linha exibida (ver refresh_process_tree)
+        self.process_rows = {}
         column_widths = {"PID": 60, "PPID": 60, "Name": 200, "Uid": 100, "State": 80, "Threads": 60,
+                        "CPU %": 60, "Disk Read": 90, "Disk Write": 90,
                         "Physical Memory": 100, "Virtual Memory": 100}
         for col in columns:
             self.process_treeview.heading(col, text=col, 
@@ -381,10 +542,20 @@ class DashboardApp:
         self.show_details_button.pack(side=tk.LEFT, padx=5)
         self.show_details_button.config(state=tk.DISABLED)
 
-        # botao para matar processo
-        self.kill_button = tk.Button(button_frame, text="Kill Process", command=self.kill_selected_process)
+        # sinal enviado aos processos selecionados (varios com ctrl/shift) e,
+        # opcionalmente, a todos os seus descendentes
+        self.signal_var = tk.StringVar(value=next(iter(process_signal_options)))
+        ttk.Combobox(button_frame, textvariable=self.signal_var, values=list(process_signal_options),
+                     state="readonly", width=9).pack(side=tk.LEFT, padx=5)
+        self.signal_descendants_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(button_frame, text="Include descendants",
+                       variable=self.signal_descendants_var).pack(side=tk.LEFT, padx=5)
+
+        # botao para enviar o sinal
+        self.kill_button = tk.Button(button_frame, text="Send Signal", command=self.kill_selected_process)
         self.kill_button.pack(side=tk.LEFT, padx=5)
         self.kill_button.config(state=tk.DISABLED)
+        self.dispatcher.subscribe('signal_results', self.on_signal_results, owner=self.process_window)
 
         self.process_treeview.bind("<<TreeviewSelect>>", self.handle_treeview_selection)
 
@@ -427,31 +598,56 @@ class DashboardApp:
             self.display_process_details(pid)
 
     def kill_selected_process(self):
-        # mata o processo selecionado apos confirmacao do usuario
+        # envia o sinal escolhido aos processos selecionados apos uma unica
+        # confirmacao; o envio (e a resolucao dos descendentes) fica fora
+        # da thread do tk e os resultados chegam pelo topico signal_results
         tree = self.process_treeview
-        selected_item = tree.selection()
-        if selected_item:
-            pid = tree.item(selected_item[0], 'values')[0]
+        selected_items = tree.selection()
+        if selected_items:
+            pids = [int(item) for item in selected_items]  # o id de cada item eh o pid
+            signal_name = self.signal_var.get()
+            descendants = self.signal_descendants_var.get()
             def on_response(confirmed):
                 if confirmed:
-                    try:
-                        pid_int = int(pid)
-                        result = self.sys_info.kill_process(pid_int)
-                        if result == 0:
-                            # atualiza processos apos matar o processo
-                            self.update_processes()
-                    except ValueError:
-                        tk.messagebox.showerror("Error", "Invalid PID")
+                    self.executor.submit(self.send_signal, pids, signal_name, descendants)
                 else:
-                    tk.messagebox.showinfo("Process Not Terminated", f"Process {pid} was not terminated.")
+                    tk.messagebox.showinfo("Signal Not Sent", f"{signal_name} was not sent.")
+            target = f"process {pids[0]}" if len(pids) == 1 else f"{len(pids)} selected processes"
             self.custom_message_box(
-                title="Confirm Termination",
-                message="Are you sure you want to kill the selected process?",
+                title="Confirm Signal",
+                message=f"Send {signal_name} to {target}{' and all descendants' if descendants else ''}?",
                 callback=on_response,
             )
         else:
             tk.messagebox.showerror("Error", "No process selected")
 
+    def send_signal(self, pids, signal_name, descendants):
+        try:
+            results, complete = self.sys_info.signal_processes(pids, process_signal_options[signal_name],
+                                                                descendants)
+        except Exception as e:
+            self.dispatcher.publish('kill_process_error', str(e))
+            return
+        self.dispatcher.publish('signal_results', (signal_name, results, complete))
+
+    # mostra apenas as falhas (um processo por linha, ate um limite) e o
+    # aviso de arvore incompleta, e antecipa a releitura da tabela
+    def on_signal_results(self, item):
+        signal_name, results, complete = item
+        self.scheduler.run_now("processes")
+        failed = [(pid, error) for pid, error in results if error != 0]
+        if failed:
+            lines = [f"{pid}: {os.strerror(error)}" for pid, error in failed[:20]]
+            if len(failed) > 20:
+                lines.append(f"... and {len(failed) - 20} more")
+            tk.messagebox.showerror(
+                "Error", f"{signal_name} failed for {len(failed)} of {len(results)} processes:\n" + "\n".join(lines))
+        if not complete:
+            tk.messagebox.showwarning(
+                "Incomplete", f"The process tree kept growing and could not be fully frozen; {signal_name} was sent "
+                              f"to {len(results)} processes, but descendants created at the end may have escaped. "
+                              f"Send the signal again to catch them.")
+
     def custom_message_box(self, title, message, callback):
         def on_yes():
             callback(True)
@@ -503,113 +699,174 @@ class DashboardApp:
 
     def close_process_window(self):
         self.process_window_running = False
+        self.scheduler.remove("processes")
+        self.scheduler.remove("process_events")
+        if self.process_events is not None:
+            self.executor.submit(self.process_events.close)
+            self.process_events = None
         self.process_window.destroy()
 
-    # cria uma nova thread para obter informacoes dos processos 
-    # e coloca os resultados na fila de resultados.
+    # registra o coletor da tabela de processos enquanto a janela estiver
+    # aberta; a janela assina o topico e so trata a tabela mais recente
     def update_processes(self):
         if not self.process_window_running:
             return
 
-        def worker():
-            processes_info = self.sys_info.get_processes_info() # coleta de dados
-            self.result_queue.put(('processes_update', processes_info)) # coloca o resultado na fila
-
-        if self.process_window_running:
-            threading.Thread(target=worker).start()
-            self.root.after(cycle_time_processes, self.update_processes)
-
+        self.dispatcher.subscribe('processes_update', self.refresh_process_tree,
+                                  owner=self.process_window, latest_only=True)
+        self.dispatcher.subscribe('process_events', self.on_process_events, owner=self.process_window)
+        self.scheduler.add(
+            "processes", cycle_time_processes / 1000, self.collect_process_table,
+            lambda process_table: self.dispatcher.publish('processes_update', process_table))
+        self.scheduler.run_now("processes")
+        # a assinatura do netlink espera a confirmacao do kernel; fica fora da thread do tk
+        self.executor.submit(self.start_process_events, self.process_window)
+
+    def collect_process_table(self):
+        process_table = self.sys_info.get_process_table()
+        tracker = self.process_events
+        if tracker is not None:
+            tracker.on_full_scan(process_table)
+        return process_table
+
+    # inicia a fonte de eventos de processos. com eventos, inicios e saidas
+    # chegam a arvore em ate cycle_time_process_events, sem reler /proc
+    # inteiro; sem eles (modo scan) so a releitura periodica continua
+    def start_process_events(self, window):
+        tracker = ProcessEventTracker(self.sys_info, process_event_mode)
+        if not self.process_window_running or window is not self.process_window or tracker.mode == "scan":
+            tracker.close()
+            return
+        self.process_events = tracker
+        self.scheduler.add(
+            "process_events", cycle_time_process_events / 1000, tracker.poll,
+            lambda item: self.dispatcher.publish('process_events', item))
+        if tracker.mode == "netlink":
+            self.scheduler.add(
+                "processes", cycle_time_processes_with_events / 1000, self.collect_process_table,
+                lambda process_table: self.dispatcher.publish('processes_update', process_table))
+        else:
+            self.scheduler.run_now("processes")  # passa a observar os pids atuais
 
-    def refresh_process_tree(self, processes):
+    # aplica os inicios e saidas avisados pela fonte de eventos ao modelo da
+    # arvore; se eventos foram perdidos, antecipa a releitura completa
+    def on_process_events(self, item):
         if not hasattr(self, 'process_treeview') or not self.process_treeview.winfo_exists():
             return
+        kind, payload = item
+        if kind == 'resync':
+            self.scheduler.run_now("processes")
+            return
+        process_table, removed = payload
+        removed = {str(pid) for pid in removed}
+        # copias: apply_process_rows compara com as linhas do modelo atual
+        rows = {pid: dict(row) for pid, row in self.process_rows.items() if pid not in removed}
+        rows.update(self.process_table_rows(process_table))
+        self.apply_process_rows(rows)
+
+
+    # atualiza a arvore de processos de forma incremental: o novo conjunto de
+    # processos eh comparado com o anterior (indexado por pid, que tambem eh o
+    # id do item na arvore) e apenas as linhas novas, removidas, com pai
+    # diferente ou com valores alterados sao tocadas. expansao, selecao e
+    # rolagem sao mantidas pela propria arvore, ja que os itens nao sao recriados
+    def refresh_process_tree(self, process_table):
+        if not hasattr(self, 'process_treeview') or not self.process_treeview.winfo_exists():
+            return
+        self.apply_process_rows(self.process_table_rows(process_table))
+
+    # linhas do modelo indexadas por pid a partir da tabela binaria; 'keys'
+    # guarda os valores numericos usados na ordenacao
+    def process_table_rows(self, process_table):
+        rows = {}
+        for pid, ppid, name, user, state, threads, vsize, rss, cpu, read_rate, write_rate in process_table.rows():
+            state_name = PROCESS_STATES.get(state, state)
+            rows[str(pid)] = {
+                'ppid': str(ppid),
+                'text': name,
+                'keys': (pid, ppid, name.lower(), user.lower(), state_name.lower(), threads,
+                         cpu, read_rate, write_rate, rss, vsize),
+                'values': (pid, ppid, name, user, state_name, threads, f"{cpu:.1f}",
+                           f"{format_size(read_rate)}/s", f"{format_size(write_rate)}/s", f"{rss} KB", f"{vsize} KB")
+            }
+        return rows
+
+    # aplica um novo modelo completo a arvore, tocando so o que mudou
+    def apply_process_rows(self, rows):
+        tree = self.process_treeview
 
-        # salvar a expansao
-        expanded_pids = set()
-        def save_expansion_state(item):
-            if self.process_treeview.item(item, 'open'):
-                pid = self.process_treeview.item(item, 'values')[0]
-                expanded_pids.add(pid)
-            for child in self.process_treeview.get_children(item):
-                save_expansion_state(child)
-        for item in self.process_treeview.get_children():
-            save_expansion_state(item)
-
-        # salvar o processo selecionado
-        selected_item = self.process_treeview.selection()
-        last_selected_pid = None
-        if selected_item:
-            last_selected_pid = self.process_treeview.item(selected_item[0], 'values')[0]
-
-        # salva a posicao da barra de rolagem
-        treeview_yview = self.process_treeview.yview()
+        # o pai na arvore eh o ppid quando ele tambem esta na lista
+        for pid, row in rows.items():
+            ppid = row['ppid']
+            row['parent'] = ppid if ppid != '0' and ppid != pid and ppid in rows else ''
 
-        # salva a ordenacao
+        old_rows = self.process_rows
+        removed = [pid for pid in old_rows if pid not in rows]
         sort_column = self.treeview_sort_column
-        sort_reverse = self.treeview_sort_reverse
-
-        self.process_treeview.delete(*self.process_treeview.get_children())
-
-        # constroi um dicionario de informacoes de processo
-        process_info = {}
-        lines = processes.strip().split('\n')
-        for line in lines:
-            parts = line.split('\t')
-            if len(parts) >= 8:
-                pid, ppid, name, uid, state, threads, vsize, rss = parts
-                process_info[pid] = {
-                    'ppid': ppid,
-                    'pid': pid,
-                    'name': name,
-                    'uid': uid,
-                    'state': state,
-                    'threads': threads,
-                    'vsize': vsize,
-                    'rss': rss
-                }
-
-        # insere os processos na arvore
-        inserted_items = {}
-        def insert_process(pid):
-            if pid in inserted_items:
-                return inserted_items[pid]
-            info = process_info.get(pid)
-            if info:
-                ppid = info['ppid']
-                if ppid != '0' and ppid in process_info and ppid != pid:
-                    parent_item = insert_process(ppid)
-                else:
-                    parent_item = ''
-                item = self.process_treeview.insert(parent_item, 'end', text=info['name'], values=(
-                    info['pid'],
-                    info['ppid'],
-                    info['name'],
-                    info['uid'],
-                    info['state'],
-                    info['threads'],
-                    f"{info['vsize']} KB",
-                    f"{info['rss']} KB"
-                ))
-                inserted_items[pid] = item
-                # restaura a expansao
-                if pid in expanded_pids:
-                    self.process_treeview.item(item, open=True)
-                # restaura a selecao
-                if pid == last_selected_pid:
-                    self.process_treeview.selection_set(item)
-                    self.process_treeview.see(item)
-                return item
-            return ''
-
-        for pid in process_info.keys():
-            insert_process(pid)
-
-        # restaura a posicao da barra de rolagem
-        self.process_treeview.yview_moveto(treeview_yview[0])
-
-        # aplicar ordenacao
+        dirty_parents = set()
+
+        # insere os processos novos na raiz; o pai correto eh aplicado abaixo
+        for pid, row in rows.items():
+            if pid not in old_rows:
+                tree.insert('', 'end', iid=pid, text=row['text'], values=row['values'])
+
+        for pid, row in rows.items():
+            old_row = old_rows.get(pid)
+            old_parent = old_row['parent'] if old_row else ''
+            # move os processos cujo pai mudou (inclusive os recem inseridos
+            # e os filhos de processos que terminaram)
+            if old_row is None or row['parent'] != old_parent:
+                try:
+                    tree.move(pid, row['parent'], 'end')
+                except tk.TclError:
+                    # o novo pai eh descendente do item (pid reutilizado)
+                    row['parent'] = ''
+                    tree.move(pid, '', 'end')
+                dirty_parents.add(row['parent'])
+            # atualiza apenas as linhas com valores diferentes
+            elif row['values'] != old_row['values']:
+                tree.item(pid, text=row['text'], values=row['values'])
+                if sort_column and (self.process_sort_key(row, sort_column)
+                                    != self.process_sort_key(old_row, sort_column)):
+                    dirty_parents.add(row['parent'])
+
+        # remove os processos que terminaram; os descendentes de um item
+        # removido sao removidos junto com ele
+        removed_set = set(removed)
+        top_removed = [pid for pid in removed if old_rows[pid]['parent'] not in removed_set]
+        if top_removed:
+            tree.delete(*top_removed)
+
+        self.process_rows = rows
+
+        # reordena apenas os niveis que receberam ou alteraram linhas
         if sort_column:
-            self.sort_process_tree(sort_column, invert_sort=False)
+            for parent in dirty_parents:
+                self.sort_process_children(parent, sort_column, recursive=False)
+
+    # chave de ordenacao de uma linha do modelo de processos: colunas
+    # numericas sao comparadas como numeros, as demais em ordem alfabetica
+    def process_sort_key(self, row, col):
+        if col == "#0":  # ordenar por nome do processo
+            return row['keys'][2]
+        return row['keys'][self.process_columns.index(col)]
+
+    # ordena os filhos de um item na arvore de processos usando o modelo
+    # (sem consultar a arvore) e move apenas os itens fora de posicao
+    def sort_process_children(self, parent_item, col, recursive=True):
+        tree = self.process_treeview
+        children = tree.get_children(parent_item)
+        ordered = sorted(children, key=lambda pid: self.process_sort_key(self.process_rows[pid], col),
+                         reverse=self.treeview_sort_reverse)
+        current = list(children)
+        for index, child in enumerate(ordered):
+            if current[index] != child:
+                tree.move(child, parent_item, index)
+                current.remove(child)
+                current.insert(index, child)
+        if recursive:
+            for child in ordered:
+                self.sort_process_children(child, col)
 
     def sort_process_tree(self, col, invert_sort=True):
         # verifica se a coluna mudou ou se deve inverter a ordem de ordenacao
@@ -619,44 +876,17 @@ class DashboardApp:
             self.treeview_sort_reverse = not self.treeview_sort_reverse
         self.treeview_sort_column = col
 
-        def sort_children(parent_item):
-            # ordena os filhos de um item na arvore de processos
-            children = self.process_treeview.get_children(parent_item)
-            data = []
-            for child in children:
-                item_values = self.process_treeview.item(child)['values']
-                if col == "#0":  # ordenar por nome do processo
-                    value = self.process_treeview.item(child)['text']
-                else:
-                    col_index = self.process_treeview['columns'].index(col)
-                    value = item_values[col_index]
-                data.append((child, value))
-            
-            # funcao auxiliar para definir a chave de ordenacao
-            def sort_key(item):
-                value = item[1]
-                # caso a coluna seja numerica (PID, PPID, Threads)
-                if col in ["PID", "PPID", "Threads"]:
-                    return int(value)
-                # caso seja memoria (fisica ou virtual)
-                elif col in ["Physical Memory", "Virtual Memory"]:
-                    try:
-                        return float(value.replace(" KB", ""))
-                    except ValueError:
-                        return 0.0
-                return value.lower()  # ordenacao alfabetica para outras colunas
-
-            # ordena os dados conforme a chave de ordenacao
-            data.sort(key=sort_key, reverse=self.treeview_sort_reverse)
-            for index, (child, _) in enumerate(data):
-                # move o item ordenado na arvore
-                self.process_treeview.move(child, parent_item, index)
-                sort_children(child)  # ordena os filhos recursivamente
-
         # inicia a ordenacao para o item principal (root)
-        sort_children('')
+        self.sort_process_children('', col)
 
     def display_process_details(self, pid):
+        # os dados fixos do processo sao lidos aqui, uma unica vez
+        try:
+            detail = self.sys_info.open_process_detail(pid)
+        except ProcessLookupError:
+            tk.messagebox.showerror("Error", f"Process {pid} no longer exists")
+            return
+
         # cria uma nova janela para exibir os detalhes do processo
         detail_window = tk.Toplevel(self.root)
         detail_window.title(f"Process Details - PID {pid}")
@@ -693,6 +923,9 @@ class DashboardApp:
         resources_frame = ttk.Frame(notebook, padding="10")
         notebook.add(resources_frame, text="More Info")
 
+        files_frame = ttk.Frame(notebook, padding="10")
+        notebook.add(files_frame, text="Open Files")
+
         treeviews = {}
 
         # criacao de treeviews para cada secao (basico e recursos)
@@ -711,12 +944,12 @@ class DashboardApp:
 
             treeviews[name] = treeview
 
-        # criacao do treeview para as threads do processo
-        threads_columns = ("Thread ID (TID)", "Name", "State", "VmRSS")
+        # criacao do treeview para as threads do processo; o id de cada item eh o tid
+        threads_columns = ("Thread ID (TID)", "Name", "State", "Priority", "Nice", "CPU", "CPU %")
         threads_treeview = ttk.Treeview(threads_frame, columns=threads_columns, show="headings")
         for col in threads_columns:
             threads_treeview.heading(col, text=col)
-            threads_treeview.column(col, anchor="w", width=150)
+            threads_treeview.column(col, anchor="w", width=100)
         threads_treeview.pack(side="left", fill="both", expand=True)
 
         # barra de rolagem para o treeview de threads
@@ -726,90 +959,183 @@ class DashboardApp:
 
         treeviews["threads"] = threads_treeview
 
-        # funcao para formatar e adicionar as informacoes em cada secao do treeview
-        def format_section(treeview, content, section_name):
-            if section_name == "threads":
-                # se for a secao de threads, divide as informacoes para cada thread
-                threads = content.strip().split('Thread ID (TID):')
-                for thread_info in threads[1:]:
-                    lines = thread_info.strip().split('\n')
-                    thread_data = {}
-                    thread_data["Thread ID (TID)"] = lines[0].strip()
-                    for line in lines[1:]:
-                        if ':' in line:
-                            key, value = line.split(':', 1)
-                            thread_data[key.strip()] = value.strip()
-                    if thread_data:
-                        treeview.insert("", "end", values=(
-                            thread_data.get("Thread ID (TID)", ""),
-                            thread_data.get("Name", ""),
-                            thread_data.get("State", ""),
-                            thread_data.get("VmRSS", "")
-                        ))
+        # descritores abertos; o id de cada item eh o numero do descritor
+        files_bar = ttk.Frame(files_frame)
+        files_bar.pack(side="top", fill="x", pady=(0, 5))
+        files_status = ttk.Label(files_bar, text="")
+        files_status.pack(side="left")
+        files_columns = ("FD", "Type", "Target", "Details")
+        files_treeview = ttk.Treeview(files_frame, columns=files_columns, show="headings")
+        for col, width in zip(files_columns, (60, 70, 300, 350)):
+            files_treeview.heading(col, text=col)
+            files_treeview.column(col, anchor="w", width=width)
+        files_treeview.pack(side="left", fill="both", expand=True)
+
+        files_scrollbar = ttk.Scrollbar(files_frame, orient="vertical", command=files_treeview.yview)
+        files_scrollbar.pack(side="right", fill="y")
+
+        # dados fixos, inseridos uma unica vez
+        static = detail.static
+        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(static['startTime']))
+        for key, value in (("Process ID (PID)", pid), ("Parent PID", static['ppid']), ("Name", static['name']),
+                           ("User", f"{static['user']} ({static['uid']})"), ("Executable", static['exe']),
+                           ("Command Line", static['cmdline']), ("Started", started)):
+            treeviews["basic"].insert("", "end", values=(key, value))
+
+        # campos variaveis: uma linha por campo (id = nome do campo), cujo
+        # valor eh trocado no lugar quando muda
+        field_values = {}
+        for tab, field, label in process_detail_fields:
+            treeviews[tab].insert("", "end", iid=field, values=(label, ""))
+
+        def format_field(field, value):
+            if field == "state":
+                return PROCESS_STATES.get(value, value)
+            if field == "cpuUsage":
+                return f"{value:.1f}"
+            if field in ("threads", "voluntarySwitches", "involuntarySwitches"):
+                return str(value)
+            return f"{value} KB"
+
+        # so a aba visivel eh atualizada: a de threads le um arquivo por
+        # thread, as demais apenas stat e status do processo
+        tab_names = ("basic", "threads", "resources", "files")
+        visible_tab = ["basic"]
+
+        def on_tab_changed(event):
+            visible_tab[0] = tab_names[notebook.index(notebook.select())]
+            if visible_tab[0] == "files":
+                reload_files()
             else:
-                # para as outras secoes, insere os dados de chave e valor
-                lines = content.strip().split('\n')
-                for line in lines:
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        treeview.insert("", "end", values=(key.strip(), value.strip()))
-
-        # funcao para atualizar os treeviews com as informacoes do processo
-        def update_treeviews(process_info):
-            sections = process_info.split('Title')
-            for name, treeview in treeviews.items():
-                treeview.delete(*treeview.get_children())
-                for section in sections:
-                    section = section.strip()
-                    if section:
-                        if name == "basic" and section.startswith("1"):
-                            content = section.split('\n', 1)[1]
-                            format_section(treeview, content, name)
-                        elif name == "threads" and section.startswith("3"):
-                            content = section.split('\n', 1)[1]
-                            format_section(treeview, content, name)
-                        elif name == "resources" and section.startswith("2"):
-                            content = section.split('\n', 1)[1]
-                            format_section(treeview, content, name)
-
-        # quando detalhes de um processo especifico sao solicitados,
-        # uma tarefa eh submetida ao executor para obter essas informacoes
-        # e coloca-las na fila de resultados
+                self.scheduler.run_now(collector_name)
+
+        notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
+
+        # enquanto a janela existir, um coletor obtem os detalhes do processo
+        # periodicamente e publica o resultado no topico desta janela
         def update_process_info():
-            def worker():
-                try:
-                    # obtem as informacoes detalhadas do processo
-                    process_info = self.sys_info.get_specific_process(pid) # coleta de dados
-                    self.result_queue.put(('process_detail', process_info)) # coloca o resultado na fila
-                except Exception as e:
-                    self.result_queue.put(('error', str(e)))
-
-            # envia a tarefa para ser executada em uma thread separada
-            self.executor.submit(worker) # submete a tarefa ao executor
-
-        # funcao para processar os dados da fila e atualizar a interface
-        def process_detail_queue():
-            if not detail_window.winfo_exists():
+            tab = visible_tab[0]
+            if tab == "files":
+                return None  # a aba de descritores eh atualizada pelo botao Refresh
+            try:
+                result = detail.refresh(with_fields=tab != "threads", with_threads=tab == "threads")
+            except Exception as e:
+                return ('error', str(e))
+            return ('process_detail', result) if result is not None else ('exited', None)
+
+        collector_name = f"process_detail:{detail_window}"
+
+        def on_detail_window_destroy(event):
+            if event.widget is detail_window:
+                self.scheduler.remove(collector_name)
+                # close espera uma leitura em andamento; fica fora da thread do tk
+                self.executor.submit(detail.close)
+                if files_state["cursor"] is not None:
+                    self.executor.submit(files_state["cursor"].close)
+
+        detail_window.bind("<Destroy>", on_detail_window_destroy, add="+")
+
+        # aplica apenas as diferencas: campos com valor novo e threads novas,
+        # alteradas ou encerradas
+        def on_process_detail(item):
+            if item[0] == 'process_detail':
+                title_label.config(text=f"Process Details (PID: {pid})")
+                fields, threads, removed = item[1]
+                if fields is not None:
+                    for tab, field, label in process_detail_fields:
+                        value = format_field(field, fields[field])
+                        if field_values.get(field) != value:
+                            field_values[field] = value
+                            treeviews[tab].item(field, values=(label, value))
+                for tid, name, state, priority, nice, processor, cpu in threads:
+                    values = (tid, name, PROCESS_STATES.get(state, state), priority, nice, processor, f"{cpu:.1f}")
+                    if threads_treeview.exists(str(tid)):
+                        threads_treeview.item(str(tid), values=values)
+                    else:
+                        threads_treeview.insert("", "end", iid=str(tid), values=values)
+                removed = [str(tid) for tid in removed if threads_treeview.exists(str(tid))]
+                if removed:
+                    threads_treeview.delete(*removed)
+            elif item[0] == 'exited':
+                self.scheduler.remove(collector_name)
+                title_label.config(text=f"Process Details (PID: {pid}) - exited")
+            elif item[0] == 'error':
+                # erro passageiro: a proxima leitura bem sucedida restaura o titulo
+                title_label.config(text=f"Process Details (PID: {pid}) - error: {item[1]}")
+
+        # o topico eh exclusivo desta janela, entao os resultados nao se
+        # misturam com os da janela principal nem com os de outras janelas
+        self.dispatcher.subscribe(collector_name, on_process_detail, owner=detail_window, latest_only=True)
+
+        # descritores abertos: cada refresh abre um novo cursor (que resolve
+        # os sockets uma vez) e as paginas sao lidas em segundo plano so
+        # quando a lista rola perto do fim. `generation` descarta paginas de
+        # um cursor substituido por um refresh mais recente
+        files_topic = f"{collector_name}:files"
+        files_state = {"cursor": None, "generation": 0, "loading": False, "done": True, "loaded": 0}
+
+        def read_files_page(generation, cursor):
+            try:
+                if cursor is None:
+                    cursor = self.sys_info.open_fd_cursor(pid)
+                rows = cursor.read_page()
+            except Exception as e:
+                self.dispatcher.publish(files_topic, (generation, 'error', None, str(e)))
                 return
-
-            while not self.result_queue.empty():
-                try:
-                    item = self.result_queue.get_nowait()
-                except queue.Empty:
-                    break
-                if item[0] == 'process_detail':
-                    process_info = item[1]
-                    update_treeviews(process_info)
-                elif item[0] == 'error':
-                    print(f"Error fetching process info: {item[1]}")
-
-            # chama a atualizacao das informacoes do processo a cada intervalo de tempo
-            detail_window.after(cycle_time_process_detail, update_process_info)
-            detail_window.after(250, process_detail_queue)
-
-        # inicia a atualizacao das informacoes e o processamento da fila
-        update_process_info()
-        process_detail_queue()
+            self.dispatcher.publish(files_topic, (generation, 'page', cursor, rows))
+
+        def reload_files():
+            if files_state["cursor"] is not None:
+                self.executor.submit(files_state["cursor"].close)
+            files_state.update(cursor=None, generation=files_state["generation"] + 1, loading=True, done=False,
+                               loaded=0)
+            files_treeview.delete(*files_treeview.get_children())
+            files_status.config(text="Loading...")
+            self.executor.submit(read_files_page, files_state["generation"], None)
+
+        def load_more_files():
+            if files_state["loading"] or files_state["done"]:
+                return
+            files_state["loading"] = True
+            self.executor.submit(read_files_page, files_state["generation"], files_state["cursor"])
+
+        def on_files_page(item):
+            generation, kind, cursor, payload = item
+            if generation != files_state["generation"]:
+                if cursor is not None and cursor is not files_state["cursor"]:
+                    self.executor.submit(cursor.close)
+                return
+            files_state["loading"] = False
+            if kind == 'error':
+                files_state["done"] = True
+                files_status.config(text=f"Error: {payload}")
+                return
+            files_state["cursor"] = cursor
+            for fd, fd_type, target, details in payload:
+                if not files_treeview.exists(str(fd)):
+                    files_treeview.insert("", "end", iid=str(fd), values=(fd, fd_type, target, details))
+            files_state["loaded"] += len(payload)
+            if not payload:
+                files_state["done"] = True
+                self.executor.submit(cursor.close)
+            files_status.config(text=f"{files_state['loaded']} of {cursor.count} descriptors")
+            # se a pagina nao preencheu a lista, a proxima ja eh pedida
+            if not files_state["done"] and files_treeview.yview()[1] >= 0.9:
+                load_more_files()
+
+        def on_files_scroll(first, last):
+            files_scrollbar.set(first, last)
+            if float(last) >= 0.9:
+                load_more_files()
+
+        files_treeview.configure(yscrollcommand=on_files_scroll)
+        ttk.Button(files_bar, text="Refresh", command=reload_files).pack(side="right")
+        self.dispatcher.subscribe(files_topic, on_files_page, owner=detail_window)
+
+        # inicia a atualizacao das informacoes
+        self.scheduler.add(collector_name, cycle_time_process_detail / 1000, update_process_info,
+                           lambda item: self.dispatcher.publish(collector_name, item))
+        self.scheduler.run_now(collector_name)
 
     def show_files(self):
         if self.files_window is not None and tk.Toplevel.winfo_exists(self.files_window):
@@ -833,26 +1159,62 @@ class DashboardApp:
         self.forward_button = tk.Button(nav_frame, text="->", command=self.go_forward, state=tk.DISABLED)
         self.forward_button.pack(side=tk.LEFT)
 
+        self.disk_usage_button = tk.Button(nav_frame, text="Analyze Disk Usage", command=self.analyze_disk_usage)
+        self.disk_usage_button.pack(side=tk.RIGHT)
+
         # frame para a arvore de arquivos
         files_tree_frame = ttk.Frame(self.files_window)
         files_tree_frame.pack(fill='both', expand=True)
 
-        self.fs_tree = ttk.Treeview(files_tree_frame)
+        # o id de cada item eh o caminho absoluto; o texto eh o nome
+        self.fs_tree = ttk.Treeview(files_tree_frame, columns=("Size", "Permissions"))
+        self.fs_tree.heading("#0", text="Name")
+        self.fs_tree.heading("Size", text="Size")
+        self.fs_tree.heading("Permissions", text="Permissions")
+        self.fs_tree.column("Size", anchor='e', width=120)
+        self.fs_tree.column("Permissions", anchor='center', width=100)
         self.fs_tree.pack(fill='both', expand=True)
 
         scrollbar_tree = ttk.Scrollbar(files_tree_frame, orient="vertical", command=self.fs_tree.yview)
         self.fs_tree.configure(yscrollcommand=scrollbar_tree.set)
         scrollbar_tree.pack(side='right', fill='y')
 
+        # expandir carrega o diretorio; duplo clique navega para ele
         self.fs_tree.bind("<<TreeviewOpen>>", self.on_treeview_open)
+        self.fs_tree.bind("<Double-1>", self.on_treeview_double_click)
+
+        # diretorios carregados (caminho -> mtime da carga) e cargas em
+        # andamento (caminho -> geracao; uma carga mais nova cancela a anterior).
+        # files_watched eh uma copia de files_loaded trocada inteira na thread
+        # do tk a cada mudanca: check_files_changed roda fora dela
+        self.files_loaded = {}
+        self.files_watched = {}
+        self.files_loading = {}
+        self.files_seen = {}
+        self.files_generation = 0
+        # tamanho usado na ordenacao: arquivos pelo stat, diretorios pelo total da analise
+        self.files_sizes = {}
+
+        self.dispatcher.subscribe('files_page', self.on_files_page, owner=self.files_window)
+        self.dispatcher.subscribe('files_stat', self.on_files_stat, owner=self.files_window)
+        self.dispatcher.subscribe('files_done', self.on_files_done, owner=self.files_window)
+        self.dispatcher.subscribe('files_changed', self.on_files_changed, owner=self.files_window)
+        self.dispatcher.subscribe('disk_usage', self.on_disk_usage, owner=self.files_window, latest_only=True)
+
+        self.navigate_to_directory("/")
 
         self.files_window_running = True
         self.update_files()
 
     def on_treeview_open(self, event):
-        item = self.fs_tree.focus()
-        path = self.fs_tree.item(item, "text")
-        self.navigate_to_directory(path)
+        path = self.fs_tree.focus()
+        if path and path not in self.files_loaded and path not in self.files_loading:
+            self.load_directory(path)
+
+    def on_treeview_double_click(self, event):
+        path = self.fs_tree.identify_row(event.y)
+        if path and (self.fs_tree.exists(path + files_placeholder) or path in self.files_loaded):
+            self.navigate_to_directory(path)
 
     def navigate_to_directory(self, path):
         self.files_history = self.files_history[:self.files_history_index + 1]
@@ -877,38 +1239,209 @@ class DashboardApp:
         self.back_button.config(state=tk.NORMAL if self.files_history_index > 0 else tk.DISABLED)
         self.forward_button.config(state=tk.NORMAL if self.files_history_index < len(self.files_history) - 1 else tk.DISABLED)
 
+    # recria a arvore com `path` como raiz; apenas o primeiro nivel eh carregado
     def refresh_files_tree(self, path="/"):
-        for item in self.fs_tree.get_children():
-            self.fs_tree.delete(item)
-        self.populate_fs_tree(path, "")
+        self.fs_tree.delete(*self.fs_tree.get_children())
+        self.files_loaded.clear()
+        self.files_watched = {}
+        self.files_loading.clear()
+        self.files_seen.clear()
+        self.files_sizes.clear()
+        self.disk_usage_generation += 1
+        self.disk_usage_button.config(text="Analyze Disk Usage")
+        self.fs_tree.insert("", "end", iid=path, text=path, open=True)
+        self.load_directory(path)
+
+    # le o diretorio em segundo plano, em paginas: cada pagina eh publicada
+    # primeiro so com nomes e tipos (d_type, sem stat) e depois com tamanho e
+    # permissoes. recarregar um diretorio ja exibido atualiza apenas as
+    # entradas novas, alteradas ou removidas
+    def load_directory(self, path):
+        self.files_generation += 1
+        generation = self.files_generation
+        self.files_loading[path] = generation
+        self.files_seen[path] = set()
 
-    def populate_fs_tree(self, path, parent):
-        try:
-            files_info = self.sys_info.list_directory(path)
-            for file in files_info:
-                abs_path = f"{path}/{file}"
-                item = self.fs_tree.insert(parent, "end", text=abs_path, open=False)
-                if self.sys_info.is_directory(abs_path):
-                    self.fs_tree.insert(item, "end")
-        except Exception as e:
-            print(f"Error populating file tree: {e}")
+        def worker():
+            # com o stat feito, uma falha na listagem guarda o mtime: o erro so
+            # eh mostrado de novo se o diretorio mudar
+            mtime = None
+            error = None
+            try:
+                mtime = os.stat(path).st_mtime_ns
+                for page in self.sys_info.iter_directory(path):
+                    if self.files_loading.get(path) != generation:
+                        return  # carga cancelada
+                    self.dispatcher.publish('files_page', (path, generation, page.rows()))
+                    page.stat(self.sys_info)
+                    self.dispatcher.publish('files_stat', (path, generation, page.rows()))
+            except OSError as e:
+                error = e.strerror or str(e)
+            self.dispatcher.publish('files_done', (path, generation, mtime, error))
+
+        self.executor.submit(worker)
+
+    def on_files_page(self, item):
+        path, generation, rows = item
+        if self.files_loading.get(path) != generation or not self.fs_tree.exists(path):
+            return
+        self.fs_tree.delete(*[child for child in (path + files_placeholder,) if self.fs_tree.exists(child)])
+        seen = self.files_seen[path]
+        for name, is_directory, size, permissions, mtime in rows:
+            child = os.path.join(path, name)
+            seen.add(child)
+            if not self.fs_tree.exists(child):
+                self.fs_tree.insert(path, "end", iid=child, text=name, values=("", ""))
+                if is_directory:
+                    # item vazio para que o diretorio possa ser expandido
+                    self.fs_tree.insert(child, "end", iid=child + files_placeholder)
+
+    def on_files_stat(self, item):
+        path, generation, rows = item
+        if self.files_loading.get(path) != generation:
+            return
+        for name, is_directory, size, permissions, mtime in rows:
+            child = os.path.join(path, name)
+            if permissions is None or not self.fs_tree.exists(child):
+                continue
+            total = self.disk_usage.totals.get(child) if is_directory else None
+            if total is not None:
+                # diretorio ja analisado: mostra o total recursivo
+                self.files_sizes[child] = total
+                self.fs_tree.item(child, values=(f"{format_size(total)} total", permissions))
+            else:
+                if not is_directory:
+                    self.files_sizes[child] = size
+                self.fs_tree.item(child, values=(f"{size} bytes", permissions))
+
+    def on_files_done(self, item):
+        path, generation, mtime, error = item
+        if self.files_loading.get(path) != generation:
+            return
+        del self.files_loading[path]
+        seen = self.files_seen.pop(path)
+        if not self.fs_tree.exists(path):
+            return
+        # remove as entradas que nao existem mais
+        removed = [child for child in self.fs_tree.get_children(path) if child not in seen]
+        for child in removed:
+            self.forget_directory(child)
+        self.fs_tree.delete(*removed)
+        if mtime is not None:
+            self.files_loaded[path] = mtime
+            self.files_watched = dict(self.files_loaded)
+        if error is not None:
+            tk.messagebox.showerror("Error", f"Cannot list {path}: {error}", parent=self.files_window)
+        if any(child in self.disk_usage.totals for child in self.fs_tree.get_children(path)):
+            self.sort_files_children(path)
+
+    # ordena os filhos de um diretorio do maior para o menor
+    def sort_files_children(self, path):
+        children = self.fs_tree.get_children(path)
+        ordered = sorted(children, key=lambda child: -self.files_sizes.get(child, -1))
+        if list(children) != ordered:
+            for index, child in enumerate(ordered):
+                self.fs_tree.move(child, path, index)
+
+    # analisa o uso de disco a partir da raiz da arvore em segundo plano; os
+    # totais parciais dos subdiretorios chegam enquanto a analise avanca e a
+    # arvore eh reordenada por tamanho a cada resultado
+    def analyze_disk_usage(self):
+        root = self.files_history[self.files_history_index]
+        self.disk_usage_generation += 1
+        generation = self.disk_usage_generation
+        self.disk_usage_button.config(text="Analyzing...")
+
+        def on_progress(totals, done):
+            self.dispatcher.publish('disk_usage', (root, generation, totals, done, None))
+
+        def worker():
+            try:
+                self.disk_usage.analyze(root, on_progress,
+                                        cancelled=lambda: self.disk_usage_generation != generation)
+            except OSError as e:
+                self.dispatcher.publish('disk_usage', (root, generation, [], True, e.strerror or str(e)))
+
+        self.executor.submit(worker)
+
+    def on_disk_usage(self, item):
+        root, generation, totals, done, error = item
+        if generation != self.disk_usage_generation or not self.fs_tree.exists(root):
+            return
+        if error is not None:
+            self.disk_usage_button.config(text="Analyze Disk Usage")
+            tk.messagebox.showerror("Error", f"Cannot analyze disk usage of {root}: {error}",
+                                    parent=self.files_window)
+            return
+        for path, total in totals:
+            self.files_sizes[path] = total
+            if self.fs_tree.exists(path):
+                self.fs_tree.set(path, "Size", f"{format_size(total)} total")
+        self.sort_files_children(root)
+        if done:
+            self.disk_usage_button.config(text="Analyze Disk Usage")
+            if root in self.disk_usage.totals:
+                self.fs_tree.set(root, "Size", f"{format_size(self.disk_usage.totals[root])} total")
+            # diretorios ja expandidos abaixo da raiz tambem recebem os totais
+            for loaded in self.files_loaded:
+                if loaded == root:
+                    continue
+                for child in self.fs_tree.get_children(loaded):
+                    if child in self.disk_usage.totals:
+                        self.files_sizes[child] = self.disk_usage.totals[child]
+                        self.fs_tree.set(child, "Size", f"{format_size(self.files_sizes[child])} total")
+                self.sort_files_children(loaded)
+
+    # esquece os diretorios carregados dentro de um item removido da arvore
+    def forget_directory(self, path):
+        prefix = path + "/"
+        for loaded in [p for p in self.files_loaded if p == path or p.startswith(prefix)]:
+            del self.files_loaded[loaded]
+        self.files_watched = dict(self.files_loaded)
+
+    def on_files_changed(self, changed):
+        for path in changed:
+            if path in self.files_loaded and path not in self.files_loading and self.fs_tree.exists(path):
+                self.load_directory(path)
 
     def close_files_window(self):
         self.files_window_running = False
+        self.scheduler.remove("files")
+        self.files_loading.clear()
+        self.disk_usage_generation += 1  # cancela uma analise em andamento
         self.files_window.destroy()
 
+    # verifica o mtime dos diretorios carregados; so quando algum mudou o
+    # resultado eh publicado e o diretorio recarregado. sem mudancas, a
+    # interface nao eh acordada
+    def check_files_changed(self):
+        changed = []
+        for path, mtime in self.files_watched.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    changed.append(path)
+            except OSError:
+                pass  # removido: a recarga do diretorio pai remove o item
+        return changed or None
+
     def update_files(self):
         if not self.files_window_running:
             return
 
-        def worker():
-            files_info = self.sys_info.list_directory("/")
-            self.result_queue.put(('files_update', files_info))
+        self.scheduler.add(
+            "files", cycle_time_files / 1000, self.check_files_changed,
+            lambda changed: self.dispatcher.publish('files_changed', changed))
 
-        if self.files_window_running:
-            threading.Thread(target=worker).start()
-            self.root.after(cycle_time_files, self.update_files)
+    # estatisticas de tempo de cada coletor (execucoes, ciclos descartados,
+    # duracao da ultima/media/maxima execucao)
+    def collector_stats(self):
+        return self.scheduler.stats()
 
     def stop(self):
+        self.scheduler.stop()
+        self.render_scheduler.stop()
+        self.dispatcher.close()
+        if self.recorder is not None:
+            self.recorder.close()
         self.executor.shutdown(wait=False)
         self.root.quit()
\ No newline at end of file
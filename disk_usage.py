@@ -0,0 +1,154 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import numpy as np
+from system_info import DT_DIR
+
+DISK_USAGE_WORKERS = min(8, os.cpu_count() or 1)  # diretorios lidos em paralelo
+PROGRESS_INTERVAL = 0.25  # segundos entre resultados parciais
+
+def format_size(size):
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1024 or unit == "TB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} {unit}"
+        size /= 1024
+
+
+# entradas de um diretorio guardadas no cache, validas enquanto o mtime do
+# diretorio nao mudar. so os nomes e tipos valem pelo mtime: o tamanho de um
+# arquivo muda sem alterar o mtime do diretorio, entao o stat das entradas eh
+# refeito a cada analise
+class DirectoryListing:
+    def __init__(self, mtime, pages):
+        self.mtime = mtime
+        self.pages = pages  # DirectoryPage compactas (DirectoryPage.copy)
+
+
+# uso de um diretorio (sem recursao) em uma analise
+class DirectoryUsage:
+    def __init__(self, own_bytes, subdirs, links):
+        self.own_bytes = own_bytes  # o proprio diretorio e seus arquivos sem outros links
+        self.subdirs = subdirs      # subdiretorios no mesmo sistema de arquivos
+        self.links = links          # ((dispositivo, inode), bytes) de arquivos com varios links
+
+
+# analisador de uso de disco no estilo do du, sobre a leitura paginada de
+# diretorios da biblioteca (SystemInfo.iter_directory). a arvore eh percorrida
+# por um numero limitado de threads, sem sair do sistema de arquivos da raiz;
+# arquivos com varios hard links sao contados uma unica vez por (dispositivo,
+# inode) e o espaco eh o alocado em disco (st_blocks). as entradas de cada
+# diretorio ficam em cache pelo mtime, entao uma nova analise so le de novo
+# (readdir) os diretorios que mudaram; o stat de cada entrada, como no du, eh
+# sempre refeito para que arquivos que cresceram entrem com o tamanho atual
+class DiskUsageAnalyzer:
+    def __init__(self, sys_info, workers=DISK_USAGE_WORKERS):
+        self.sys_info = sys_info
+        self.workers = workers
+        self._cache = {}
+        self._lock = threading.Lock()
+        self.totals = {}  # diretorio -> bytes (recursivo) das analises ja concluidas
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _scan(self, path, device):
+        try:
+            stat = os.stat(path, follow_symlinks=False)
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._cache.get(path)
+        if cached is not None and cached.mtime == stat.st_mtime_ns:
+            # mesmas entradas: so o stat eh refeito, sobre copias para que
+            # analises simultaneas nao alterem as paginas do cache
+            pages = [page.copy() for page in cached.pages]
+            for page in pages:
+                if page.stat(self.sys_info) < 0:
+                    return None
+            with self._lock:
+                self.cache_hits += 1
+        else:
+            try:
+                pages = [page.copy() for page in self.sys_info.iter_directory(path, with_stat=True)]
+            except OSError:
+                return None
+            with self._lock:
+                self._cache[path] = DirectoryListing(stat.st_mtime_ns, pages)
+                self.cache_misses += 1
+
+        own_bytes = stat.st_blocks * 512
+        subdirs = []
+        links = []
+        for page in pages:
+            records = page.records
+            valid = records['mode'] != 0
+            sizes = records['blocks'] * 512
+            directories = valid & (records['type'] == DT_DIR)
+            shared = valid & ~directories & (records['links'] > 1)
+            own_bytes += int(sizes[valid & ~directories & ~shared].sum())
+            for index in np.flatnonzero(directories & (records['device'] == device)):
+                subdirs.append(os.path.join(path, page.name(index)))
+            for index in np.flatnonzero(shared):
+                record = records[index]
+                links.append(((int(record['device']), int(record['inode'])), int(sizes[index])))
+        return DirectoryUsage(own_bytes, subdirs, links)
+
+    # analisa `root` e retorna o total em bytes. on_progress(totais, concluido)
+    # recebe periodicamente [(subdiretorio imediato da raiz, bytes)] ordenado
+    # do maior para o menor; os totais crescem conforme a arvore eh lida.
+    # cancelled() eh consultado para interromper a analise
+    def analyze(self, root, on_progress=None, cancelled=lambda: False):
+        device = os.stat(root).st_dev
+        prefix = root.rstrip("/") + "/"
+        seen_links = set()
+        own = {}
+        children = {}
+        top_totals = {}
+        last_progress = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {pool.submit(self._scan, root, device): root}
+            while pending:
+                done, _ = wait(pending, timeout=PROGRESS_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    usage = future.result()
+                    if usage is None:
+                        continue
+                    size = usage.own_bytes
+                    for key, link_bytes in usage.links:
+                        if key not in seen_links:
+                            seen_links.add(key)
+                            size += link_bytes
+                    own[path] = size
+                    children[path] = usage.subdirs
+
+                    if path != root:
+                        top = prefix + path[len(prefix):].split("/", 1)[0]
+                        top_totals[top] = top_totals.get(top, 0) + size
+                    if not cancelled():
+                        for subdir in usage.subdirs:
+                            pending[pool.submit(self._scan, subdir, device)] = subdir
+
+                if on_progress is not None and time.monotonic() - last_progress >= PROGRESS_INTERVAL:
+                    last_progress = time.monotonic()
+                    on_progress(sorted(top_totals.items(), key=lambda item: -item[1]), False)
+
+        # totais recursivos em pos-ordem a partir da raiz: cada diretorio so
+        # eh somado depois dos seus subdiretorios. a profundidade pelo numero
+        # de "/" nao serve: "/" e "/usr" tem a mesma
+        totals = {}
+        stack = [(root, False)] if root in own else []
+        while stack:
+            path, expanded = stack.pop()
+            if expanded:
+                totals[path] = own[path] + sum(totals.get(subdir, 0) for subdir in children[path])
+                continue
+            stack.append((path, True))
+            stack.extend((subdir, False) for subdir in children[path] if subdir in own)
+        if not cancelled():
+            with self._lock:
+                self.totals.update(totals)
+        if on_progress is not None:
+            on_progress(sorted(top_totals.items(), key=lambda item: -item[1]), True)
+        return totals.get(root, 0)
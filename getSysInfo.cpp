@@ -27,6 +27,14 @@
 // para manipulacao de processos
 #include <chrono>
 #include <algorithm>
+#include <mutex>
+#include <vector>
+#include <unordered_map>
+#include <list>
+#include <thread>
+#include <atomic>
+#include <fcntl.h>
+#include <climits>
 
 #include <errno.h>
 
@@ -36,14 +44,435 @@
 #include <dirent.h>
 #include <pwd.h>
 #include <grp.h>
+#include <fnmatch.h>
+#include <cmath>
+#include <cstddef>
+#include <arpa/inet.h>
+#include <deque>
+#include <poll.h>
+#include <sys/epoll.h>
+#include <sys/resource.h>
+#include <sys/socket.h>
+#include <linux/netlink.h>
+#include <linux/connector.h>
+#include <linux/cn_proc.h>
+
+// numero maximo de cores suportados pelo snapshot
+#define SNAPSHOT_MAX_CORES 256
+
+// estrutura de layout fixo preenchida por getSnapshot, espelhada
+// em python por system_info.Snapshot (ctypes.Structure)
+struct Snapshot {
+    double timestamp;              // segundos (steady_clock)
+    long long uptime;              // segundos
+    double loadAverage[3];         // 1, 5 e 15 min
+    int processCount;
+    int threadCount;
+    double totalMemory;            // MB
+    double freeMemory;             // MB
+    double memoryUsage;            // %
+    double swapUsage;              // %
+    double cpuUsage;               // %
+    double cpuIdlePercentage;      // %
+    int hasCpuTemperature;
+    double cpuTemperature;         // °C
+    double networkReceiveRate;     // KB/s
+    double networkTransmitRate;    // KB/s
+    double diskRead;               // MB/s
+    double diskWrite;              // MB/s
+    double usedDisk;               // GB
+    double freeDisk;               // GB
+    int coreCount;
+    double coreValues[SNAPSHOT_MAX_CORES]; // uso de cada core (%)
+};
+
+// registro de tamanho fixo da tabela de processos (getProcessTable),
+// espelhado em python por system_info.ProcessRecord. memoria em KB
+struct ProcessRecord {
+    int pid;
+    int ppid;
+    int uid;
+    int threads;
+    unsigned long long vsize;
+    unsigned long long rss;
+    double cpuUsage;           // % de um core desde a leitura anterior (como no top)
+    double readRate;           // bytes/s lidos do disco (/proc/[pid]/io)
+    double writeRate;          // bytes/s escritos no disco
+    unsigned int nameOffset;   // nome no bloco de strings
+    unsigned int nameLength;
+    unsigned int userOffset;   // nome do usuario no bloco de strings
+    unsigned int userLength;
+    char state;
+    char padding[7];
+};
+
+// contadores acumulados de um processo usados nas taxas da tabela
+struct ProcessCounters {
+    unsigned long long startTime = 0;   // com o pid, identifica o processo
+    unsigned long long cpuTicks = 0;    // utime + stime (jiffies)
+    unsigned long long readBytes = 0;
+    unsigned long long writeBytes = 0;
+    double cpuUsage = 0, readRate = 0, writeRate = 0;  // taxas da ultima leitura
+};
+
+// fontes de eventos de processos (startProcessEvents, system_info.PROCESS_EVENT_MODES)
+#define PROCESS_EVENTS_SCAN 0      // sem eventos: so a releitura periodica de /proc
+#define PROCESS_EVENTS_NETLINK 1   // conector de processos do netlink (requer CAP_NET_ADMIN)
+#define PROCESS_EVENTS_PIDFD 2     // pidfds dos processos observados (so saidas)
+
+// tipos de ProcessEvent
+#define PROCESS_EVENT_START 1      // fork de um novo processo (nao de threads)
+#define PROCESS_EVENT_CHANGE 2     // exec ou troca de nome
+#define PROCESS_EVENT_EXIT 3
+
+// valores de proc_event.what (ABI de linux/cn_proc.h; o enum muda de
+// escopo entre versoes do cabecalho, entao os valores sao usados direto)
+#define CONNECTOR_EVENT_NONE 0x00000000u
+#define CONNECTOR_EVENT_FORK 0x00000001u
+#define CONNECTOR_EVENT_EXEC 0x00000002u
+#define CONNECTOR_EVENT_COMM 0x00000200u
+#define CONNECTOR_EVENT_EXIT 0x80000000u
+
+// eventos guardados entre leituras; alem disso readProcessEvents informa perda
+#define PROCESS_EVENTS_MAX_PENDING 65536
+
+// evento de processo (readProcessEvents), espelhado em python por
+// system_info.ProcessEvent. ppid so vem no inicio; exitCode so na saida
+// pelo netlink (-1 se desconhecido)
+struct ProcessEvent {
+    int type;
+    int pid;
+    int ppid;
+    int exitCode;
+};
+
+// flags de signalProcesses
+#define SIGNAL_DESCENDANTS 1       // inclui todos os descendentes dos pids
+
+// resultado por processo de signalProcesses (system_info.SignalResult):
+// error eh 0 ou o errno do envio (ESRCH se o pid foi reutilizado)
+struct SignalResult {
+    int pid;
+    int error;
+};
+
+// releituras de /proc para congelar os descendentes em signalProcesses
+#define SIGNAL_MAX_FREEZE_PASSES 8
+
+// alvo de signalProcesses
+struct SignalTarget {
+    unsigned long long startTime = 0;  // 0 se o processo ja tinha terminado
+    bool wasStopped = false;           // ja estava parado (T/t) antes da chamada
+    bool frozen = false;               // congelado com SIGSTOP por esta chamada
+};
+
+// chaves de ordenacao de getTopProcesses (system_info.TOP_SORT_KEYS)
+#define PROCESS_SORT_CPU 0
+#define PROCESS_SORT_RSS 1
+#define PROCESS_SORT_VSIZE 2
+#define PROCESS_SORT_IO 3          // leitura + escrita
+#define PROCESS_SORT_THREADS 4
+
+// intervalo minimo entre duas leituras usadas nas taxas de processos;
+// leituras mais proximas repetem as ultimas taxas
+#define PROCESS_MIN_SAMPLE_INTERVAL 0.1
+
+// idade maxima (segundos) da ultima leitura completa reaproveitada por getTopProcesses
+#define PROCESS_TABLE_MAX_AGE 2.0
+
+// numero minimo de pids por thread no modo paralelo do leitor de processos;
+// abaixo disso o custo de criar threads supera o ganho
+#define PROCESS_SCAN_MIN_CHUNK 256
+
+// capacidade (entradas) e validade (segundos) do cache de nomes de usuario
+#define USER_CACHE_CAPACITY 1024
+#define USER_CACHE_TTL 300
+
+// contadores dos caches de metadados (getCacheStats), espelhados em
+// python por system_info.CacheStats
+struct CacheStats {
+    unsigned long long userHits;
+    unsigned long long userMisses;
+    unsigned long long userEvictions;
+    unsigned long long userExpirations;
+    unsigned long long userEntries;
+    unsigned long long staticHits;
+    unsigned long long staticMisses;
+};
+
+// registro de tamanho fixo de uma entrada de diretorio (readDirectoryPage),
+// espelhado em python por system_info.DirectoryEntry. o tipo vem do d_type do
+// readdir; os campos do stat so sao preenchidos quando pedidos (withStat ou
+// statDirectoryEntries) e mode fica 0 enquanto isso nao acontece
+struct DirectoryEntry {
+    unsigned long long inode;
+    unsigned long long device; // st_dev
+    long long size;            // bytes
+    long long blocks;          // blocos de 512 bytes alocados (st_blocks)
+    long long mtime;           // segundos desde 1970
+    unsigned int mode;         // st_mode (tipo e permissoes)
+    unsigned int links;        // st_nlink
+    unsigned int nameOffset;   // nome no bloco de strings
+    unsigned int nameLength;
+    unsigned char type;        // DT_DIR, DT_REG, DT_LNK, ...
+    char padding[7];
+};
+
+// entradas lidas por pagina em listDirectory
+#define DIRECTORY_PAGE_SIZE 512
+
+// campos de /proc/[pid]/stat usados pelo leitor de processos
+struct ProcStat {
+    int pid = 0;
+    std::string comm;
+    char state = '?';
+    int ppid = 0;
+    unsigned long long utime = 0, stime = 0;  // jiffies
+    int priority = 0;
+    int nice = 0;
+    int numThreads = 0;
+    unsigned long long startTime = 0;         // jiffies desde o boot
+    unsigned long long vsize = 0;             // bytes
+    unsigned long long rss = 0;               // paginas
+    int processor = -1;                       // ultima cpu usada
+};
+
+// tamanho dos textos de ProcessStaticInfo
+#define PROCESS_NAME_LENGTH 64
+#define PROCESS_TEXT_LENGTH 4096
+
+// secoes lidas por readProcessDetail (mascara de bits)
+#define PROCESS_DETAIL_FIELDS 1
+#define PROCESS_DETAIL_THREADS 2
+
+// dados de um processo que nao mudam enquanto ele existe, lidos uma unica
+// vez por openProcessDetail. espelhado em python por system_info.ProcessStaticInfo
+struct ProcessStaticInfo {
+    int pid;
+    int ppid;
+    int uid;
+    int gid;
+    long long startTime;                      // segundos desde 1970
+    char name[PROCESS_NAME_LENGTH];
+    char user[PROCESS_NAME_LENGTH];
+    char exe[PROCESS_TEXT_LENGTH];
+    char cmdline[PROCESS_TEXT_LENGTH];        // argumentos separados por espaco (truncado)
+};
+
+// campos variaveis de um processo (/proc/[pid]/stat e status), memoria em KB
+struct ProcessDynamicInfo {
+    char state;
+    char padding[3];
+    int threads;
+    double cpuUsage;                          // % de um core desde a leitura anterior
+    unsigned long long vmPeak, vmSize, vmRSS, rssAnon, rssFile, rssShmem;
+    unsigned long long vmData, vmStk, vmExe, vmLib, vmSwap;
+    unsigned long long voluntarySwitches, involuntarySwitches;
+};
+
+// thread nova ou alterada desde a leitura anterior (readProcessDetail),
+// espelhada em python por system_info.ThreadRecord
+struct ThreadRecord {
+    int tid;
+    int priority;
+    int nice;
+    int processor;
+    double cpuUsage;
+    unsigned int nameOffset;                  // nome no bloco de strings
+    unsigned int nameLength;
+    char state;
+    char padding[7];
+};
+
+// tipos de FileDescriptorRecord (system_info.FD_TYPES)
+#define FD_TYPE_OTHER 0
+#define FD_TYPE_FILE 1
+#define FD_TYPE_SOCKET 2
+#define FD_TYPE_PIPE 3
+#define FD_TYPE_ANON 4
+
+// descritores lidos por pagina em readFdPage
+#define FD_PAGE_SIZE 512
+
+// registro de tamanho fixo de um descritor aberto (readFdPage), espelhado
+// em python por system_info.FileDescriptorRecord. o alvo do link e a
+// descricao (para sockets, protocolo, enderecos e estado) ficam no bloco de strings
+struct FileDescriptorRecord {
+    int fd;
+    int type;                                 // FD_TYPE_*
+    unsigned long long inode;                 // sockets e pipes
+    unsigned int targetOffset;
+    unsigned int targetLength;
+    unsigned int detailOffset;
+    unsigned int detailLength;
+};
+
+// cursor de leitura dos descritores de um processo (openFdCursor): os
+// numeros sao listados na abertura e os links lidos pagina a pagina. o
+// indice inode -> socket eh montado uma vez, no primeiro socket encontrado
+struct FdCursor {
+    int pid = 0;
+    int pidFd = -1;                           // /proc/[pid]
+    int fdDirFd = -1;                         // /proc/[pid]/fd
+    std::vector<int> fds;
+    size_t position = 0;
+    bool socketsIndexed = false;
+    std::unordered_map<unsigned long long, std::string> sockets;  // inode -> descricao
+};
+
+// ultimo estado de uma thread enviado ao chamador
+struct ThreadState {
+    std::string name;
+    char state = '?';
+    int priority = 0, nice = 0, processor = -1;
+    unsigned long long ticks = 0;
+    double cpuUsage = 0;
+};
+
+// estado de uma janela de detalhes (openProcessDetail): o diretorio do
+// processo fica aberto e as threads ja enviadas sao lembradas para que cada
+// leitura devolva apenas as diferencas
+struct ProcessDetailHandle {
+    int pid = 0;
+    int pidFd = -1;                           // /proc/[pid]
+    unsigned long long startTime = 0;
+    bool sampled = false;
+    std::chrono::steady_clock::time_point sampleTime;
+    unsigned long long ticks = 0;
+    bool threadsSampled = false;
+    std::chrono::steady_clock::time_point threadSampleTime;
+    std::unordered_map<int, ThreadState> threads;
+};
+
+// numero de valores por core exportados por getCpuUsagePerCore:
+// ocupado, iowait, steal e irq (%), nesta ordem
+#define CPU_STAT_FIELDS 4
+
+// intervalo minimo entre duas leituras de /proc/stat; chamadas mais
+// proximas reutilizam a ultima amostra
+#define CPU_MIN_SAMPLE_INTERVAL 0.1
+
+// limites da estrutura DiskStats (getDiskStats)
+#define DISK_MAX_DEVICES 64
+#define DISK_MAX_MOUNTS 64
+#define DISK_NAME_LENGTH 32
+#define MOUNT_PATH_LENGTH 256
+#define MOUNT_SOURCE_LENGTH 128
+#define MOUNT_TYPE_LENGTH 32
+
+// intervalo minimo entre duas leituras de /proc/diskstats; chamadas mais
+// proximas reutilizam a ultima amostra
+#define DISK_MIN_SAMPLE_INTERVAL 0.1
+
+// estatisticas de um dispositivo de bloco, com taxas calculadas sobre o
+// intervalo entre duas leituras de /proc/diskstats
+struct DiskDeviceStats {
+    char name[DISK_NAME_LENGTH];
+    unsigned int major;
+    unsigned int minor;
+    int isPartition;
+    int isPhysical;                 // disco com dispositivo real (nao dm, md, loop...)
+    unsigned long long readBytes;   // totais desde o boot
+    unsigned long long writeBytes;
+    double readRate;                // bytes/s
+    double writeRate;
+    double readIops;                // operacoes/s
+    double writeIops;
+    double utilization;             // % do intervalo com I/O em andamento
+};
+
+// capacidade de um sistema de arquivos montado (de /proc/self/mountinfo)
+struct MountStats {
+    char mountPoint[MOUNT_PATH_LENGTH];
+    char source[MOUNT_SOURCE_LENGTH];
+    char fsType[MOUNT_TYPE_LENGTH];
+    unsigned int major;
+    unsigned int minor;
+    unsigned long long totalBytes;
+    unsigned long long usedBytes;
+    unsigned long long availableBytes;
+    double usage;                   // % usado, como no df
+};
+
+// resultado de getDiskStats, espelhado em python por system_info.DiskStats
+struct DiskStats {
+    double interval;                // segundos entre as duas leituras usadas nas taxas
+    int deviceCount;
+    int mountCount;
+    DiskDeviceStats devices[DISK_MAX_DEVICES];
+    MountStats mounts[DISK_MAX_MOUNTS];
+};
+
+// limites da estrutura NetworkStats (getNetworkStats)
+#define NET_MAX_INTERFACES 64
+#define NET_NAME_LENGTH 32
+
+// intervalo minimo entre duas leituras de /proc/net/dev
+#define NET_MIN_SAMPLE_INTERVAL 0.1
+
+// contadores de uma interface em /proc/net/dev (totais desde o boot) e as
+// taxas por segundo no intervalo entre duas leituras
+struct NetInterfaceStats {
+    char name[NET_NAME_LENGTH];
+    int isLoopback;
+    int isPhysical;                 // interface com dispositivo real (nao veth, bridge, tun...)
+    int selected;                   // entra nos totais (ver setNetworkPatterns)
+    int padding;
+    unsigned long long rxBytes, rxPackets, rxErrors, rxDrops;
+    unsigned long long txBytes, txPackets, txErrors, txDrops;
+    double rxRate, txRate;          // bytes/s
+    double rxPacketRate, txPacketRate;
+    double rxErrorRate, txErrorRate;
+    double rxDropRate, txDropRate;
+};
+
+// resultado de getNetworkStats, espelhado em python por system_info.NetworkStats
+struct NetworkStats {
+    double interval;                // segundos entre as duas leituras (comum a todas as interfaces)
+    int interfaceCount;
+    int padding;
+    NetInterfaceStats interfaces[NET_MAX_INTERFACES];
+};
+
+// contadores acumulados de um dispositivo em /proc/diskstats
+struct DiskCounters {
+    unsigned long long reads = 0, writes = 0;
+    unsigned long long sectorsRead = 0, sectorsWritten = 0;
+    unsigned long long ioTicks = 0;  // ms com I/O em andamento
+};
+
+// jiffies acumulados de uma linha "cpu" ou "cpuN" de /proc/stat
+struct CpuTimes {
+    unsigned long long user = 0, nice = 0, system = 0, idle = 0;
+    unsigned long long iowait = 0, irq = 0, softirq = 0, steal = 0;
+
+    unsigned long long total() const {
+        return user + nice + system + idle + iowait + irq + softirq + steal;
+    }
+};
+
+// percentuais de uma cpu no intervalo entre duas amostras
+struct CpuPercentages {
+    float busy = 0, idle = 0, iowait = 0, steal = 0, irq = 0;
+};
 
 class SystemInfo {
 public:
+    SystemInfo() {
+        // descritor mantido aberto para os openat/fstatat do leitor de processos
+        procFd = open("/proc", O_RDONLY | O_DIRECTORY | O_CLOEXEC);
+    }
+
+    ~SystemInfo() {
+        stopProcessEvents();
+        if (procFd >= 0) {
+            close(procFd);
+        }
+    }
 
     // funcao para obter a memoria total
-    const char* getTotalMemory() {
-        static std::string info;
-        info.clear();
+    std::string getTotalMemory() {
+        std::string info;
         struct sysinfo sys_info; // sysinfo struct
         if (sysinfo(&sys_info) == 0) { // obtem informacoes do sistema
             unsigned long long total_memory = sys_info.totalram * sys_info.mem_unit; 
@@ -51,13 +480,12 @@ public:
             memoryInfo << total_memory / (1024 * 1024); // convertido para MB
             info = memoryInfo.str();
         }
-        return info.c_str();
+        return info;
     }
 
     // funcao para obter a memoria livre
-    const char* getFreeMemory() {
-        static std::string info;
-        info.clear();
+    std::string getFreeMemory() {
+        std::string info;
         struct sysinfo sys_info; // sysinfo struct
         if (sysinfo(&sys_info) == 0) { // obtem informacoes do sistema
             unsigned long long free_memory = sys_info.freeram * sys_info.mem_unit; 
@@ -65,13 +493,12 @@ public:
             memoryInfo << free_memory / (1024 * 1024); // convertido para MB
             info = memoryInfo.str();
         }
-        return info.c_str();
+        return info;
     }
 
     // funcao para obter o tempo de atividade do sistema
-    const char* getUptime() {
-        static std::string info;
-        info.clear();
+    std::string getUptime() {
+        std::string info;
         struct sysinfo sys_info; // sysinfo struct
         if (sysinfo(&sys_info) == 0) { // obtem informacoes do sistema
             long uptime_seconds = sys_info.uptime;
@@ -85,13 +512,12 @@ public:
                     << seconds << " seconds";
             info = uptimeInfo.str();
         }
-        return info.c_str();
+        return info;
     }
 
     // funcao para obter a media de carga
-    const char* getLoadAverage() {
-        static std::string info;
-        info.clear();
+    std::string getLoadAverage() {
+        std::string info;
         struct sysinfo sys_info; // sysinfo struct
         if (sysinfo(&sys_info) == 0) { // obtem informacoes do sistema
             std::ostringstream loadInfo;
@@ -101,91 +527,491 @@ public:
                     << "15 min: " << sys_info.loads[2] / 65536.0;
             info = loadInfo.str();
         }
-        return info.c_str();
+        return info;
     }
 
     // funcao para obter o numero de processos em execucao
-    const char* getProcessCount() {
-        static std::string info;
-        info.clear();
+    std::string getProcessCount() {
+        std::string info;
         struct sysinfo sys_info; // sysinfo struct
         if (sysinfo(&sys_info) == 0) { // obtem informacoes do sistema
             std::ostringstream procInfo;
             procInfo << sys_info.procs << " processes";
             info = procInfo.str();
         }
-        return info.c_str();
+        return info;
     }
 
-    // TODO: pendente
-    // funcao para calcular e retornar o uso da cpu em percentual
-    const char* getCpuUsage() {
-        static std::string info;
-        info.clear();
-        
-        // le as estatisticas de uso da cpu em /proc/stat
+    // le /proc/stat uma unica vez e calcula os percentuais de cada cpu no
+    // intervalo desde a amostra anterior (ou desde o boot, na primeira).
+    // retorna o contador "processes" (usado como contador de threads)
+    int sampleCpu(CpuPercentages& aggregate, std::vector<CpuPercentages>& cores) {
+        std::lock_guard<std::mutex> lock(stateMutex);
+
+        auto currentTime = std::chrono::steady_clock::now();
+        std::chrono::duration<double> elapsedSeconds = currentTime - cpuSampleTime;
+        if (cpuSampled && elapsedSeconds.count() < CPU_MIN_SAMPLE_INTERVAL) {
+            aggregate = cpuAggregate;
+            cores = cpuCores;
+            return cpuProcesses;
+        }
+
         std::ifstream statFile("/proc/stat");
+        if (!statFile.is_open()) {
+            aggregate = CpuPercentages();
+            cores.clear();
+            return 0;
+        }
+
+        CpuTimes currAggregate;
+        std::vector<CpuTimes> currCores;
+        int processes = 0;
         std::string line;
-        if (statFile.is_open()) {
-            std::getline(statFile, line);  // le a primeira linha (estatisticas da cpu)
-            statFile.close();
-            
-            // analisa as estatisticas da cpu a partir da linha
-            unsigned long long user, nice, system, idle, iowait, irq, softirq, steal;
-            std::istringstream ss(line);
-            ss >> line >> user >> nice >> system >> idle >> iowait >> irq >> softirq >> steal;
-            
-            // calcula a porcentagem de uso da cpu
-            unsigned long long total = user + nice + system + idle + iowait + irq + softirq + steal;
-            unsigned long long idleTime = idle + iowait;
-            
-            // computa o uso da cpu em percentual
-            double cpuUsage = 100.0 * (total - idleTime) / total;
-            std::ostringstream usageInfo;
-            usageInfo << cpuUsage;
-            info = usageInfo.str();
+        while (std::getline(statFile, line)) {
+            if (line.compare(0, 3, "cpu") == 0) {
+                CpuTimes times;
+                std::istringstream ss(line);
+                std::string name;
+                ss >> name >> times.user >> times.nice >> times.system >> times.idle
+                   >> times.iowait >> times.irq >> times.softirq >> times.steal;
+                if (name == "cpu") {
+                    currAggregate = times;
+                } else {
+                    currCores.push_back(times);
+                }
+            } else if (line.compare(0, 10, "processes ") == 0) {
+                processes = std::stoi(line.substr(10));
+            }
+        }
+        statFile.close();
+
+        // cores que ficaram online desde a ultima amostra partem do zero
+        prevCoreTimes.resize(currCores.size());
+
+        cpuAggregate = cpuDelta(prevAggregateTimes, currAggregate);
+        cpuCores.resize(currCores.size());
+        for (size_t i = 0; i < currCores.size(); ++i) {
+            cpuCores[i] = cpuDelta(prevCoreTimes[i], currCores[i]);
         }
-        return info.c_str();
+
+        prevAggregateTimes = currAggregate;
+        prevCoreTimes = currCores;
+        cpuProcesses = processes;
+        cpuSampleTime = currentTime;
+        cpuSampled = true;
+
+        aggregate = cpuAggregate;
+        cores = cpuCores;
+        return processes;
     }
 
-    // funcao para obter o percentual de tempo ocioso
-    // da cpu em /proc/stat
-    const char* getCpuIdlePercentage() {
-        static std::string info;
-        info.clear();
+    // uma interface eh considerada fisica quando /sys/class/net/<nome> tem
+    // o link "device" (veth, bridges, tun e lo nao tem)
+    static int isPhysicalInterface(const std::string& name) {
+        struct stat fileStat;
+        return stat(("/sys/class/net/" + name + "/device").c_str(), &fileStat) == 0;
+    }
 
-        std::ifstream statFile("/proc/stat");
-        std::string line;
-        
-        if (statFile.is_open()) {
-            std::getline(statFile, line);  // le a primeira linha com as estatisticas da cpu
-            statFile.close();
+    // interface entra nos totais? com padroes configurados vale a ultima
+    // regra que casar ("!" exclui; uma lista que comeca com exclusao parte
+    // de todas as interfaces). sem padroes, so as interfaces fisicas (ou
+    // todas exceto lo, se nao houver nenhuma fisica)
+    bool networkSelected(const NetInterfaceStats& stats, bool hasPhysical) {
+        if (networkPatterns.empty()) {
+            return hasPhysical ? stats.isPhysical : !stats.isLoopback;
+        }
+        bool selected = networkPatterns.front()[0] == '!';
+        for (const std::string& pattern : networkPatterns) {
+            bool exclude = pattern[0] == '!';
+            if (fnmatch(pattern.c_str() + exclude, stats.name, 0) == 0) {
+                selected = !exclude;
+            }
+        }
+        return selected;
+    }
+
+    // le /proc/net/dev uma unica vez e calcula as taxas de todas as
+    // interfaces sobre o mesmo intervalo. retorna o intervalo em segundos
+    double sampleNetwork(std::vector<NetInterfaceStats>& interfaces) {
+        std::lock_guard<std::mutex> lock(stateMutex);
+
+        auto currentTime = std::chrono::steady_clock::now();
+        std::chrono::duration<double> elapsedSeconds = currentTime - netSampleTime;
+        if (netSampled && elapsedSeconds.count() < NET_MIN_SAMPLE_INTERVAL) {
+            interfaces = netInterfaces;
+            return netInterval;
+        }
+        double elapsed = netSampled ? elapsedSeconds.count() : 0;
+
+        FILE* file = fopen("/proc/net/dev", "r");
+        if (file == NULL) {
+            interfaces.clear();
+            return 0;
+        }
+
+        std::unordered_map<std::string, NetInterfaceStats> current;
+        std::vector<NetInterfaceStats> result;
+        char line[512];
+        while (fgets(line, sizeof(line), file) != NULL) {
+            // as duas primeiras linhas sao cabecalho e nao tem ':'
+            char* colon = strchr(line, ':');
+            if (colon == NULL) {
+                continue;
+            }
+            *colon = '\0';
+            char* name = line + strspn(line, " ");
+
+            NetInterfaceStats stats;
+            memset(&stats, 0, sizeof(stats));
+            unsigned long long rxFifo, rxFrame, rxCompressed, rxMulticast;
+            if (sscanf(colon + 1, "%llu %llu %llu %llu %llu %llu %llu %llu %llu %llu %llu %llu",
+                       &stats.rxBytes, &stats.rxPackets, &stats.rxErrors, &stats.rxDrops,
+                       &rxFifo, &rxFrame, &rxCompressed, &rxMulticast,
+                       &stats.txBytes, &stats.txPackets, &stats.txErrors, &stats.txDrops) != 12) {
+                continue;
+            }
+            strncpy(stats.name, name, NET_NAME_LENGTH - 1);
+            stats.isLoopback = strcmp(stats.name, "lo") == 0;
+            auto kind = netPhysical.find(stats.name);
+            if (kind == netPhysical.end()) {
+                kind = netPhysical.emplace(stats.name, isPhysicalInterface(stats.name)).first;
+            }
+            stats.isPhysical = kind->second;
+
+            auto prev = netPrevCounters.find(stats.name);
+            if (prev != netPrevCounters.end() && elapsed > 0) {
+                const NetInterfaceStats& old = prev->second;
+                // contadores que voltaram (interface recriada) contam como zero
+                auto rate = [elapsed](unsigned long long curr, unsigned long long prev) {
+                    return curr > prev ? (curr - prev) / elapsed : 0.0;
+                };
+                stats.rxRate = rate(stats.rxBytes, old.rxBytes);
+                stats.txRate = rate(stats.txBytes, old.txBytes);
+                stats.rxPacketRate = rate(stats.rxPackets, old.rxPackets);
+                stats.txPacketRate = rate(stats.txPackets, old.txPackets);
+                stats.rxErrorRate = rate(stats.rxErrors, old.rxErrors);
+                stats.txErrorRate = rate(stats.txErrors, old.txErrors);
+                stats.rxDropRate = rate(stats.rxDrops, old.rxDrops);
+                stats.txDropRate = rate(stats.txDrops, old.txDrops);
+            }
+            current[stats.name] = stats;
+            result.push_back(stats);
+        }
+        fclose(file);
+
+        // interfaces que sumiram saem do cache; um nome reaproveitado por
+        // outra interface (veth, tun) eh classificado de novo
+        for (auto it = netPhysical.begin(); it != netPhysical.end();) {
+            if (current.count(it->first) == 0) {
+                it = netPhysical.erase(it);
+            } else {
+                ++it;
+            }
+        }
+
+        bool hasPhysical = std::any_of(result.begin(), result.end(),
+                                       [](const NetInterfaceStats& i) { return i.isPhysical; });
+        for (NetInterfaceStats& stats : result) {
+            stats.selected = networkSelected(stats, hasPhysical);
+        }
+
+        netPrevCounters.swap(current);
+        netInterfaces = result;
+        netInterval = elapsed;
+        netSampleTime = currentTime;
+        netSampled = true;
+
+        interfaces = result;
+        return elapsed;
+    }
+
+    // taxas de recebimento e transmissao (bytes/s) somadas sobre as
+    // interfaces selecionadas, sem lo e sem contar duas vezes o trafego de
+    // containers (veth + bridge + interface fisica)
+    void networkThroughput(double& receiveRate, double& transmitRate) {
+        std::vector<NetInterfaceStats> interfaces;
+        sampleNetwork(interfaces);
+        receiveRate = transmitRate = 0;
+        for (const NetInterfaceStats& stats : interfaces) {
+            if (stats.selected) {
+                receiveRate += stats.rxRate;
+                transmitRate += stats.txRate;
+            }
+        }
+    }
+
+    // padroes (fnmatch) separados por virgula que escolhem as interfaces dos
+    // totais, ex.: "eth*,wl*" ou "!lo,!veth*,!docker*"; vazio volta ao padrao
+    void setNetworkPatterns(const char* patterns) {
+        std::lock_guard<std::mutex> lock(stateMutex);
+        networkPatterns.clear();
+        std::istringstream ss(patterns);
+        std::string pattern;
+        while (std::getline(ss, pattern, ',')) {
+            pattern.erase(0, pattern.find_first_not_of(" "));
+            pattern.erase(pattern.find_last_not_of(" ") + 1);
+            if (!pattern.empty() && pattern != "!") {
+                networkPatterns.push_back(pattern);
+            }
+        }
+        // reaplica a selecao na ultima amostra, sem perder as taxas
+        bool hasPhysical = std::any_of(netInterfaces.begin(), netInterfaces.end(),
+                                       [](const NetInterfaceStats& i) { return i.isPhysical; });
+        for (NetInterfaceStats& stats : netInterfaces) {
+            stats.selected = networkSelected(stats, hasPhysical);
+        }
+    }
+
+    void getNetworkStats(NetworkStats* stats) {
+        memset(stats, 0, sizeof(NetworkStats));
+        std::vector<NetInterfaceStats> interfaces;
+        stats->interval = sampleNetwork(interfaces);
+        stats->interfaceCount = std::min((int)interfaces.size(), NET_MAX_INTERFACES);
+        std::copy(interfaces.begin(), interfaces.begin() + stats->interfaceCount, stats->interfaces);
+    }
+
+    // classifica um dispositivo de bloco pelo /sys/block: discos inteiros
+    // aparecem la (particoes nao) e discos reais tem o link "device"
+    static void classifyBlockDevice(const char* name, int& isPartition, int& isPhysical) {
+        std::string sysName(name);
+        std::replace(sysName.begin(), sysName.end(), '/', '!');
+        std::string base = "/sys/block/" + sysName;
+        struct stat fileStat;
+        isPartition = stat(base.c_str(), &fileStat) != 0;
+        isPhysical = !isPartition && stat((base + "/device").c_str(), &fileStat) == 0;
+    }
+
+    // le /proc/diskstats uma unica vez e calcula, para cada dispositivo ja
+    // usado, vazao, iops e utilizacao no intervalo desde a amostra anterior
+    // (taxas zeradas na primeira). retorna o intervalo em segundos
+    double sampleDisks(std::vector<DiskDeviceStats>& devices) {
+        std::lock_guard<std::mutex> lock(stateMutex);
+
+        auto currentTime = std::chrono::steady_clock::now();
+        std::chrono::duration<double> elapsedSeconds = currentTime - diskSampleTime;
+        if (diskSampled && elapsedSeconds.count() < DISK_MIN_SAMPLE_INTERVAL) {
+            devices = diskDevices;
+            return diskInterval;
+        }
+        double elapsed = diskSampled ? elapsedSeconds.count() : 0;
+
+        FILE* file = fopen("/proc/diskstats", "r");
+        if (file == NULL) {
+            devices.clear();
+            return 0;
+        }
+
+        std::unordered_map<std::string, DiskCounters> currentCounters;
+        std::vector<DiskDeviceStats> result;
+        char line[512];
+        while (fgets(line, sizeof(line), file) != NULL) {
+            unsigned int major, minor;
+            char name[DISK_NAME_LENGTH];
+            DiskCounters counters;
+            unsigned long long readsMerged, readTime, writesMerged, writeTime, inProgress;
+            int fields = sscanf(line, "%u %u %31s %llu %llu %llu %llu %llu %llu %llu %llu %llu %llu",
+                                &major, &minor, name, &counters.reads, &readsMerged, &counters.sectorsRead,
+                                &readTime, &counters.writes, &writesMerged, &counters.sectorsWritten,
+                                &writeTime, &inProgress, &counters.ioTicks);
+            // dispositivos nunca usados (loop, ram...) sao ignorados
+            if (fields < 13 || (counters.reads == 0 && counters.writes == 0)) {
+                continue;
+            }
+            currentCounters[name] = counters;
+
+            DiskDeviceStats stats;
+            memset(&stats, 0, sizeof(stats));
+            strncpy(stats.name, name, DISK_NAME_LENGTH - 1);
+            stats.major = major;
+            stats.minor = minor;
+            auto kind = diskKinds.find(name);
+            if (kind == diskKinds.end()) {
+                int isPartition, isPhysical;
+                classifyBlockDevice(name, isPartition, isPhysical);
+                kind = diskKinds.emplace(name, std::make_pair(isPartition, isPhysical)).first;
+            }
+            stats.isPartition = kind->second.first;
+            stats.isPhysical = kind->second.second;
+            // setores de /proc/diskstats sao sempre de 512 bytes
+            stats.readBytes = counters.sectorsRead * 512;
+            stats.writeBytes = counters.sectorsWritten * 512;
+
+            auto prev = diskPrevCounters.find(name);
+            if (prev != diskPrevCounters.end() && elapsed > 0) {
+                const DiskCounters& old = prev->second;
+                auto delta = [](unsigned long long curr, unsigned long long prev) {
+                    return curr > prev ? (double)(curr - prev) : 0.0;
+                };
+                stats.readRate = delta(counters.sectorsRead, old.sectorsRead) * 512 / elapsed;
+                stats.writeRate = delta(counters.sectorsWritten, old.sectorsWritten) * 512 / elapsed;
+                stats.readIops = delta(counters.reads, old.reads) / elapsed;
+                stats.writeIops = delta(counters.writes, old.writes) / elapsed;
+                stats.utilization = std::min(100.0, delta(counters.ioTicks, old.ioTicks) / (elapsed * 10.0));
+            }
+            result.push_back(stats);
+        }
+        fclose(file);
+
+        diskPrevCounters.swap(currentCounters);
+        diskDevices = result;
+        diskInterval = elapsed;
+        diskSampleTime = currentTime;
+        diskSampled = true;
+
+        devices = result;
+        return elapsed;
+    }
+
+    // vazao total de leitura e escrita (bytes/s) dos discos fisicos; se nao
+    // houver nenhum (ex.: somente dm ou md), soma todos os discos inteiros.
+    // particoes nunca entram, para nao contar o mesmo I/O duas vezes
+    void diskThroughput(double& readRate, double& writeRate) {
+        std::vector<DiskDeviceStats> devices;
+        sampleDisks(devices);
+        bool hasPhysical = std::any_of(devices.begin(), devices.end(),
+                                       [](const DiskDeviceStats& d) { return d.isPhysical; });
+        readRate = writeRate = 0;
+        for (const DiskDeviceStats& device : devices) {
+            if (device.isPartition || (hasPhysical && !device.isPhysical)) {
+                continue;
+            }
+            readRate += device.readRate;
+            writeRate += device.writeRate;
+        }
+    }
+
+    // decodifica os escapes octais de /proc/self/mountinfo (ex.: \040 = espaco)
+    static std::string unescapeMountField(const std::string& field) {
+        std::string result;
+        for (size_t i = 0; i < field.size(); ++i) {
+            if (field[i] == '\\' && i + 3 < field.size() && isdigit(field[i + 1])) {
+                result += (char)strtol(field.substr(i + 1, 3).c_str(), NULL, 8);
+                i += 3;
+            } else {
+                result += field[i];
+            }
+        }
+        return result;
+    }
 
-            // analisa a linha
-            unsigned long long user, nice, system, idle, iowait, irq, softirq, steal;
+    // sistemas de arquivos montados com capacidade (statvfs), sem os
+    // pseudo-sistemas do kernel e sem repetir o mesmo dispositivo
+    // (bind mounts): vale o primeiro ponto de montagem de cada um
+    static void listMounts(std::vector<MountStats>& mounts) {
+        static const char* pseudoTypes[] = {
+            "proc", "sysfs", "cgroup", "cgroup2", "devpts", "mqueue", "debugfs", "tracefs",
+            "securityfs", "pstore", "bpf", "configfs", "fusectl", "hugetlbfs", "autofs",
+            "binfmt_misc", "nsfs", "rpc_pipefs", "efivarfs", "selinuxfs", NULL
+        };
+        mounts.clear();
+        std::ifstream file("/proc/self/mountinfo");
+        std::string line;
+        std::vector<unsigned long long> seenDevices;
+        while (std::getline(file, line)) {
+            // id pai major:minor raiz ponto_de_montagem opcoes [campos opcionais] - tipo origem ...
             std::istringstream ss(line);
-            ss >> line >> user >> nice >> system >> idle >> iowait >> irq >> softirq >> steal;
+            std::string id, parent, device, root, mountPoint, options, field;
+            ss >> id >> parent >> device >> root >> mountPoint >> options;
+            while (ss >> field && field != "-") {}
+            std::string fsType, source;
+            ss >> fsType >> source;
+
+            bool pseudo = false;
+            for (int i = 0; pseudoTypes[i] != NULL; ++i) {
+                pseudo = pseudo || fsType == pseudoTypes[i];
+            }
+            unsigned int major = 0, minor = 0;
+            if (pseudo || sscanf(device.c_str(), "%u:%u", &major, &minor) != 2) {
+                continue;
+            }
+            unsigned long long key = ((unsigned long long)major << 32) | minor;
+            if (std::find(seenDevices.begin(), seenDevices.end(), key) != seenDevices.end()) {
+                continue;
+            }
 
-            // calcula o tempo total da cpu
-            unsigned long long total = user + nice + system + idle + iowait + irq + softirq + steal;
+            mountPoint = unescapeMountField(mountPoint);
+            struct statvfs stat;
+            if (statvfs(mountPoint.c_str(), &stat) != 0 || stat.f_blocks == 0) {
+                continue;
+            }
+            seenDevices.push_back(key);
+
+            MountStats mount;
+            memset(&mount, 0, sizeof(mount));
+            strncpy(mount.mountPoint, mountPoint.c_str(), MOUNT_PATH_LENGTH - 1);
+            strncpy(mount.source, unescapeMountField(source).c_str(), MOUNT_SOURCE_LENGTH - 1);
+            strncpy(mount.fsType, fsType.c_str(), MOUNT_TYPE_LENGTH - 1);
+            mount.major = major;
+            mount.minor = minor;
+            mount.totalBytes = (unsigned long long)stat.f_blocks * stat.f_frsize;
+            mount.usedBytes = mount.totalBytes - (unsigned long long)stat.f_bfree * stat.f_frsize;
+            mount.availableBytes = (unsigned long long)stat.f_bavail * stat.f_frsize;
+            unsigned long long usable = mount.usedBytes + mount.availableBytes;
+            mount.usage = usable > 0 ? 100.0 * mount.usedBytes / usable : 0;
+            mounts.push_back(mount);
+        }
+    }
 
-            // percentual de tempo ocioso
-            double idlePercentage = (double)idle / total * 100.0;
+    // estatisticas de todos os dispositivos de bloco e de todos os sistemas
+    // de arquivos montados em uma unica estrutura
+    void getDiskStats(DiskStats* stats) {
+        memset(stats, 0, sizeof(DiskStats));
+        std::vector<DiskDeviceStats> devices;
+        stats->interval = sampleDisks(devices);
+        stats->deviceCount = std::min((int)devices.size(), DISK_MAX_DEVICES);
+        std::copy(devices.begin(), devices.begin() + stats->deviceCount, stats->devices);
+
+        std::vector<MountStats> mounts;
+        listMounts(mounts);
+        stats->mountCount = std::min((int)mounts.size(), DISK_MAX_MOUNTS);
+        std::copy(mounts.begin(), mounts.begin() + stats->mountCount, stats->mounts);
+    }
 
-            // armazena a saida
-            std::ostringstream idleInfo;
-            idleInfo << idlePercentage << "%";
-            info = idleInfo.str();
+    // funcao para exportar os percentuais de cada core em um vetor de floats
+    // com CPU_STAT_FIELDS valores por core. retorna o numero de cores, que
+    // pode ser maior que maxCores (neste caso o vetor fica incompleto)
+    int getCpuUsagePerCore(float* values, int maxCores) {
+        CpuPercentages aggregate;
+        std::vector<CpuPercentages> cores;
+        sampleCpu(aggregate, cores);
+
+        int count = std::min((int)cores.size(), maxCores);
+        for (int i = 0; i < count; ++i) {
+            values[i * CPU_STAT_FIELDS + 0] = cores[i].busy;
+            values[i * CPU_STAT_FIELDS + 1] = cores[i].iowait;
+            values[i * CPU_STAT_FIELDS + 2] = cores[i].steal;
+            values[i * CPU_STAT_FIELDS + 3] = cores[i].irq;
         }
+        return cores.size();
+    }
+
+    // funcao para calcular e retornar o uso da cpu em percentual
+    std::string getCpuUsage() {
+        CpuPercentages aggregate;
+        std::vector<CpuPercentages> cores;
+        sampleCpu(aggregate, cores);
+
+        std::ostringstream usageInfo;
+        usageInfo << aggregate.busy;
+        return usageInfo.str();
+    }
 
-        return info.c_str();
+    // funcao para obter o percentual de tempo ocioso
+    // da cpu em /proc/stat
+    std::string getCpuIdlePercentage() {
+        CpuPercentages aggregate;
+        std::vector<CpuPercentages> cores;
+        sampleCpu(aggregate, cores);
+
+        std::ostringstream idleInfo;
+        idleInfo << aggregate.idle << "%";
+        return idleInfo.str();
     }
 
     // TODO: pendente
     // funcao para obter o numero de threads em /proc/stat
-    const char* getThreadCount() {
-        static std::string info;
-        info.clear();
+    std::string getThreadCount() {
+        std::string info;
         std::ifstream statFile("/proc/stat");
         std::string line;
         if (statFile.is_open()) {
@@ -203,12 +1029,11 @@ public:
             }
             statFile.close();
         }
-        return info.c_str();
+        return info;
     }
 
-    const char* getUsedDisk() {
-        static std::string info;
-        info.clear();
+    std::string getUsedDisk() {
+        std::string info;
         struct statvfs stat; // statvfs struct
         if (statvfs("/", &stat) == 0) { // obtem informacoes do sistema
             // total de blocos e o tamanho de cada bloco
@@ -223,12 +1048,11 @@ public:
             
             info = diskInfo.str();
         }
-        return info.c_str();
+        return info;
     }
 
-    const char* getFreeDisk() { 
-        static std::string info;
-        info.clear();
+    std::string getFreeDisk() { 
+        std::string info;
         struct statvfs stat; // statvfs struct
         if (statvfs("/", &stat) == 0) { // obtem informacoes do sistema
             // total de blocos e o tamanho de cada bloco
@@ -244,104 +1068,34 @@ public:
         } else {
             info = "Error";
         }
-        return info.c_str();
+        return info;
     }
 
-    // TODO: pendente 
-    // funcao para obter o uso do disco em leitura em /proc/diskstats
-    const char* getDiskRead() {
-        static std::string info;
-        info.clear();
-
-        static unsigned long long prevRead = 0;
-        unsigned long long currRead = 0;
-
-        // le as estatisticas do disco a partir de /proc/diskstats
-        std::ifstream statFile("/proc/diskstats");
-        std::string line;
-        if (statFile.is_open()) {
-            while (std::getline(statFile, line)) {
-                std::istringstream ss(line);
-                std::string device;
-                unsigned long long readSectors;
-
-                // encontra a linha que corresponde ao dispositivo de disco desejado
-                ss >> device; // nome do dispositivo
-                for (int i = 0; i < 3; ++i) ss.ignore(std::numeric_limits<std::streamsize>::max(), ' '); // ignora campos desnecessarios
-                ss >> readSectors; // leitura de setores
-
-                // Para o calculo de uso de leitura, vamos apenas considerar o primeiro dispositivo (geralmente o principal)
-                if (device == "sda" || device == "nvme0n1") {  // considera o dispositivo principal (ajuste conforme necessario)
-                    currRead = readSectors;
-                    break;
-                }
-            }
-            statFile.close();
-        }
-
-        // calcula a diferenca de leitura de setores
-        unsigned long long readDiff = currRead - prevRead;
-        prevRead = currRead;
+    // vazao de leitura dos discos em MB/s (ver diskThroughput)
+    std::string getDiskRead() {
+        double readRate, writeRate;
+        diskThroughput(readRate, writeRate);
 
-        // converte para MB (assumindo que cada setor tem 512 bytes)
-        double readMB = readDiff * 512.0 / (1024 * 1024); // convertendo para MB
         std::ostringstream readInfo;
         readInfo.precision(2);
-        readInfo << std::fixed << readMB; // MB
-        info = readInfo.str();
-
-        return info.c_str();
+        readInfo << std::fixed << readRate / (1024 * 1024); // MB/s
+        return readInfo.str();
     }
 
-    // funcao para obter o uso do disco em escrita em /proc/diskstats
-    const char* getDiskWrite() {
-        static std::string info;
-        info.clear();
-
-        static unsigned long long prevWrite = 0;
-        unsigned long long currWrite = 0;
-
-        // le as estatisticas do disco a partir de /proc/diskstats
-        std::ifstream statFile("/proc/diskstats");
-        std::string line;
-        if (statFile.is_open()) {
-            while (std::getline(statFile, line)) {
-                std::istringstream ss(line);
-                std::string device;
-                unsigned long long writeSectors;
-
-                // encontra a linha que corresponde ao dispositivo de disco desejado
-                ss >> device; // nome do dispositivo
-                for (int i = 0; i < 7; ++i) ss.ignore(std::numeric_limits<std::streamsize>::max(), ' '); // ignora campos desnecessarios
-                ss >> writeSectors; // escrita de setores
-
-                // Para o calculo de uso de escrita, vamos apenas considerar o primeiro dispositivo (geralmente o principal)
-                if (device == "sda" || device == "nvme0n1") {  // considera o dispositivo principal (ajuste conforme necessario)
-                    currWrite = writeSectors;
-                    break;
-                }
-            }
-            statFile.close();
-        }
-
-        // calcula a diferenca de escrita de setores
-        unsigned long long writeDiff = currWrite - prevWrite;
-        prevWrite = currWrite;
+    // vazao de escrita dos discos em MB/s (ver diskThroughput)
+    std::string getDiskWrite() {
+        double readRate, writeRate;
+        diskThroughput(readRate, writeRate);
 
-        // converte para MB (assumindo que cada setor tem 512 bytes)
-        double writeMB = writeDiff * 512.0 / (1024 * 1024); // convertendo para MB
         std::ostringstream writeInfo;
         writeInfo.precision(2);
-        writeInfo << std::fixed << writeMB; // MB
-        info = writeInfo.str();
-
-        return info.c_str();
+        writeInfo << std::fixed << writeRate / (1024 * 1024); // MB/s
+        return writeInfo.str();
     }
 
     // funcao para obter a temperatura da cpu em /sys/class/thermal/thermal_zone0/temp
-    const char* getCpuTemperature() {
-        static std::string info;
-        info.clear();
+    std::string getCpuTemperature() {
+        std::string info;
 
         // tenta abrir o arquivo que contem a temperatura da cpu
         std::ifstream tempFile("/sys/class/thermal/thermal_zone0/temp");
@@ -356,104 +1110,34 @@ public:
             info = tempInfo.str();
         }
 
-        return info.c_str();
+        return info;
     }
 
-    // funcao para obter a taxa de recebimento de rede em /proc/net/dev
-    const char* getNetworkReceiveRate() {
-        static std::string info;
-        info.clear();
-
-        static unsigned long long prevTotalReceived = 0;
-        static auto prevTime = std::chrono::steady_clock::now();
-
-        std::ifstream netFile("/proc/net/dev");
-        if (netFile.is_open()) {
-            std::string line;
-            unsigned long long totalReceived = 0;
-
-            std::getline(netFile, line);
-            std::getline(netFile, line);
-
-            while (std::getline(netFile, line)) {
-                std::istringstream ss(line);
-                std::string iface;
-                unsigned long long received;
-                ss >> iface >> received;
-                totalReceived += received;
-            }
-            netFile.close();
-
-            auto currentTime = std::chrono::steady_clock::now();
-            std::chrono::duration<double> elapsedSeconds = currentTime - prevTime;
-
-            if (elapsedSeconds.count() > 0) {
-                double receiveRate = (totalReceived - prevTotalReceived) / elapsedSeconds.count();
-
-                std::ostringstream netInfo;
-                netInfo.precision(2);
-                netInfo << std::fixed << (receiveRate / 1024);
-                info = netInfo.str();
-            }
-
-            prevTotalReceived = totalReceived;
-            prevTime = currentTime;
-        }
+    // taxa de recebimento das interfaces selecionadas em KB/s
+    std::string getNetworkReceiveRate() {
+        double receiveRate, transmitRate;
+        networkThroughput(receiveRate, transmitRate);
 
-        return info.c_str();
+        std::ostringstream netInfo;
+        netInfo.precision(2);
+        netInfo << std::fixed << (receiveRate / 1024);
+        return netInfo.str();
     }
 
-    // funcao para obter a taxa de transmissao de rede em /proc/net/dev
-    const char* getNetworkTransmitRate() {
-        static std::string info;
-        info.clear();
-
-        static unsigned long long prevTotalTransmitted = 0;
-        static auto prevTime = std::chrono::steady_clock::now();
-
-        std::ifstream netFile("/proc/net/dev");
-        if (netFile.is_open()) {
-            std::string line;
-            unsigned long long totalTransmitted = 0;
-
-            std::getline(netFile, line);
-            std::getline(netFile, line);
-
-            while (std::getline(netFile, line)) {
-                std::istringstream ss(line);
-                std::string iface;
-                unsigned long long transmitted;
-                // avanca 9 campos para chegar ao valor de transmissoes
-                for (int i = 0; i < 9; ++i) ss >> transmitted;
-                totalTransmitted += transmitted;
-            }
-            netFile.close();
-
-            auto currentTime = std::chrono::steady_clock::now();
-            std::chrono::duration<double> elapsedSeconds = currentTime - prevTime;
-
-            if (elapsedSeconds.count() > 0) {
-                double transmitRate = (totalTransmitted - prevTotalTransmitted) / elapsedSeconds.count();
-
-                std::ostringstream netInfo;
-                netInfo.precision(2);
-                netInfo << std::fixed << (transmitRate / 1024);
-                info = netInfo.str();
-            }
-
-            prevTotalTransmitted = totalTransmitted;
-            prevTime = currentTime;
-        } else {
-            info = "Unable to read network stats";
-        }
+    // taxa de transmissao das interfaces selecionadas em KB/s
+    std::string getNetworkTransmitRate() {
+        double receiveRate, transmitRate;
+        networkThroughput(receiveRate, transmitRate);
 
-        return info.c_str();
+        std::ostringstream netInfo;
+        netInfo.precision(2);
+        netInfo << std::fixed << (transmitRate / 1024);
+        return netInfo.str();
     }
 
     // funcao para obter o uso da memoria swap
-    const char* getSwapUsage() {
-        static std::string info;
-        info.clear();
+    std::string getSwapUsage() {
+        std::string info;
 
         struct sysinfo sys_info; // sysinfo struct
         if (sysinfo(&sys_info) == 0) { // obtem informacoes do sistema
@@ -467,39 +1151,47 @@ public:
             info = swapInfo.str();
         }
 
-        return info.c_str();
+        return info;
     }
 
     // funcao para obter informacoes sobre o sistema operacional
-    const char* getOsInfo() {
-        static std::string info;
-        info.clear();
-        struct utsname buffer; // utsname struct
-        if (uname(&buffer) == 0) { // obtem informacoes do sistema
-            std::ostringstream osInfo;
-            osInfo << "OS: " << buffer.sysname << ", Release: " << buffer.release << ", Version: " << buffer.version;
-            info = osInfo.str();
-        }
-        return info.c_str();
+    // (valor imutavel, obtido uma unica vez; ver loadStaticInfo)
+    std::string getOsInfo() {
+        loadStaticInfo();
+        return osInfo;
     }
 
     // funcao para obter informacoes sobre a arquitetura
-    const char* getArchitectureInfo() {
-        static std::string info;
-        info.clear();
-        struct utsname buffer;
-        if (uname(&buffer) == 0) { // obtem informacoes do sistema
-            std::ostringstream archInfo;
-            archInfo << "Architecture: " << buffer.machine;
-            info = archInfo.str();
+    // (valor imutavel, obtido uma unica vez; ver loadStaticInfo)
+    std::string getArchitectureInfo() {
+        loadStaticInfo();
+        return architectureInfo;
+    }
+
+    // funcao para obter o numero de cores configurados
+    // (valor imutavel, obtido uma unica vez; ver loadStaticInfo)
+    int getCoreCount() {
+        loadStaticInfo();
+        return coreCount;
+    }
+
+    // funcao para obter os contadores dos caches de metadados
+    void getCacheStats(CacheStats* stats) {
+        stats->userHits = userCacheHits;
+        stats->userMisses = userCacheMisses;
+        stats->userEvictions = userCacheEvictions;
+        stats->userExpirations = userCacheExpirations;
+        {
+            std::lock_guard<std::mutex> lock(userCacheMutex);
+            stats->userEntries = userCache.size();
         }
-        return info.c_str();
+        stats->staticHits = staticInfoHits;
+        stats->staticMisses = staticInfoMisses;
     }
 
     // funcao para obter uso de cada core da cpu em /proc/cpuinfo
-    const char* getCpuInfo() {
-        static std::string info;
-        info.clear();
+    std::string getCpuInfo() {
+        std::string info;
         std::ifstream cpuFile("/proc/cpuinfo");
         if (cpuFile.is_open()) {
             std::string line;
@@ -517,95 +1209,929 @@ public:
             cpuFile.close();
             info = cpuInfo.str();
         }
-        return info.c_str();
+        return info;
     }
 
-    std::string replaceTabsWithSpaces(const std::string& input) {
-        std::string output = input;
-        std::replace(output.begin(), output.end(), '\t', ' ');
-        return output;
+    // descricao do estado de um processo, como em /proc/[pid]/status
+    static const char* processStateName(char state) {
+        switch (state) {
+            case 'R': return "R (running)";
+            case 'S': return "S (sleeping)";
+            case 'D': return "D (disk sleep)";
+            case 'T': return "T (stopped)";
+            case 't': return "t (tracing stop)";
+            case 'Z': return "Z (zombie)";
+            case 'X': return "X (dead)";
+            case 'I': return "I (idle)";
+            default: return "?";
+        }
     }
 
-    // funcao para obter informacoes detalhadas dos processos 
-    // em /proc e /proc/[pid]/status
-    const char* getProcessesInfo() {
-        static std::string info;
+    // le um arquivo relativo a dirFd com um unico read() para o buffer do
+    // chamador, terminando-o com '\0'. retorna o numero de bytes lidos ou -1
+    static ssize_t readFileAt(int dirFd, const char* path, char* buffer, size_t size) {
+        int fd = openat(dirFd, path, O_RDONLY | O_CLOEXEC);
+        if (fd < 0) {
+            return -1;
+        }
+        ssize_t length = read(fd, buffer, size - 1);
+        close(fd);
+        if (length < 0) {
+            return -1;
+        }
+        buffer[length] = '\0';
+        return length;
+    }
 
-        std::ostringstream processesInfo;
-        processesInfo << "\n";
+    // interpreta o conteudo de /proc/[pid]/stat. o nome (comm) fica entre o
+    // primeiro '(' e o ultimo ')', ja que pode conter espacos e parenteses;
+    // os campos seguintes sao separados por um espaco
+    static bool parseProcStat(const char* buffer, ProcStat& stat) {
+        const char* open = strchr(buffer, '(');
+        const char* close = strrchr(buffer, ')');
+        if (open == NULL || close == NULL || close < open || close[1] != ' ') {
+            return false;
+        }
+        stat.pid = atoi(buffer);
+        stat.comm.assign(open + 1, close - open - 1);
+        stat.state = close[2];
+
+        // campos 4 (ppid) a 24 (rss), numerados como em proc(5)
+        long long fields[25] = {0};
+        const char* p = close + 3;
+        for (int field = 4; field <= 24 && *p; ++field) {
+            char* end;
+            fields[field] = strtoll(p, &end, 10);
+            if (end == p) {
+                return false;
+            }
+            p = (*end == ' ') ? end + 1 : end;
+        }
+        stat.ppid = fields[4];
+        stat.utime = fields[14];
+        stat.stime = fields[15];
+        stat.priority = fields[18];
+        stat.nice = fields[19];
+        stat.numThreads = fields[20];
+        stat.startTime = fields[22];
+        stat.vsize = fields[23];  // bytes
+        stat.rss = fields[24];    // paginas
+
+        // campo 39 (processor); kernels antigos podem nao ter todos os campos
+        for (int field = 25; field <= 39 && *p; ++field) {
+            char* end;
+            unsigned long long value = strtoull(p, &end, 10);
+            if (end == p) {
+                break;
+            }
+            if (field == 39) {
+                stat.processor = value;
+            }
+            p = (*end == ' ') ? end + 1 : end;
+        }
+        return true;
+    }
+
+    // nome do usuario de um uid. as consultas ao NSS (que podem ir a um
+    // servidor LDAP/SSSD) ficam em um cache LRU de USER_CACHE_CAPACITY
+    // entradas, validas por USER_CACHE_TTL segundos
+    std::string userName(uid_t uid) {
+        auto now = std::chrono::steady_clock::now();
+        {
+            std::lock_guard<std::mutex> lock(userCacheMutex);
+            auto cached = userCache.find(uid);
+            if (cached != userCache.end()) {
+                if (now < cached->second.expiry) {
+                    // move a entrada para o inicio da lista (mais recente)
+                    userCacheOrder.splice(userCacheOrder.begin(), userCacheOrder, cached->second.position);
+                    ++userCacheHits;
+                    return cached->second.name;
+                }
+                userCacheOrder.erase(cached->second.position);
+                userCache.erase(cached);
+                ++userCacheExpirations;
+            }
+        }
+        ++userCacheMisses;
+
+        // getpwuid_r eh reentrante, ao contrario de getpwuid
+        std::string name = "Unknown"; // se nao encontrar o usuario
+        struct passwd pwd;
+        struct passwd *pw = NULL;
+        char pwBuffer[1024];
+        getpwuid_r(uid, &pwd, pwBuffer, sizeof(pwBuffer), &pw);
+        if (pw != NULL) {
+            name = pw->pw_name; // nome do usuario
+        }
+
+        std::lock_guard<std::mutex> lock(userCacheMutex);
+        if (userCache.find(uid) == userCache.end()) {
+            // descarta a entrada usada ha mais tempo
+            if (userCache.size() >= USER_CACHE_CAPACITY) {
+                userCache.erase(userCacheOrder.back());
+                userCacheOrder.pop_back();
+                ++userCacheEvictions;
+            }
+            userCacheOrder.push_front(uid);
+            UserCacheEntry entry;
+            entry.name = name;
+            entry.expiry = now + std::chrono::seconds(USER_CACHE_TTL);
+            entry.position = userCacheOrder.begin();
+            userCache[uid] = entry;
+        }
+        return name;
+    }
+
+    // esvazia o cache de usuarios (ex.: apos mudancas no NSS)
+    void clearUserCache() {
+        std::lock_guard<std::mutex> lock(userCacheMutex);
+        userCache.clear();
+        userCacheOrder.clear();
+    }
+
+    // lista os pids presentes em /proc
+    void listPids(std::vector<int>& pids) {
+        pids.clear();
 
-        DIR* dir = opendir("/proc");
+        // o DIR usa uma copia do descritor para nao disputar a posicao de
+        // leitura com outras threads
+        int dirFd = procFd >= 0 ? dup(procFd) : -1;
+        DIR* dir = dirFd >= 0 ? fdopendir(dirFd) : NULL;
         if (!dir) {
+            if (dirFd >= 0) close(dirFd);
             perror("Nao foi possivel abrir /proc");
-            return "";
+            return;
         }
+        rewinddir(dir);
 
         struct dirent* entry; // estrutura para armazenar informacoes sobre um diretorio
         while ((entry = readdir(dir)) != NULL) {
-            if (entry->d_type == DT_DIR) {
-                int pid = atoi(entry->d_name);
-                if (pid > 0) {
-                    std::string processDir = std::string("/proc/") + entry->d_name;
-                    std::string statusPath = processDir + "/status";
-                    
-                    std::ifstream statusFile(statusPath);
-                    if (statusFile.is_open()) {
-                        std::string line;
-                        std::string ppid;
-                        std::string name;
-                        std::string threads = "0"; // inicializa threads com "0"
-                        std::string state;
-                        unsigned long vsize = 0;   // memoria virtual
-                        long rss = 0;              // memoria fisica
-                        std::string userName;
-
-                        while (std::getline(statusFile, line)) {
-                            line = replaceTabsWithSpaces(line);
-                            if (line.find("PPid:") == 0) {
-                                ppid = line.substr(line.find(":") + 2);
-                            }
-                            if (line.find("Name:") == 0) {
-                                name = line.substr(line.find(":") + 2);
-                            }
-                            if (line.find("State:") == 0) {
-                                state = line.substr(line.find(":") + 2);
-                            }
-                            if (line.find("Threads:") == 0) {
-                                threads = line.substr(line.find(":") + 2);
-                            }
-                            if (line.find("VmSize:") == 0) {
-                                vsize = std::stoul(line.substr(line.find(":") + 2)) / 1024; // em KB
-                            }
-                            if (line.find("VmRSS:") == 0) {
-                                rss = std::stol(line.substr(line.find(":") + 2)) / 1024; // em KB
-                            }
-                            if (line.find("Uid:") == 0) {
-                                // obtem o uid do processo
-                                std::string uid = line.substr(line.find(":") + 2);
-                                uid = replaceTabsWithSpaces(uid); // remove espacos extras
-                                struct passwd *pw = getpwuid(std::stoi(uid));
-                                if (pw != NULL) {
-                                    userName = pw->pw_name; // nome do usuario
-                                }
-                                else {
-                                    userName = "Unknown"; // se nao encontrar o usuario
-                                }
-                            }
-                        }
-                        processesInfo << pid << "\t" << ppid << "\t" << name << "\t" << userName << "\t" << state << "\t" 
-                                    << threads << "\t" << vsize << "\t" << rss << "\n";
-                        statusFile.close();
-                    }
-                }
+            if (entry->d_type == DT_DIR && entry->d_name[0] >= '1' && entry->d_name[0] <= '9') {
+                pids.push_back(atoi(entry->d_name));
             }
         }
         closedir(dir);
-        
-        info = processesInfo.str();
-        return info.c_str();
     }
 
-    const int killProcess(int pid) {
+    // read_bytes e write_bytes de /proc/[pid]/io (so legivel para processos
+    // do mesmo usuario ou com privilegios; senao os contadores ficam em zero)
+    bool readProcessIo(int pid, unsigned long long& readBytes, unsigned long long& writeBytes) {
+        char buffer[1024];
+        char path[32];
+        snprintf(path, sizeof(path), "%d/io", pid);
+        if (readFileAt(procFd, path, buffer, sizeof(buffer)) <= 0) {
+            return false;
+        }
+        const char* readField = strstr(buffer, "read_bytes: ");
+        const char* writeField = strstr(buffer, "\nwrite_bytes: ");
+        if (readField == NULL || writeField == NULL) {
+            return false;
+        }
+        readBytes = strtoull(readField + 12, NULL, 10);
+        writeBytes = strtoull(writeField + 14, NULL, 10);
+        return true;
+    }
+
+    // preenche um registro por pid da lista. nomes de processo e de usuario
+    // vao para o bloco de strings, referenciados por offset/tamanho. cada
+    // processo custa um fstatat (dono do diretorio = uid) e um openat/read
+    // de /proc/[pid]/stat e /proc/[pid]/io, relativos ao descritor de /proc.
+    // os contadores de cpu e I/O de cada registro vao para `counters`
+    void scanPids(const int* pids, size_t count, std::vector<ProcessRecord>& records,
+                  std::vector<ProcessCounters>& counters, std::string& strings) {
+        static const long pageSizeKB = sysconf(_SC_PAGESIZE) / 1024;
+        char buffer[4096];
+        char path[32];
+        ProcStat stat;
+
+        for (size_t i = 0; i < count; ++i) {
+            struct stat dirStat;
+            snprintf(path, sizeof(path), "%d", pids[i]);
+            if (fstatat(procFd, path, &dirStat, 0) != 0) {
+                continue; // o processo terminou
+            }
+            snprintf(path, sizeof(path), "%d/stat", pids[i]);
+            if (readFileAt(procFd, path, buffer, sizeof(buffer)) <= 0 || !parseProcStat(buffer, stat)) {
+                continue;
+            }
+
+            ProcessRecord record;
+            memset(&record, 0, sizeof(record));
+            record.pid = stat.pid;
+            record.ppid = stat.ppid;
+            record.uid = dirStat.st_uid;
+            record.threads = stat.numThreads;
+            record.vsize = stat.vsize / 1024;        // em KB
+            record.rss = stat.rss * pageSizeKB;      // em KB
+            record.state = stat.state;
+
+            std::string user = userName(dirStat.st_uid);
+            record.nameOffset = strings.size();
+            record.nameLength = stat.comm.size();
+            strings += stat.comm;
+            record.userOffset = strings.size();
+            record.userLength = user.size();
+            strings += user;
+
+            ProcessCounters processCounters;
+            processCounters.startTime = stat.startTime;
+            processCounters.cpuTicks = stat.utime + stat.stime;
+            readProcessIo(stat.pid, processCounters.readBytes, processCounters.writeBytes);
+
+            records.push_back(record);
+            counters.push_back(processCounters);
+        }
+    }
+
+    // calcula cpu% e taxas de I/O de cada registro comparando os contadores
+    // com os da leitura anterior do mesmo processo, identificado por (pid,
+    // starttime) para nao confundir pids reutilizados. o mapa eh refeito a
+    // cada leitura, entao processos que terminaram saem dele
+    void updateProcessRates(std::vector<ProcessRecord>& records, const std::vector<ProcessCounters>& counters) {
+        static const double ticksPerSecond = sysconf(_SC_CLK_TCK);
+        std::lock_guard<std::mutex> lock(processRatesMutex);
+
+        auto currentTime = std::chrono::steady_clock::now();
+        std::chrono::duration<double> elapsedSeconds = currentTime - processSampleTime;
+        double elapsed = elapsedSeconds.count();
+        // leituras muito proximas repetem as taxas anteriores
+        bool reuse = processSampled && elapsed < PROCESS_MIN_SAMPLE_INTERVAL;
+
+        std::unordered_map<int, ProcessCounters> current;
+        current.reserve(records.size());
+        for (size_t i = 0; i < records.size(); ++i) {
+            ProcessRecord& record = records[i];
+            ProcessCounters sample = counters[i];
+            auto prev = processCounters.find(record.pid);
+            bool sameProcess = prev != processCounters.end() && prev->second.startTime == sample.startTime;
+            if (sameProcess && reuse) {
+                sample = prev->second;
+            } else if (sameProcess && elapsed > 0) {
+                const ProcessCounters& old = prev->second;
+                auto rate = [elapsed](unsigned long long curr, unsigned long long prev) {
+                    return curr > prev ? (curr - prev) / elapsed : 0.0;
+                };
+                sample.cpuUsage = rate(sample.cpuTicks, old.cpuTicks) / ticksPerSecond * 100.0;
+                sample.readRate = rate(sample.readBytes, old.readBytes);
+                sample.writeRate = rate(sample.writeBytes, old.writeBytes);
+            }
+            record.cpuUsage = sample.cpuUsage;
+            record.readRate = sample.readRate;
+            record.writeRate = sample.writeRate;
+            current[record.pid] = sample;
+        }
+
+        if (reuse) {
+            // mantem a base das taxas; so acrescenta os processos novos
+            for (auto& entry : current) {
+                processCounters.emplace(entry.first, entry.second);
+            }
+            return;
+        }
+        processCounters.swap(current);
+        processSampleTime = currentTime;
+        processSampled = true;
+    }
+
+    // percorre /proc e preenche um registro por processo. com mais de um
+    // worker configurado (setProcessScanWorkers), a lista de pids eh dividida
+    // entre threads e os resultados sao unidos na ordem original
+    void scanProcesses(std::vector<ProcessRecord>& records, std::string& strings) {
+        records.clear();
+        strings.clear();
+
+        std::vector<int> pids;
+        listPids(pids);
+        std::vector<ProcessCounters> counters;
+
+        size_t workers = std::min<size_t>(processScanWorkers, pids.size() / PROCESS_SCAN_MIN_CHUNK);
+        if (workers <= 1) {
+            scanPids(pids.data(), pids.size(), records, counters, strings);
+            updateProcessRates(records, counters);
+            return;
+        }
+
+        std::vector<std::vector<ProcessRecord>> chunkRecords(workers);
+        std::vector<std::vector<ProcessCounters>> chunkCounters(workers);
+        std::vector<std::string> chunkStrings(workers);
+        std::vector<std::thread> threads;
+        size_t chunkSize = (pids.size() + workers - 1) / workers;
+        for (size_t w = 0; w < workers; ++w) {
+            size_t begin = std::min(pids.size(), w * chunkSize);
+            size_t count = std::min(pids.size() - begin, chunkSize);
+            threads.emplace_back(&SystemInfo::scanPids, this, pids.data() + begin, count,
+                                 std::ref(chunkRecords[w]), std::ref(chunkCounters[w]), std::ref(chunkStrings[w]));
+        }
+        for (std::thread& thread : threads) {
+            thread.join();
+        }
+
+        // junta os resultados ajustando os offsets do bloco de strings
+        records.reserve(pids.size());
+        counters.reserve(pids.size());
+        for (size_t w = 0; w < workers; ++w) {
+            unsigned int base = strings.size();
+            for (ProcessRecord& record : chunkRecords[w]) {
+                record.nameOffset += base;
+                record.userOffset += base;
+                records.push_back(record);
+            }
+            counters.insert(counters.end(), chunkCounters[w].begin(), chunkCounters[w].end());
+            strings += chunkStrings[w];
+        }
+        updateProcessRates(records, counters);
+    }
+
+    // define quantas threads o leitor de processos pode usar (1 = sequencial)
+    void setProcessScanWorkers(int workers) {
+        processScanWorkers = std::max(1, workers);
+    }
+
+    // funcao para obter informacoes detalhadas dos processos 
+    // em /proc e /proc/[pid]/status
+    std::string getProcessesInfo() {
+        std::vector<ProcessRecord> records;
+        std::string strings;
+        scanProcesses(records, strings);
+
+        std::ostringstream processesInfo;
+        processesInfo << "\n";
+        for (const ProcessRecord& record : records) {
+            processesInfo << record.pid << "\t" << record.ppid << "\t"
+                          << strings.substr(record.nameOffset, record.nameLength) << "\t"
+                          << strings.substr(record.userOffset, record.userLength) << "\t"
+                          << processStateName(record.state) << "\t" << record.threads << "\t"
+                          << record.vsize / 1024 << "\t" << record.rss / 1024 << "\n";
+        }
+        return processesInfo.str();
+    }
+
+    // funcao para exportar a tabela de processos em formato binario: um vetor
+    // de registros de tamanho fixo e um bloco de strings. retorna o numero de
+    // processos; se for maior que maxRecords, ou se *stringsLength for maior
+    // que stringsCapacity, o chamador deve repetir com buffers maiores
+    int getProcessTable(ProcessRecord* records, int maxRecords,
+                        char* strings, size_t stringsCapacity, size_t* stringsLength) {
+        std::vector<ProcessRecord> scanned;
+        std::string scannedStrings;
+        scanProcesses(scanned, scannedStrings);
+        storeLastScan(scanned, scannedStrings);
+
+        *stringsLength = scannedStrings.size();
+        if ((int)scanned.size() <= maxRecords && scannedStrings.size() <= stringsCapacity) {
+            memcpy(records, scanned.data(), scanned.size() * sizeof(ProcessRecord));
+            memcpy(strings, scannedStrings.data(), scannedStrings.size());
+        }
+        return scanned.size();
+    }
+
+    // le apenas os processos da lista (ex.: os que acabaram de iniciar,
+    // avisados por readProcessEvents), sem listar /proc. as taxas nao sao
+    // recalculadas: processos ja conhecidos mantem as da ultima leitura
+    // completa e os novos entram na base da proxima, com taxas zeradas.
+    // retorno e buffers como em getProcessTable
+    int getProcessRecords(const int* pids, int count, ProcessRecord* records, int maxRecords,
+                          char* strings, size_t stringsCapacity, size_t* stringsLength) {
+        std::vector<ProcessRecord> scanned;
+        std::vector<ProcessCounters> counters;
+        std::string scannedStrings;
+        scanPids(pids, count, scanned, counters, scannedStrings);
+        {
+            std::lock_guard<std::mutex> lock(processRatesMutex);
+            for (size_t i = 0; i < scanned.size(); ++i) {
+                auto known = processCounters.emplace(scanned[i].pid, counters[i]).first;
+                if (known->second.startTime == counters[i].startTime) {
+                    scanned[i].cpuUsage = known->second.cpuUsage;
+                    scanned[i].readRate = known->second.readRate;
+                    scanned[i].writeRate = known->second.writeRate;
+                }
+            }
+        }
+
+        *stringsLength = scannedStrings.size();
+        if ((int)scanned.size() <= maxRecords && scannedStrings.size() <= stringsCapacity) {
+            memcpy(records, scanned.data(), scanned.size() * sizeof(ProcessRecord));
+            memcpy(strings, scannedStrings.data(), scannedStrings.size());
+        }
+        return scanned.size();
+    }
+
+    // assina o conector de processos do netlink. so funciona com
+    // CAP_NET_ADMIN no namespace inicial: sem isso o bind ao grupo ou a
+    // confirmacao do pedido de escuta falham e retorna -1
+    static int openProcessConnector() {
+        int sock = socket(PF_NETLINK, SOCK_DGRAM | SOCK_NONBLOCK | SOCK_CLOEXEC, NETLINK_CONNECTOR);
+        if (sock < 0) {
+            return -1;
+        }
+        struct sockaddr_nl address;
+        memset(&address, 0, sizeof(address));
+        address.nl_family = AF_NETLINK;
+        address.nl_groups = CN_IDX_PROC;
+        int bufferSize = 4 * 1024 * 1024;  // rajadas de fork sem perder eventos
+        setsockopt(sock, SOL_SOCKET, SO_RCVBUF, &bufferSize, sizeof(bufferSize));
+        if (bind(sock, (struct sockaddr*)&address, sizeof(address)) != 0
+                || !sendConnectorOp(sock, PROC_CN_MCAST_LISTEN)) {
+            close(sock);
+            return -1;
+        }
+
+        // o kernel responde ao pedido com um evento PROC_EVENT_NONE (ack.err)
+        char buffer[4096];
+        struct pollfd ready = {sock, POLLIN, 0};
+        while (poll(&ready, 1, 200) > 0) {
+            ssize_t length = recv(sock, buffer, sizeof(buffer), 0);
+            if (length <= 0) {
+                break;
+            }
+            for (struct nlmsghdr* header = (struct nlmsghdr*)buffer; NLMSG_OK(header, length);
+                 header = NLMSG_NEXT(header, length)) {
+                struct cn_msg* message = (struct cn_msg*)NLMSG_DATA(header);
+                struct proc_event* event = (struct proc_event*)message->data;
+                if ((unsigned int)event->what == CONNECTOR_EVENT_NONE) {
+                    if (event->event_data.ack.err == 0) {
+                        return sock;
+                    }
+                    close(sock);
+                    return -1;
+                }
+            }
+        }
+        close(sock);
+        return -1;
+    }
+
+    static bool sendConnectorOp(int sock, enum proc_cn_mcast_op op) {
+        char buffer[NLMSG_SPACE(sizeof(struct cn_msg) + sizeof(op))];
+        memset(buffer, 0, sizeof(buffer));
+        struct nlmsghdr* header = (struct nlmsghdr*)buffer;
+        header->nlmsg_len = NLMSG_LENGTH(sizeof(struct cn_msg) + sizeof(op));
+        header->nlmsg_type = NLMSG_DONE;
+        header->nlmsg_pid = 0;
+        struct cn_msg* message = (struct cn_msg*)NLMSG_DATA(header);
+        message->id.idx = CN_IDX_PROC;
+        message->id.val = CN_VAL_PROC;
+        message->len = sizeof(op);
+        memcpy(message->data, &op, sizeof(op));
+        return send(sock, buffer, header->nlmsg_len, 0) == (ssize_t)header->nlmsg_len;
+    }
+
+    // inicia a fonte de eventos de processos: o conector do netlink
+    // (inicios, execs e saidas) se permitido, senao pidfds dos processos
+    // passados a watchProcesses (so saidas). retorna o PROCESS_EVENTS_*
+    // obtido; PROCESS_EVENTS_SCAN significa que nao ha eventos e o chamador
+    // continua relendo /proc. `preferred` limita a escolha (ex.: PIDFD pula
+    // o netlink; SCAN desliga os eventos)
+    int startProcessEvents(int preferred) {
+        std::lock_guard<std::mutex> lock(processEventsMutex);
+        stopProcessEventsLocked();
+        if (preferred == PROCESS_EVENTS_NETLINK || preferred < 0) {
+            processEventsFd = openProcessConnector();
+            if (processEventsFd >= 0) {
+                processEventsMode = PROCESS_EVENTS_NETLINK;
+                return processEventsMode;
+            }
+        }
+        if (preferred == PROCESS_EVENTS_PIDFD || preferred < 0) {
+            // pidfd_open existe a partir do linux 5.3
+            int probe = syscall(SYS_pidfd_open, getpid(), 0);
+            if (probe >= 0) {
+                close(probe);
+                processEventsFd = epoll_create1(EPOLL_CLOEXEC);
+                if (processEventsFd >= 0) {
+                    processEventsMode = PROCESS_EVENTS_PIDFD;
+                    return processEventsMode;
+                }
+            }
+        }
+        processEventsMode = PROCESS_EVENTS_SCAN;
+        return processEventsMode;
+    }
+
+    // no modo pidfd, passa a observar os pids da lista que ainda nao sao
+    // observados (tipicamente os de cada releitura completa). os pidfds
+    // usam no maximo metade do limite de descritores (RLIMIT_NOFILE), para
+    // nao faltar descritores ao resto do programa; os processos alem disso
+    // so sao vistos pela releitura. retorna quantos processos sao observados
+    int watchProcesses(const int* pids, int count) {
+        std::lock_guard<std::mutex> lock(processEventsMutex);
+        if (processEventsMode != PROCESS_EVENTS_PIDFD) {
+            return 0;
+        }
+        struct rlimit limit;
+        size_t maxWatched = getrlimit(RLIMIT_NOFILE, &limit) == 0 && limit.rlim_cur != RLIM_INFINITY
+                            ? limit.rlim_cur / 2 : 4096;
+        for (int i = 0; i < count && watchedPids.size() < maxWatched; ++i) {
+            if (watchedPids.count(pids[i])) {
+                continue;
+            }
+            int pidFd = syscall(SYS_pidfd_open, pids[i], 0);
+            if (pidFd < 0) {
+                if (errno == EMFILE || errno == ENFILE) {
+                    break;
+                }
+                continue;  // o processo ja terminou
+            }
+            struct epoll_event event;
+            event.events = EPOLLIN;
+            event.data.u64 = ((unsigned long long)(unsigned int)pidFd << 32) | (unsigned int)pids[i];
+            if (epoll_ctl(processEventsFd, EPOLL_CTL_ADD, pidFd, &event) != 0) {
+                close(pidFd);
+                continue;
+            }
+            watchedPids[pids[i]] = pidFd;
+        }
+        return watchedPids.size();
+    }
+
+    // converte uma mensagem do conector em eventos; threads sao ignoradas
+    void queueConnectorEvent(const struct proc_event* event) {
+        ProcessEvent processEvent = {0, 0, 0, -1};
+        switch ((unsigned int)event->what) {
+            case CONNECTOR_EVENT_FORK:
+                if (event->event_data.fork.child_pid != event->event_data.fork.child_tgid) {
+                    return;
+                }
+                processEvent.type = PROCESS_EVENT_START;
+                processEvent.pid = event->event_data.fork.child_tgid;
+                processEvent.ppid = event->event_data.fork.parent_tgid;
+                break;
+            case CONNECTOR_EVENT_EXEC:
+                processEvent.type = PROCESS_EVENT_CHANGE;
+                processEvent.pid = event->event_data.exec.process_tgid;
+                break;
+            case CONNECTOR_EVENT_COMM:
+                if (event->event_data.comm.process_pid != event->event_data.comm.process_tgid) {
+                    return;
+                }
+                processEvent.type = PROCESS_EVENT_CHANGE;
+                processEvent.pid = event->event_data.comm.process_tgid;
+                break;
+            case CONNECTOR_EVENT_EXIT:
+                if (event->event_data.exit.process_pid != event->event_data.exit.process_tgid) {
+                    return;
+                }
+                processEvent.type = PROCESS_EVENT_EXIT;
+                processEvent.pid = event->event_data.exit.process_tgid;
+                processEvent.exitCode = event->event_data.exit.exit_code;
+                break;
+            default:
+                return;
+        }
+        if (pendingProcessEvents.size() >= PROCESS_EVENTS_MAX_PENDING) {
+            processEventsLost = true;
+            return;
+        }
+        pendingProcessEvents.push_back(processEvent);
+    }
+
+    // le os eventos disponiveis (esperando ate timeoutMs pelo primeiro) e
+    // copia ate maxEvents; o restante fica para a proxima chamada. retorna
+    // o numero de eventos, ou -1 se eventos foram perdidos (buffer do socket
+    // ou fila cheios) e o chamador deve reler /proc por completo
+    int readProcessEvents(ProcessEvent* events, int maxEvents, int timeoutMs) {
+        std::lock_guard<std::mutex> lock(processEventsMutex);
+        if (processEventsMode == PROCESS_EVENTS_NETLINK && pendingProcessEvents.empty()) {
+            struct pollfd ready = {processEventsFd, POLLIN, 0};
+            if (timeoutMs > 0) {
+                poll(&ready, 1, timeoutMs);
+            }
+            char buffer[8192];
+            ssize_t length;
+            while ((length = recv(processEventsFd, buffer, sizeof(buffer), 0)) != 0) {
+                if (length < 0) {
+                    if (errno == ENOBUFS) {
+                        processEventsLost = true;
+                        continue;
+                    }
+                    break;  // EAGAIN: nada mais a ler
+                }
+                for (struct nlmsghdr* header = (struct nlmsghdr*)buffer; NLMSG_OK(header, length);
+                     header = NLMSG_NEXT(header, length)) {
+                    struct cn_msg* message = (struct cn_msg*)NLMSG_DATA(header);
+                    queueConnectorEvent((struct proc_event*)message->data);
+                }
+            }
+        } else if (processEventsMode == PROCESS_EVENTS_PIDFD && pendingProcessEvents.empty()) {
+            struct epoll_event ready[256];
+            int count = epoll_wait(processEventsFd, ready, 256, std::max(timeoutMs, 0));
+            for (int i = 0; i < count; ++i) {
+                int pid = (int)(ready[i].data.u64 & 0xffffffffu);
+                int pidFd = (int)(ready[i].data.u64 >> 32);
+                epoll_ctl(processEventsFd, EPOLL_CTL_DEL, pidFd, NULL);
+                close(pidFd);
+                watchedPids.erase(pid);
+                pendingProcessEvents.push_back({PROCESS_EVENT_EXIT, pid, 0, -1});
+            }
+        }
+
+        if (processEventsLost) {
+            processEventsLost = false;
+            pendingProcessEvents.clear();
+            return -1;
+        }
+        int count = std::min<size_t>(std::max(maxEvents, 0), pendingProcessEvents.size());
+        std::copy(pendingProcessEvents.begin(), pendingProcessEvents.begin() + count, events);
+        pendingProcessEvents.erase(pendingProcessEvents.begin(), pendingProcessEvents.begin() + count);
+        return count;
+    }
+
+    void stopProcessEvents() {
+        std::lock_guard<std::mutex> lock(processEventsMutex);
+        stopProcessEventsLocked();
+    }
+
+    void stopProcessEventsLocked() {
+        if (processEventsMode == PROCESS_EVENTS_NETLINK) {
+            sendConnectorOp(processEventsFd, PROC_CN_MCAST_IGNORE);
+        }
+        for (auto& watched : watchedPids) {
+            close(watched.second);
+        }
+        watchedPids.clear();
+        if (processEventsFd >= 0) {
+            close(processEventsFd);
+            processEventsFd = -1;
+        }
+        pendingProcessEvents.clear();
+        processEventsLost = false;
+        processEventsMode = PROCESS_EVENTS_SCAN;
+    }
+
+    // guarda a ultima leitura completa de /proc para recentProcessTable
+    void storeLastScan(const std::vector<ProcessRecord>& records, const std::string& strings) {
+        std::lock_guard<std::mutex> lock(lastScanMutex);
+        lastScanRecords = records;
+        lastScanStrings = strings;
+        lastScanTime = std::chrono::steady_clock::now();
+        lastScanValid = true;
+    }
+
+    // a ultima leitura completa (de getProcessTable ou de uma chamada
+    // anterior) se tiver menos de PROCESS_TABLE_MAX_AGE; senao uma nova. assim
+    // consultas frequentes como o painel de top processos nao percorrem /proc
+    // a cada chamada, e com a janela de processos aberta usam a leitura dela
+    void recentProcessTable(std::vector<ProcessRecord>& records, std::string& strings) {
+        {
+            std::lock_guard<std::mutex> lock(lastScanMutex);
+            std::chrono::duration<double> age = std::chrono::steady_clock::now() - lastScanTime;
+            if (lastScanValid && age.count() < PROCESS_TABLE_MAX_AGE) {
+                records = lastScanRecords;
+                strings = lastScanStrings;
+                return;
+            }
+        }
+        scanProcesses(records, strings);
+        storeLastScan(records, strings);
+    }
+
+    // valor de um registro para a ordenacao de getTopProcesses
+    static double processSortValue(const ProcessRecord& record, int sortKey) {
+        switch (sortKey) {
+            case PROCESS_SORT_RSS: return record.rss;
+            case PROCESS_SORT_VSIZE: return record.vsize;
+            case PROCESS_SORT_IO: return record.readRate + record.writeRate;
+            case PROCESS_SORT_THREADS: return record.threads;
+            default: return record.cpuUsage;
+        }
+    }
+
+    // os `n` maiores processos por `sortKey`, em ordem decrescente, sem
+    // exportar a tabela inteira e sem reler /proc se houver uma leitura
+    // recente (recentProcessTable): a selecao parcial (nth_element) e a
+    // ordenacao so dos n escolhidos sao feitas aqui, e o bloco de strings
+    // so leva os nomes desses registros. filter, se nao vazio, eh um padrao
+    // fnmatch comparado com o nome do processo e com o do usuario. retorna o
+    // numero de registros; se *stringsLength for maior que stringsCapacity,
+    // o chamador deve repetir com um buffer maior
+    int getTopProcesses(int sortKey, int n, const char* filter, ProcessRecord* records,
+                        char* strings, size_t stringsCapacity, size_t* stringsLength) {
+        std::vector<ProcessRecord> scanned;
+        std::string scannedStrings;
+        recentProcessTable(scanned, scannedStrings);
+
+        if (filter != NULL && filter[0] != '\0') {
+            auto rejected = [&](const ProcessRecord& record) {
+                std::string name = scannedStrings.substr(record.nameOffset, record.nameLength);
+                std::string user = scannedStrings.substr(record.userOffset, record.userLength);
+                return fnmatch(filter, name.c_str(), 0) != 0 && fnmatch(filter, user.c_str(), 0) != 0;
+            };
+            scanned.erase(std::remove_if(scanned.begin(), scanned.end(), rejected), scanned.end());
+        }
+
+        // empates sao desfeitos pelo pid para a ordem ser estavel entre chamadas
+        auto greater = [sortKey](const ProcessRecord& a, const ProcessRecord& b) {
+            double valueA = processSortValue(a, sortKey), valueB = processSortValue(b, sortKey);
+            return valueA != valueB ? valueA > valueB : a.pid < b.pid;
+        };
+        size_t count = std::min<size_t>(std::max(n, 0), scanned.size());
+        if (count < scanned.size()) {
+            std::nth_element(scanned.begin(), scanned.begin() + count, scanned.end(), greater);
+        }
+        std::sort(scanned.begin(), scanned.begin() + count, greater);
+
+        std::string selectedStrings;
+        for (size_t i = 0; i < count; ++i) {
+            ProcessRecord record = scanned[i];
+            record.nameOffset = selectedStrings.size();
+            selectedStrings += scannedStrings.substr(scanned[i].nameOffset, scanned[i].nameLength);
+            record.userOffset = selectedStrings.size();
+            selectedStrings += scannedStrings.substr(scanned[i].userOffset, scanned[i].userLength);
+            records[i] = record;
+        }
+
+        *stringsLength = selectedStrings.size();
+        if (selectedStrings.size() <= stringsCapacity) {
+            memcpy(strings, selectedStrings.data(), selectedStrings.size());
+        }
+        return count;
+    }
+
+    // ppid, starttime e (opcionalmente) estado de um processo (de /proc/[pid]/stat)
+    bool readParentAndStart(int pid, int& ppid, unsigned long long& startTime, char* state = NULL) {
+        char buffer[4096];
+        char path[32];
+        ProcStat stat;
+        snprintf(path, sizeof(path), "%d/stat", pid);
+        if (readFileAt(procFd, path, buffer, sizeof(buffer)) <= 0 || !parseProcStat(buffer, stat)) {
+            return false;
+        }
+        ppid = stat.ppid;
+        startTime = stat.startTime;
+        if (state != NULL) {
+            *state = stat.state;
+        }
+        return true;
+    }
+
+    // acrescenta a `targets` todos os descendentes dos alvos, a partir de
+    // uma leitura de /proc. retorna quantos foram novos
+    size_t addDescendants(std::unordered_map<int, SignalTarget>& targets) {
+        std::vector<int> pids;
+        listPids(pids);
+        std::unordered_map<int, std::vector<std::pair<int, SignalTarget>>> children;
+        for (int pid : pids) {
+            int ppid;
+            char state;
+            SignalTarget child;
+            if (readParentAndStart(pid, ppid, child.startTime, &state)) {
+                child.wasStopped = state == 'T' || state == 't';
+                children[ppid].push_back({pid, child});
+            }
+        }
+        size_t added = 0;
+        std::vector<int> pending;
+        for (auto& target : targets) {
+            pending.push_back(target.first);
+        }
+        while (!pending.empty()) {
+            int pid = pending.back();
+            pending.pop_back();
+            auto found = children.find(pid);
+            if (found == children.end()) {
+                continue;
+            }
+            for (auto& child : found->second) {
+                if (targets.emplace(child.first, child.second).second) {
+                    pending.push_back(child.first);
+                    added++;
+                }
+            }
+        }
+        return added;
+    }
+
+    // envia um sinal por pidfd, que continua apontando para o mesmo processo
+    // mesmo que o pid seja reutilizado: o pidfd eh aberto e so entao o
+    // starttime eh conferido com o da resolucao dos alvos. sem pidfd
+    // (kernel < 5.3) usa kill. retorna 0 ou o errno
+    int sendSignal(int pid, unsigned long long startTime, int signal) {
+        int pidFd = syscall(SYS_pidfd_open, pid, 0);
+        if (pidFd < 0) {
+            if (errno != ENOSYS) {
+                return errno;
+            }
+            return syscall(SYS_kill, pid, signal) == 0 ? 0 : errno;
+        }
+        int ppid;
+        unsigned long long currentStart;
+        int error = 0;
+        if (!readParentAndStart(pid, ppid, currentStart) || currentStart != startTime) {
+            error = ESRCH;
+        } else if (syscall(SYS_pidfd_send_signal, pidFd, signal, NULL, 0) != 0) {
+            error = errno;
+        }
+        close(pidFd);
+        return error;
+    }
+
+    // envia `signal` aos pids em uma unica chamada e grava um resultado por
+    // processo em `results` (ate maxResults; o retorno eh o total, e todos
+    // ficam disponiveis em getSignalResults). com SIGNAL_DESCENDANTS a
+    // arvore de cada pid eh incluida: para que um fork bomb nao escape entre
+    // a resolucao e o envio, os descendentes sao congelados com SIGSTOP ate
+    // uma releitura de /proc nao encontrar nenhum novo (no maximo
+    // SIGNAL_MAX_FREEZE_PASSES vezes; senao *complete = 0, pois os ultimos
+    // encontrados nao foram congelados e descendentes podem ter escapado).
+    // os pids pedidos nao sao congelados e recebem o sinal primeiro. depois
+    // do sinal, se ele puder ser tratado, so os processos congelados aqui
+    // sao retomados com SIGCONT; os que ja estavam parados continuam parados
+    int signalProcesses(const int* pids, int count, int signal, int flags, SignalResult* results, int maxResults,
+                        int* complete) {
+        std::unordered_map<int, SignalTarget> targets;
+        std::vector<int> order;
+        for (int i = 0; i < count; ++i) {
+            int ppid;
+            char state;
+            SignalTarget target;
+            if (targets.count(pids[i])) {
+                continue;
+            }
+            if (!readParentAndStart(pids[i], ppid, target.startTime, &state)) {
+                target.startTime = 0;  // o processo ja terminou: resulta em ESRCH
+            }
+            targets[pids[i]] = target;
+            order.push_back(pids[i]);
+        }
+        std::unordered_map<int, bool> roots;
+        for (int pid : order) {
+            roots[pid] = true;
+        }
+
+        std::unordered_map<int, int> errors;
+        int self = getpid();
+        bool freeze = (flags & SIGNAL_DESCENDANTS) && signal != SIGSTOP && signal != SIGCONT;
+        *complete = 1;
+        if (flags & SIGNAL_DESCENDANTS) {
+            for (int pass = 0; addDescendants(targets) > 0 && freeze; ++pass) {
+                if (pass == SIGNAL_MAX_FREEZE_PASSES) {
+                    *complete = 0;  // a arvore continuou crescendo
+                    break;
+                }
+                for (auto& target : targets) {
+                    SignalTarget& state = target.second;
+                    // o proprio processo nunca eh congelado (nao poderia se retomar)
+                    if (roots.count(target.first) || target.first == self || state.frozen || state.wasStopped
+                            || state.startTime == 0 || errors.count(target.first)) {
+                        continue;
+                    }
+                    int error = sendSignal(target.first, state.startTime, SIGSTOP);
+                    if (error == 0) {
+                        state.frozen = true;
+                    } else {
+                        errors[target.first] = error;
+                    }
+                }
+            }
+            std::vector<int> descendants;
+            for (auto& target : targets) {
+                if (!roots.count(target.first)) {
+                    descendants.push_back(target.first);
+                }
+            }
+            std::sort(descendants.begin(), descendants.end());
+            order.insert(order.end(), descendants.begin(), descendants.end());
+        }
+        // se o proprio processo for alvo, ele recebe o sinal por ultimo
+        std::stable_partition(order.begin(), order.end(), [self](int pid) { return pid != self; });
+
+        for (int pid : order) {
+            const SignalTarget& target = targets[pid];
+            int error = target.startTime == 0 ? ESRCH : sendSignal(pid, target.startTime, signal);
+            auto frozen = errors.find(pid);
+            if (error == 0 && frozen != errors.end()) {
+                error = frozen->second;
+            }
+            errors[pid] = error;
+        }
+        if (freeze && signal != SIGKILL) {
+            for (int pid : order) {
+                if (targets[pid].frozen) {
+                    sendSignal(pid, targets[pid].startTime, SIGCONT);
+                }
+            }
+        }
+
+        std::lock_guard<std::mutex> lock(signalResultsMutex);
+        signalResults.clear();
+        for (int pid : order) {
+            signalResults.push_back({pid, errors[pid]});
+        }
+        int copied = std::min<int>(order.size(), std::max(maxResults, 0));
+        std::copy(signalResults.begin(), signalResults.begin() + copied, results);
+        return order.size();
+    }
+
+    // todos os resultados do ultimo signalProcesses (para quando nao
+    // couberam no buffer da chamada). retorna o total
+    int getSignalResults(SignalResult* results, int maxResults) {
+        std::lock_guard<std::mutex> lock(signalResultsMutex);
+        int copied = std::min<int>(signalResults.size(), std::max(maxResults, 0));
+        std::copy(signalResults.begin(), signalResults.begin() + copied, results);
+        return signalResults.size();
+    }
+
+    const int killProcess(int pid) {
         int result = syscall(SYS_kill, pid, SIGKILL); // envia sinal de kill para o processo
         if (result == -1) {
             perror("killProcess failed");
@@ -616,9 +2142,8 @@ public:
 
     // funcao para obter informacoes especificas de um processo
     // em /proc/[pid]/status, /proc/[pid]/statm, /proc/[pid]/task/[tid]/status
-    const char* getSpecificProcess(int pid) {
-        static std::string info;
-        info.clear();
+    std::string getSpecificProcess(int pid) {
+        std::string info;
 
         std::ostringstream processInfo;
         std::string processDir = "/proc/" + std::to_string(pid);
@@ -697,205 +2222,1050 @@ public:
             }
         } 
         info = processInfo.str();
-        return info.c_str();
+        return info;
+    }
+
+    // abre os detalhes de um processo e preenche os dados fixos (nome,
+    // linha de comando, executavel, usuario, inicio). retorna NULL se o
+    // processo nao existir
+    ProcessDetailHandle* openProcessDetail(int pid, ProcessStaticInfo* info) {
+        memset(info, 0, sizeof(ProcessStaticInfo));
+        char path[32];
+        snprintf(path, sizeof(path), "%d", pid);
+        int pidFd = openat(procFd, path, O_RDONLY | O_DIRECTORY | O_CLOEXEC);
+        if (pidFd < 0) {
+            return NULL;
+        }
+
+        char buffer[PROCESS_TEXT_LENGTH];
+        ProcStat stat;
+        struct stat dirStat;
+        if (fstat(pidFd, &dirStat) != 0 || readFileAt(pidFd, "stat", buffer, sizeof(buffer)) <= 0 ||
+            !parseProcStat(buffer, stat)) {
+            close(pidFd);
+            return NULL;
+        }
+
+        ProcessDetailHandle* handle = new ProcessDetailHandle();
+        handle->pid = pid;
+        handle->pidFd = pidFd;
+        handle->startTime = stat.startTime;
+
+        info->pid = pid;
+        info->ppid = stat.ppid;
+        info->uid = dirStat.st_uid;
+        info->gid = dirStat.st_gid;
+        strncpy(info->name, stat.comm.c_str(), PROCESS_NAME_LENGTH - 1);
+        strncpy(info->user, userName(dirStat.st_uid).c_str(), PROCESS_NAME_LENGTH - 1);
+
+        // inicio: momento do boot + jiffies desde o boot
+        struct sysinfo systemInfo;
+        if (sysinfo(&systemInfo) == 0) {
+            info->startTime = time(NULL) - systemInfo.uptime + stat.startTime / sysconf(_SC_CLK_TCK);
+        }
+
+        ssize_t length = readlinkat(pidFd, "exe", info->exe, PROCESS_TEXT_LENGTH - 1);
+        info->exe[length > 0 ? length : 0] = '\0';
+
+        // cmdline separa os argumentos com '\0'; processos do kernel nao tem
+        length = readFileAt(pidFd, "cmdline", buffer, sizeof(buffer));
+        for (ssize_t i = 0; i < length; ++i) {
+            if (buffer[i] == '\0') buffer[i] = ' ';
+        }
+        if (length > 0) {
+            while (length > 0 && buffer[length - 1] == ' ') --length;
+            memcpy(info->cmdline, buffer, std::min<size_t>(length, PROCESS_TEXT_LENGTH - 1));
+        }
+        return handle;
+    }
+
+    // le /proc/[pid]/stat e status do processo do handle
+    bool readProcessFields(ProcessDetailHandle* handle, ProcessDynamicInfo* info) {
+        static const double ticksPerSecond = sysconf(_SC_CLK_TCK);
+        char buffer[PROCESS_TEXT_LENGTH];
+        ProcStat stat;
+        if (readFileAt(handle->pidFd, "stat", buffer, sizeof(buffer)) <= 0 || !parseProcStat(buffer, stat)) {
+            return false;
+        }
+        info->state = stat.state;
+        info->threads = stat.numThreads;
+
+        auto currentTime = std::chrono::steady_clock::now();
+        unsigned long long ticks = stat.utime + stat.stime;
+        std::chrono::duration<double> elapsed = currentTime - handle->sampleTime;
+        if (handle->sampled && elapsed.count() > 0 && ticks >= handle->ticks) {
+            info->cpuUsage = (ticks - handle->ticks) / ticksPerSecond / elapsed.count() * 100.0;
+        }
+        handle->ticks = ticks;
+        handle->sampleTime = currentTime;
+        handle->sampled = true;
+
+        if (readFileAt(handle->pidFd, "status", buffer, sizeof(buffer)) <= 0) {
+            return false;
+        }
+        static const struct { const char* key; size_t offset; } keys[] = {
+            {"VmPeak:", offsetof(ProcessDynamicInfo, vmPeak)},
+            {"VmSize:", offsetof(ProcessDynamicInfo, vmSize)},
+            {"VmRSS:", offsetof(ProcessDynamicInfo, vmRSS)},
+            {"RssAnon:", offsetof(ProcessDynamicInfo, rssAnon)},
+            {"RssFile:", offsetof(ProcessDynamicInfo, rssFile)},
+            {"RssShmem:", offsetof(ProcessDynamicInfo, rssShmem)},
+            {"VmData:", offsetof(ProcessDynamicInfo, vmData)},
+            {"VmStk:", offsetof(ProcessDynamicInfo, vmStk)},
+            {"VmExe:", offsetof(ProcessDynamicInfo, vmExe)},
+            {"VmLib:", offsetof(ProcessDynamicInfo, vmLib)},
+            {"VmSwap:", offsetof(ProcessDynamicInfo, vmSwap)},
+            {"voluntary_ctxt_switches:", offsetof(ProcessDynamicInfo, voluntarySwitches)},
+            {"nonvoluntary_ctxt_switches:", offsetof(ProcessDynamicInfo, involuntarySwitches)},
+        };
+        for (const char* line = buffer; *line; ) {
+            for (const auto& key : keys) {
+                size_t keyLength = strlen(key.key);
+                if (strncmp(line, key.key, keyLength) == 0) {
+                    *(unsigned long long*)((char*)info + key.offset) = strtoull(line + keyLength, NULL, 10);
+                    break;
+                }
+            }
+            const char* next = strchr(line, '\n');
+            if (next == NULL) break;
+            line = next + 1;
+        }
+        return true;
+    }
+
+    // le /proc/[pid]/task/[tid]/stat de cada thread e compara com o estado
+    // ja enviado. threads novas ou alteradas vao para `changed`, as que
+    // terminaram para `removed` e o novo estado para `current`
+    void diffThreads(ProcessDetailHandle* handle, std::vector<ThreadRecord>& changed, std::vector<int>& removed,
+                     std::string& strings, std::unordered_map<int, ThreadState>& current) {
+        static const double ticksPerSecond = sysconf(_SC_CLK_TCK);
+        int taskFd = openat(handle->pidFd, "task", O_RDONLY | O_DIRECTORY | O_CLOEXEC);
+        DIR* dir = taskFd >= 0 ? fdopendir(taskFd) : NULL;
+        if (dir == NULL) {
+            if (taskFd >= 0) close(taskFd);
+            return;
+        }
+
+        std::chrono::duration<double> elapsedSeconds = std::chrono::steady_clock::now() - handle->threadSampleTime;
+        double elapsed = handle->threadsSampled ? elapsedSeconds.count() : 0;
+
+        char buffer[1024];
+        char path[48];
+        ProcStat stat;
+        struct dirent* entry;
+        while ((entry = readdir(dir)) != NULL) {
+            if (entry->d_name[0] < '1' || entry->d_name[0] > '9') {
+                continue;
+            }
+            snprintf(path, sizeof(path), "%d/stat", atoi(entry->d_name));
+            if (readFileAt(dirfd(dir), path, buffer, sizeof(buffer)) <= 0 || !parseProcStat(buffer, stat)) {
+                continue; // a thread terminou
+            }
+
+            ThreadState state;
+            state.name = stat.comm;
+            state.state = stat.state;
+            state.priority = stat.priority;
+            state.nice = stat.nice;
+            state.processor = stat.processor;
+            state.ticks = stat.utime + stat.stime;
+
+            auto prev = handle->threads.find(stat.pid);
+            if (prev != handle->threads.end() && elapsed > 0 && state.ticks >= prev->second.ticks) {
+                state.cpuUsage = (state.ticks - prev->second.ticks) / ticksPerSecond / elapsed * 100.0;
+            }
+            // cpu comparada com uma casa decimal, como eh exibida
+            bool different = prev == handle->threads.end() || prev->second.name != state.name ||
+                             prev->second.state != state.state || prev->second.priority != state.priority ||
+                             prev->second.nice != state.nice || prev->second.processor != state.processor ||
+                             llround(prev->second.cpuUsage * 10) != llround(state.cpuUsage * 10);
+            if (different) {
+                ThreadRecord record;
+                memset(&record, 0, sizeof(record));
+                record.tid = stat.pid;
+                record.priority = state.priority;
+                record.nice = state.nice;
+                record.processor = state.processor;
+                record.cpuUsage = state.cpuUsage;
+                record.state = state.state;
+                record.nameOffset = strings.size();
+                record.nameLength = state.name.size();
+                strings += state.name;
+                changed.push_back(record);
+            }
+            current[stat.pid] = state;
+        }
+        closedir(dir);
+
+        for (const auto& thread : handle->threads) {
+            if (current.find(thread.first) == current.end()) {
+                removed.push_back(thread.first);
+            }
+        }
+    }
+
+    // le as secoes pedidas (PROCESS_DETAIL_FIELDS, PROCESS_DETAIL_THREADS).
+    // retorna o numero de threads novas ou alteradas, ou -1 se o processo
+    // terminou. se alguma lista nao couber nos buffers, o estado das threads
+    // nao eh atualizado e o chamador deve repetir com buffers maiores
+    int readProcessDetail(ProcessDetailHandle* handle, int sections, ProcessDynamicInfo* info,
+                          ThreadRecord* changed, int maxChanged, int* removed, int maxRemoved, int* removedCount,
+                          char* strings, size_t stringsCapacity, size_t* stringsLength) {
+        memset(info, 0, sizeof(ProcessDynamicInfo));
+        *removedCount = 0;
+        *stringsLength = 0;
+
+        // o diretorio aberto continua valido apos o fim do processo, mas as
+        // leituras falham; um pid reutilizado tem outro starttime
+        char buffer[PROCESS_TEXT_LENGTH];
+        ProcStat stat;
+        if (readFileAt(handle->pidFd, "stat", buffer, sizeof(buffer)) <= 0 || !parseProcStat(buffer, stat) ||
+            stat.startTime != handle->startTime) {
+            return -1;
+        }
+        if ((sections & PROCESS_DETAIL_FIELDS) && !readProcessFields(handle, info)) {
+            return -1;
+        }
+        if (!(sections & PROCESS_DETAIL_THREADS)) {
+            return 0;
+        }
+
+        std::vector<ThreadRecord> changedThreads;
+        std::vector<int> removedThreads;
+        std::string threadStrings;
+        std::unordered_map<int, ThreadState> current;
+        diffThreads(handle, changedThreads, removedThreads, threadStrings, current);
+
+        *removedCount = removedThreads.size();
+        *stringsLength = threadStrings.size();
+        if ((int)changedThreads.size() <= maxChanged && (int)removedThreads.size() <= maxRemoved &&
+            threadStrings.size() <= stringsCapacity) {
+            std::copy(changedThreads.begin(), changedThreads.end(), changed);
+            std::copy(removedThreads.begin(), removedThreads.end(), removed);
+            memcpy(strings, threadStrings.data(), threadStrings.size());
+            // o estado lembrado passa a ser exatamente o que foi enviado
+            handle->threads.swap(current);
+            handle->threadSampleTime = std::chrono::steady_clock::now();
+            handle->threadsSampled = true;
+        }
+        return changedThreads.size();
+    }
+
+    void closeProcessDetail(ProcessDetailHandle* handle) {
+        if (handle->pidFd >= 0) {
+            close(handle->pidFd);
+        }
+        delete handle;
     }
 
     // funcao para obter informacoes sobre as particoes do sistema de arquivos
-    const char* getFileSystemInfo() {
-        static std::string info;
-        info.clear();
-        struct statvfs stat;
+    std::string getFileSystemInfo() {
+        std::vector<MountStats> mounts;
+        listMounts(mounts);
+        if (mounts.empty()) {
+            return "Error retrieving file system info";
+        }
 
-        if (statvfs("/", &stat) == 0) {
-            unsigned long total = stat.f_blocks * stat.f_frsize;
-            unsigned long free = stat.f_bfree * stat.f_frsize;
-            unsigned long used = total - free;
-            double usedPercentage = (double)used / total * 100.0;
-
-            std::ostringstream fsInfo;
-            fsInfo << "Total: " << total / (1024 * 1024) << " MB\n";
-            fsInfo << "Used: " << used / (1024 * 1024) << " MB\n";
-            fsInfo << "Free: " << free / (1024 * 1024) << " MB\n";
-            fsInfo << "Usage: " << usedPercentage << "%\n";
-            info = fsInfo.str();
-        } else {
-            info = "Error retrieving file system info";
+        std::ostringstream fsInfo;
+        for (const MountStats& mount : mounts) {
+            fsInfo << mount.mountPoint << " (" << mount.source << ", " << mount.fsType << ")\n";
+            fsInfo << "Total: " << mount.totalBytes / (1024 * 1024) << " MB\n";
+            fsInfo << "Used: " << mount.usedBytes / (1024 * 1024) << " MB\n";
+            fsInfo << "Free: " << mount.availableBytes / (1024 * 1024) << " MB\n";
+            fsInfo << "Usage: " << mount.usage << "%\n";
         }
+        return fsInfo.str();
+    }
 
-        return info.c_str();
+    // permissoes no formato do ls (ex.: drwxr-xr-x)
+    static std::string permissionString(unsigned int mode) {
+        std::string permissions = S_ISDIR(mode) ? "d" : (S_ISLNK(mode) ? "l" : "-");
+        const char* flags = "rwxrwxrwx";
+        for (int bit = 0; bit < 9; bit++) {
+            permissions += (mode & (S_IRUSR >> bit)) ? flags[bit] : '-';
+        }
+        return permissions;
     }
 
-    // funcao para listar arquivos e diretorios em um diretorio específico
-    const char* listDirectory(const char* path) {
-        static std::string info;
-        info.clear();
+    // stat de uma entrada relativo ao descritor do diretorio (sem montar o
+    // caminho completo e sem seguir links simbolicos)
+    static bool statEntryAt(int dirFd, const char* name, DirectoryEntry& record) {
+        struct stat fileStat;
+        if (fstatat(dirFd, name, &fileStat, AT_SYMLINK_NOFOLLOW) != 0) {
+            return false;
+        }
+        record.device = fileStat.st_dev;
+        record.size = fileStat.st_size;
+        record.blocks = fileStat.st_blocks;
+        record.mtime = fileStat.st_mtime;
+        record.mode = fileStat.st_mode;
+        record.links = fileStat.st_nlink;
+        if (record.type == DT_UNKNOWN) {
+            record.type = IFTODT(fileStat.st_mode);
+        }
+        return true;
+    }
+
+    // le a proxima pagina de um diretorio aberto com openDirectory: ate
+    // maxRecords entradas (sem "." e ".."), com os nomes no bloco strings.
+    // o tipo vem do d_type e o stat so eh feito com withStat ou quando o
+    // sistema de arquivos nao informa o tipo. retorna o numero de entradas
+    // (0 no fim do diretorio)
+    static int readDirectoryPage(DIR* dir, DirectoryEntry* records, int maxRecords,
+                                 char* strings, size_t stringsCapacity, size_t* stringsLength, int withStat) {
+        int fd = dirfd(dir);
+        int count = 0;
+        size_t used = 0;
+        // cada nome ocupa no maximo NAME_MAX bytes
+        while (count < maxRecords && stringsCapacity - used >= NAME_MAX) {
+            struct dirent* entry = readdir(dir);
+            if (entry == NULL) {
+                break;
+            }
+            if (strcmp(entry->d_name, ".") == 0 || strcmp(entry->d_name, "..") == 0) {
+                continue;
+            }
+
+            DirectoryEntry& record = records[count];
+            memset(&record, 0, sizeof(record));
+            size_t length = strlen(entry->d_name);
+            memcpy(strings + used, entry->d_name, length);
+            record.nameOffset = used;
+            record.nameLength = length;
+            record.inode = entry->d_ino;
+            record.type = entry->d_type;
+            used += length;
+
+            if (withStat || record.type == DT_UNKNOWN) {
+                statEntryAt(fd, entry->d_name, record);
+            }
+            count++;
+        }
+        *stringsLength = used;
+        return count;
+    }
+
+    // preenche os campos do stat de entradas ja lidas de `path`. retorna o
+    // numero de entradas com stat bem-sucedido ou -1 se o diretorio nao abrir
+    static int statDirectoryEntries(const char* path, DirectoryEntry* records, int count, const char* strings) {
+        int fd = open(path, O_RDONLY | O_DIRECTORY | O_CLOEXEC);
+        if (fd < 0) {
+            return -1;
+        }
+        int done = 0;
+        std::string name;
+        for (int i = 0; i < count; i++) {
+            name.assign(strings + records[i].nameOffset, records[i].nameLength);
+            if (statEntryAt(fd, name.c_str(), records[i])) {
+                done++;
+            }
+        }
+        close(fd);
+        return done;
+    }
+
+    // funcao para listar arquivos e diretorios em um diretorio específico.
+    // le o diretorio em paginas, com stat relativo ao descritor do diretorio,
+    // e monta a listagem em um unico buffer
+    std::string listDirectory(const char* path) {
         DIR* dir = opendir(path);
-        if (dir) {
-            struct dirent* entry;
-            while ((entry = readdir(dir)) != NULL) {
-                struct stat fileStat;
-                std::string fullPath = std::string(path) + "/" + entry->d_name;
-                if (stat(fullPath.c_str(), &fileStat) == 0) {
-                    std::ostringstream fileInfo;
-                    fileInfo << entry->d_name << "\t";
-                    fileInfo << (S_ISDIR(fileStat.st_mode) ? "d" : "-");
-                    fileInfo << ((fileStat.st_mode & S_IRUSR) ? "r" : "-");
-                    fileInfo << ((fileStat.st_mode & S_IWUSR) ? "w" : "-");
-                    fileInfo << ((fileStat.st_mode & S_IXUSR) ? "x" : "-");
-                    fileInfo << ((fileStat.st_mode & S_IRGRP) ? "r" : "-");
-                    fileInfo << ((fileStat.st_mode & S_IWGRP) ? "w" : "-");
-                    fileInfo << ((fileStat.st_mode & S_IXGRP) ? "x" : "-");
-                    fileInfo << ((fileStat.st_mode & S_IROTH) ? "r" : "-");
-                    fileInfo << ((fileStat.st_mode & S_IWOTH) ? "w" : "-");
-                    fileInfo << ((fileStat.st_mode & S_IXOTH) ? "x" : "-");
-                    fileInfo << "\t" << fileStat.st_size << " bytes\n";
-                    info += fileInfo.str();
+        if (!dir) {
+            return "Error opening directory";
+        }
+
+        std::ostringstream listing;
+        std::vector<DirectoryEntry> records(DIRECTORY_PAGE_SIZE);
+        std::vector<char> strings(DIRECTORY_PAGE_SIZE * (NAME_MAX + 1));
+        size_t stringsLength = 0;
+        int count;
+        while ((count = readDirectoryPage(dir, records.data(), records.size(), strings.data(),
+                                          strings.size(), &stringsLength, 1)) > 0) {
+            for (int i = 0; i < count; i++) {
+                const DirectoryEntry& record = records[i];
+                if (record.mode == 0) {
+                    continue; // stat falhou (entrada removida durante a leitura)
                 }
+                listing.write(strings.data() + record.nameOffset, record.nameLength);
+                listing << "\t" << permissionString(record.mode) << "\t" << record.size << " bytes\n";
             }
-            closedir(dir);
-        } else {
-            info = "Error opening directory";
         }
-        return info.c_str();
+        closedir(dir);
+        return listing.str();
     }
 
     // funcao para obter informacoes sobre recursos abertos por um processo
-    const char* getProcessResources(int pid) {
-        static std::string info;
-        info.clear();
+    std::string getProcessResources(int pid) {
         std::ostringstream resourcesInfo;
 
-        // Arquivos abertos
-        std::string fdDir = "/proc/" + std::to_string(pid) + "/fd";
-        DIR* dir = opendir(fdDir.c_str());
-        if (dir) {
-            struct dirent* entry;
-            resourcesInfo << "Open Files:\n";
-            while ((entry = readdir(dir)) != NULL) {
-                if (entry->d_type == DT_LNK) {
-                    std::string fdPath = fdDir + "/" + entry->d_name;
-                    char linkPath[1024];
-                    ssize_t len = readlink(fdPath.c_str(), linkPath, sizeof(linkPath) - 1);
-                    if (len != -1) {
-                        linkPath[len] = '\0';
-                        resourcesInfo << "  " << entry->d_name << " -> " << linkPath << "\n";
-                    }
+        // arquivos abertos, com os sockets resolvidos para os enderecos
+        FdCursor* cursor = openFdCursor(pid, NULL);
+        if (cursor == NULL) {
+            return "Error opening fd directory\n";
+        }
+        resourcesInfo << "Open Files:\n";
+        std::vector<FileDescriptorRecord> records(FD_PAGE_SIZE);
+        std::vector<char> strings(FD_PAGE_SIZE * 256);
+        size_t stringsLength;
+        int count;
+        while ((count = readFdPage(cursor, records.data(), FD_PAGE_SIZE, strings.data(), strings.size(),
+                                   &stringsLength)) > 0) {
+            for (int i = 0; i < count; ++i) {
+                const FileDescriptorRecord& record = records[i];
+                resourcesInfo << "  " << record.fd << " -> "
+                              << std::string(strings.data() + record.targetOffset, record.targetLength);
+                if (record.detailLength > 0) {
+                    resourcesInfo << " (" << std::string(strings.data() + record.detailOffset, record.detailLength) << ")";
                 }
+                resourcesInfo << "\n";
             }
-            closedir(dir);
-        } else {
-            resourcesInfo << "Error opening fd directory\n";
         }
+        closeFdCursor(cursor);
+        return resourcesInfo.str();
+    }
+
+    // endereco ipv4 ou ipv6 de /proc/net/tcp* ("0100007F:1F90" -> 127.0.0.1:8080).
+    // o kernel escreve cada palavra de 32 bits na ordem de bytes da maquina
+    static std::string socketAddress(const char* hex, bool ipv6) {
+        char text[INET6_ADDRSTRLEN + 8];
+        unsigned int port = 0;
+        const char* colon = strchr(hex, ':');
+        if (colon == NULL) {
+            return "";
+        }
+        port = strtoul(colon + 1, NULL, 16);
+        unsigned char bytes[16];
+        int words = ipv6 ? 4 : 1;
+        for (int w = 0; w < words; ++w) {
+            char word[9];
+            memcpy(word, hex + w * 8, 8);
+            word[8] = '\0';
+            uint32_t value = strtoul(word, NULL, 16);
+            memcpy(bytes + w * 4, &value, 4);
+        }
+        inet_ntop(ipv6 ? AF_INET6 : AF_INET, bytes, text, sizeof(text));
+        return ipv6 ? "[" + std::string(text) + "]:" + std::to_string(port) : std::string(text) + ":" + std::to_string(port);
+    }
+
+    // le /proc/[pid]/net/{tcp,tcp6,udp,udp6,unix} uma unica vez e monta o
+    // indice inode -> descricao. os arquivos do proprio processo sao usados
+    // porque refletem o namespace de rede dele
+    static void indexSockets(int pidFd, std::unordered_map<unsigned long long, std::string>& sockets) {
+        static const char* tcpStates[] = {
+            "", "ESTABLISHED", "SYN_SENT", "SYN_RECV", "FIN_WAIT1", "FIN_WAIT2", "TIME_WAIT",
+            "CLOSE", "CLOSE_WAIT", "LAST_ACK", "LISTEN", "CLOSING"
+        };
+        static const struct { const char* path; const char* protocol; bool ipv6; bool tcp; } inetTables[] = {
+            {"net/tcp", "TCP", false, true}, {"net/tcp6", "TCP6", true, true},
+            {"net/udp", "UDP", false, false}, {"net/udp6", "UDP6", true, false},
+        };
+        char line[512];
+        for (const auto& table : inetTables) {
+            int fd = openat(pidFd, table.path, O_RDONLY | O_CLOEXEC);
+            FILE* file = fd >= 0 ? fdopen(fd, "r") : NULL;
+            if (file == NULL) {
+                if (fd >= 0) close(fd);
+                continue;
+            }
+            fgets(line, sizeof(line), file);  // cabecalho
+            while (fgets(line, sizeof(line), file) != NULL) {
+                // sl local remoto st tx:rx tr:when retrnsmt uid timeout inode
+                char local[64], remote[64];
+                unsigned int state, uid, timeout;
+                unsigned long long inode;
+                if (sscanf(line, "%*s %63s %63s %x %*s %*s %*s %u %u %llu",
+                           local, remote, &state, &uid, &timeout, &inode) != 6 || inode == 0) {
+                    continue;
+                }
+                std::string description = std::string(table.protocol) + " " + socketAddress(local, table.ipv6);
+                std::string peer = socketAddress(remote, table.ipv6);
+                if (peer.size() > 2 && peer.compare(peer.size() - 2, 2, ":0") != 0) {
+                    description += " -> " + peer;  // sem par em LISTEN e udp nao conectado
+                }
+                if (table.tcp && state < sizeof(tcpStates) / sizeof(tcpStates[0])) {
+                    description += std::string(" ") + tcpStates[state];
+                }
+                sockets[inode] = description;
+            }
+            fclose(file);
+        }
+
+        int fd = openat(pidFd, "net/unix", O_RDONLY | O_CLOEXEC);
+        FILE* file = fd >= 0 ? fdopen(fd, "r") : NULL;
+        if (file == NULL) {
+            if (fd >= 0) close(fd);
+            return;
+        }
+        fgets(line, sizeof(line), file);
+        while (fgets(line, sizeof(line), file) != NULL) {
+            // num refcount protocol flags type st inode [caminho]
+            unsigned long long inode;
+            char path[PATH_MAX];
+            path[0] = '\0';
+            if (sscanf(line, "%*s %*s %*s %*s %*s %*s %llu %4095s", &inode, path) < 1) {
+                continue;
+            }
+            sockets[inode] = std::string("UNIX") + (path[0] ? std::string(" ") + path : "");
+        }
+        fclose(file);
+    }
 
-        // outras informacoes de recursos (semaphores, sockets, etc)
+    // abre o cursor dos descritores de um processo e informa quantos ha
+    // (count pode ser NULL). retorna NULL se /proc/[pid]/fd nao puder ser
+    // aberto (processo inexistente ou sem permissao)
+    FdCursor* openFdCursor(int pid, int* count) {
+        char path[32];
+        snprintf(path, sizeof(path), "%d", pid);
+        int pidFd = openat(procFd, path, O_RDONLY | O_DIRECTORY | O_CLOEXEC);
+        if (pidFd < 0) {
+            return NULL;
+        }
+        int fdDirFd = openat(pidFd, "fd", O_RDONLY | O_DIRECTORY | O_CLOEXEC);
+        int listFd = fdDirFd >= 0 ? dup(fdDirFd) : -1;
+        DIR* dir = listFd >= 0 ? fdopendir(listFd) : NULL;
+        if (dir == NULL) {
+            if (listFd >= 0) close(listFd);
+            if (fdDirFd >= 0) close(fdDirFd);
+            close(pidFd);
+            return NULL;
+        }
 
-        info = resourcesInfo.str();
-        return info.c_str();
+        FdCursor* cursor = new FdCursor();
+        cursor->pid = pid;
+        cursor->pidFd = pidFd;
+        cursor->fdDirFd = fdDirFd;
+        // so os numeros: o readdir le as entradas em lote (getdents) e
+        // nenhum link eh lido aqui
+        struct dirent* entry;
+        while ((entry = readdir(dir)) != NULL) {
+            if (entry->d_name[0] >= '0' && entry->d_name[0] <= '9') {
+                cursor->fds.push_back(atoi(entry->d_name));
+            }
+        }
+        closedir(dir);
+        std::sort(cursor->fds.begin(), cursor->fds.end());
+        if (count != NULL) {
+            *count = cursor->fds.size();
+        }
+        return cursor;
     }
+
+    // le a proxima pagina de ate maxRecords descritores. a pagina termina
+    // antes se o bloco de strings encher; retorna 0 no fim
+    int readFdPage(FdCursor* cursor, FileDescriptorRecord* records, int maxRecords,
+                   char* strings, size_t stringsCapacity, size_t* stringsLength) {
+        int count = 0;
+        size_t length = 0;
+        char target[PATH_MAX];
+        char name[16];
+        while (count < maxRecords && cursor->position < cursor->fds.size()) {
+            int fd = cursor->fds[cursor->position];
+            snprintf(name, sizeof(name), "%d", fd);
+            ssize_t targetLength = readlinkat(cursor->fdDirFd, name, target, sizeof(target) - 1);
+            if (targetLength < 0) {
+                cursor->position++;  // descritor fechado desde a listagem
+                continue;
+            }
+            target[targetLength] = '\0';
+
+            FileDescriptorRecord record;
+            memset(&record, 0, sizeof(record));
+            record.fd = fd;
+            std::string detail;
+            unsigned long long inode;
+            if (sscanf(target, "socket:[%llu]", &inode) == 1) {
+                record.type = FD_TYPE_SOCKET;
+                record.inode = inode;
+                if (!cursor->socketsIndexed) {
+                    indexSockets(cursor->pidFd, cursor->sockets);
+                    cursor->socketsIndexed = true;
+                }
+                auto socket = cursor->sockets.find(inode);
+                if (socket != cursor->sockets.end()) {
+                    detail = socket->second;
+                }
+            } else if (sscanf(target, "pipe:[%llu]", &inode) == 1) {
+                record.type = FD_TYPE_PIPE;
+                record.inode = inode;
+            } else if (strncmp(target, "anon_inode:", 11) == 0) {
+                record.type = FD_TYPE_ANON;
+            } else if (target[0] == '/') {
+                record.type = FD_TYPE_FILE;
+            }
+
+            // a pagina termina aqui se os textos nao couberem (exceto se
+            // for o primeiro registro: ai eles sao truncados)
+            size_t needed = targetLength + detail.size();
+            if (length + needed > stringsCapacity && count > 0) {
+                break;
+            }
+            size_t targetCopy = std::min<size_t>(targetLength, stringsCapacity - length);
+            memcpy(strings + length, target, targetCopy);
+            record.targetOffset = length;
+            record.targetLength = targetCopy;
+            length += targetCopy;
+            size_t detailCopy = std::min(detail.size(), stringsCapacity - length);
+            memcpy(strings + length, detail.data(), detailCopy);
+            record.detailOffset = length;
+            record.detailLength = detailCopy;
+            length += detailCopy;
+
+            records[count++] = record;
+            cursor->position++;
+        }
+        *stringsLength = length;
+        return count;
+    }
+
+    void closeFdCursor(FdCursor* cursor) {
+        if (cursor->fdDirFd >= 0) close(cursor->fdDirFd);
+        if (cursor->pidFd >= 0) close(cursor->pidFd);
+        delete cursor;
+    }
+
+    // funcao para obter todas as metricas periodicas em uma unica chamada
+    // cada fonte do kernel (/proc/stat, sysinfo, /proc/net/dev, /proc/diskstats,
+    // statvfs) eh lida apenas uma vez
+    void getSnapshot(Snapshot* snapshot) {
+        memset(snapshot, 0, sizeof(Snapshot));
+
+        auto currentTime = std::chrono::steady_clock::now();
+        snapshot->timestamp = std::chrono::duration<double>(currentTime.time_since_epoch()).count();
+
+        // sysinfo: uptime, carga, processos, memoria e swap
+        struct sysinfo sys_info;
+        if (sysinfo(&sys_info) == 0) {
+            snapshot->uptime = sys_info.uptime;
+            for (int i = 0; i < 3; ++i) {
+                snapshot->loadAverage[i] = sys_info.loads[i] / 65536.0;
+            }
+            snapshot->processCount = sys_info.procs;
+
+            double unit = sys_info.mem_unit;
+            snapshot->totalMemory = sys_info.totalram * unit / (1024.0 * 1024.0);
+            snapshot->freeMemory = sys_info.freeram * unit / (1024.0 * 1024.0);
+            if (snapshot->totalMemory > 0) {
+                snapshot->memoryUsage = 100.0 * (snapshot->totalMemory - snapshot->freeMemory) / snapshot->totalMemory;
+            }
+            if (sys_info.totalswap > 0) {
+                snapshot->swapUsage = 100.0 * (sys_info.totalswap - sys_info.freeswap) / sys_info.totalswap;
+            }
+        }
+
+        // /proc/stat: uso da cpu (total e por core) e contador de threads
+        CpuPercentages aggregate;
+        std::vector<CpuPercentages> cores;
+        snapshot->threadCount = sampleCpu(aggregate, cores);
+        snapshot->cpuUsage = aggregate.busy;
+        snapshot->cpuIdlePercentage = aggregate.idle;
+        snapshot->coreCount = std::min((int)cores.size(), SNAPSHOT_MAX_CORES);
+        for (int i = 0; i < snapshot->coreCount; ++i) {
+            snapshot->coreValues[i] = cores[i].busy;
+        }
+
+        // temperatura da cpu
+        std::ifstream tempFile("/sys/class/thermal/thermal_zone0/temp");
+        if (tempFile.is_open()) {
+            int temp;
+            if (tempFile >> temp) {
+                snapshot->hasCpuTemperature = 1;
+                snapshot->cpuTemperature = temp / 1000.0;
+            }
+            tempFile.close();
+        }
+
+        // /proc/net/dev: taxas somadas das interfaces selecionadas (KB/s)
+        double receiveRate, transmitRate;
+        networkThroughput(receiveRate, transmitRate);
+        snapshot->networkReceiveRate = receiveRate / 1024;
+        snapshot->networkTransmitRate = transmitRate / 1024;
+
+        // /proc/diskstats: vazao somada dos discos (MB/s)
+        double readRate, writeRate;
+        diskThroughput(readRate, writeRate);
+        snapshot->diskRead = readRate / (1024 * 1024);
+        snapshot->diskWrite = writeRate / (1024 * 1024);
+
+        // statvfs: uso do disco
+        struct statvfs stat;
+        if (statvfs("/", &stat) == 0) {
+            double total = (double)stat.f_blocks * stat.f_frsize;
+            double free = (double)stat.f_bfree * stat.f_frsize;
+            snapshot->usedDisk = (total - free) / (1024.0 * 1024.0 * 1024.0);
+            snapshot->freeDisk = free / (1024.0 * 1024.0 * 1024.0);
+        }
+    }
+
+private:
+    // percentuais entre duas amostras de jiffies
+    static CpuPercentages cpuDelta(const CpuTimes& prev, const CpuTimes& curr) {
+        CpuPercentages result;
+        // contadores podem voltar atras (hotplug); nesse caso nao ha amostra valida
+        if (curr.total() <= prev.total()) {
+            return result;
+        }
+        double total = curr.total() - prev.total();
+        double idle = curr.idle > prev.idle ? curr.idle - prev.idle : 0;
+        double iowait = curr.iowait > prev.iowait ? curr.iowait - prev.iowait : 0;
+        double steal = curr.steal > prev.steal ? curr.steal - prev.steal : 0;
+        double irq = (curr.irq + curr.softirq) > (prev.irq + prev.softirq)
+                   ? (curr.irq + curr.softirq) - (prev.irq + prev.softirq) : 0;
+
+        result.busy = std::max(0.0, 100.0 * (total - idle - iowait) / total);
+        result.idle = 100.0 * idle / total;
+        result.iowait = 100.0 * iowait / total;
+        result.steal = 100.0 * steal / total;
+        result.irq = 100.0 * irq / total;
+        return result;
+    }
+
+    // descritor de /proc (ver scanProcesses)
+    int procFd = -1;
+
+    // threads usadas pelo leitor de processos
+    std::atomic<int> processScanWorkers{1};
+
+    // cache LRU uid -> nome de usuario (ver userName)
+    struct UserCacheEntry {
+        std::string name;
+        std::chrono::steady_clock::time_point expiry;
+        std::list<uid_t>::iterator position;
+    };
+    std::mutex userCacheMutex;
+    std::unordered_map<uid_t, UserCacheEntry> userCache;
+    std::list<uid_t> userCacheOrder;  // do mais recente para o mais antigo
+    std::atomic<unsigned long long> userCacheHits{0};
+    std::atomic<unsigned long long> userCacheMisses{0};
+    std::atomic<unsigned long long> userCacheEvictions{0};
+    std::atomic<unsigned long long> userCacheExpirations{0};
+
+    // informacoes imutaveis do sistema, obtidas uma unica vez
+    std::once_flag staticInfoOnce;
+    std::string osInfo;
+    std::string architectureInfo;
+    int coreCount = 0;
+    std::atomic<unsigned long long> staticInfoHits{0};
+    std::atomic<unsigned long long> staticInfoMisses{0};
+
+    void loadStaticInfo() {
+        bool loaded = false;
+        std::call_once(staticInfoOnce, [this, &loaded]() {
+            struct utsname buffer; // utsname struct
+            if (uname(&buffer) == 0) { // obtem informacoes do sistema
+                std::ostringstream os;
+                os << "OS: " << buffer.sysname << ", Release: " << buffer.release << ", Version: " << buffer.version;
+                osInfo = os.str();
+                std::ostringstream arch;
+                arch << "Architecture: " << buffer.machine;
+                architectureInfo = arch.str();
+            }
+            coreCount = sysconf(_SC_NPROCESSORS_ONLN);
+            loaded = true;
+        });
+        if (loaded) {
+            ++staticInfoMisses;
+        } else {
+            ++staticInfoHits;
+        }
+    }
+
+    // protege o estado mantido entre chamadas, ja que os getters
+    // podem ser chamados ao mesmo tempo por varias threads
+    std::mutex stateMutex;
+
+    // estado do amostrador de cpu (sampleCpu)
+    bool cpuSampled = false;
+    std::chrono::steady_clock::time_point cpuSampleTime;
+    CpuTimes prevAggregateTimes;
+    std::vector<CpuTimes> prevCoreTimes;
+    CpuPercentages cpuAggregate;
+    std::vector<CpuPercentages> cpuCores;
+    int cpuProcesses = 0;
+
+    // estado das taxas por processo (updateProcessRates): pid -> contadores
+    std::mutex processRatesMutex;
+    bool processSampled = false;
+    std::chrono::steady_clock::time_point processSampleTime;
+    std::unordered_map<int, ProcessCounters> processCounters;
+
+    // resultados do ultimo signalProcesses (getSignalResults)
+    std::mutex signalResultsMutex;
+    std::vector<SignalResult> signalResults;
+
+    // ultima leitura completa de /proc (storeLastScan / recentProcessTable)
+    std::mutex lastScanMutex;
+    bool lastScanValid = false;
+    std::chrono::steady_clock::time_point lastScanTime;
+    std::vector<ProcessRecord> lastScanRecords;
+    std::string lastScanStrings;
+
+    // fonte de eventos de processos (startProcessEvents): socket do netlink
+    // ou epoll dos pidfds observados (pid -> pidfd)
+    std::mutex processEventsMutex;
+    int processEventsMode = PROCESS_EVENTS_SCAN;
+    int processEventsFd = -1;
+    bool processEventsLost = false;
+    std::unordered_map<int, int> watchedPids;
+    std::deque<ProcessEvent> pendingProcessEvents;
+
+    // estado do amostrador de rede (sampleNetwork)
+    bool netSampled = false;
+    std::chrono::steady_clock::time_point netSampleTime;
+    double netInterval = 0;
+    std::unordered_map<std::string, NetInterfaceStats> netPrevCounters;
+    std::unordered_map<std::string, int> netPhysical;  // nome -> interface fisica
+    std::vector<NetInterfaceStats> netInterfaces;
+    std::vector<std::string> networkPatterns;
+
+    // estado do amostrador de discos (sampleDisks)
+    bool diskSampled = false;
+    std::chrono::steady_clock::time_point diskSampleTime;
+    double diskInterval = 0;
+    std::unordered_map<std::string, DiskCounters> diskPrevCounters;
+    std::unordered_map<std::string, std::pair<int, int>> diskKinds;  // nome -> (particao, fisico)
+    std::vector<DiskDeviceStats> diskDevices;
 };
 
+// copia o resultado para o buffer fornecido pelo chamador (truncando se
+// necessario) e retorna o tamanho completo do resultado, como snprintf.
+// se o retorno for >= capacity, o chamador deve repetir com um buffer maior
+static size_t copyToBuffer(const std::string& info, char* buffer, size_t capacity) {
+    if (buffer != NULL && capacity > 0) {
+        size_t length = std::min(info.size(), capacity - 1);
+        memcpy(buffer, info.data(), length);
+        buffer[length] = '\0';
+    }
+    return info.size();
+}
+
 extern "C" {
     SystemInfo* SystemInfo_new() { 
         return new SystemInfo(); 
     }
 
-    const char* getTotalMemory(SystemInfo* systemInfo) { 
-        return systemInfo->getTotalMemory();
+    size_t getTotalMemory(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getTotalMemory(), buffer, capacity);
+    }
+
+    size_t getFreeMemory(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getFreeMemory(), buffer, capacity);
+    }
+
+    size_t getUptime(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getUptime(), buffer, capacity);
+    }
+
+    size_t getLoadAverage(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getLoadAverage(), buffer, capacity);
+    }
+
+    size_t getProcessCount(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getProcessCount(), buffer, capacity);
+    }
+
+    size_t getCpuUsage(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getCpuUsage(), buffer, capacity);
     }
 
-    const char* getFreeMemory(SystemInfo* systemInfo) { 
-        return systemInfo->getFreeMemory();
+    size_t getCpuIdlePercentage(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getCpuIdlePercentage(), buffer, capacity);
     }
 
-    const char* getUptime(SystemInfo* systemInfo) { 
-        return systemInfo->getUptime();
+    size_t getThreadCount(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getThreadCount(), buffer, capacity);
     }
 
-    const char* getLoadAverage(SystemInfo* systemInfo) { 
-        return systemInfo->getLoadAverage();
+    size_t getUsedDisk(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getUsedDisk(), buffer, capacity);
     }
 
-    const char* getProcessCount(SystemInfo* systemInfo) { 
-        return systemInfo->getProcessCount();
+    size_t getFreeDisk(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getFreeDisk(), buffer, capacity);
     }
 
-    const char* getCpuUsage(SystemInfo* systemInfo) {
-        return systemInfo->getCpuUsage();
+    size_t getDiskRead(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getDiskRead(), buffer, capacity);
     }
 
-    const char* getCpuIdlePercentage(SystemInfo* systemInfo) {
-        return systemInfo->getCpuIdlePercentage();
+    size_t getDiskWrite(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getDiskWrite(), buffer, capacity);
     }
 
-    const char* getThreadCount(SystemInfo* systemInfo) {
-        return systemInfo->getThreadCount();
+    size_t getCpuTemperature(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getCpuTemperature(), buffer, capacity);
     }
 
-    const char* getUsedDisk(SystemInfo* systemInfo) {
-        return systemInfo->getUsedDisk();
+    size_t getNetworkReceiveRate(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getNetworkReceiveRate(), buffer, capacity);
     }
 
-    const char* getFreeDisk(SystemInfo* systemInfo) {
-        return systemInfo->getFreeDisk();
+    size_t getNetworkTransmitRate(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getNetworkTransmitRate(), buffer, capacity);
     }
 
-    const char* getDiskRead(SystemInfo* systemInfo) {
-        return systemInfo->getDiskRead();
+    size_t getSwapUsage(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getSwapUsage(), buffer, capacity);
     }
 
-    const char* getDiskWrite(SystemInfo* systemInfo) {
-        return systemInfo->getDiskWrite();
+    size_t getOsInfo(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getOsInfo(), buffer, capacity);
     }
 
-    const char* getCpuTemperature(SystemInfo* systemInfo) {
-        return systemInfo->getCpuTemperature();
+    size_t getArchitectureInfo(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getArchitectureInfo(), buffer, capacity);
     }
 
-    const char* getNetworkReceiveRate(SystemInfo* systemInfo) {
-        return systemInfo->getNetworkReceiveRate();
+    size_t getCpuInfo(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getCpuInfo(), buffer, capacity);
     }
 
-    const char* getNetworkTransmitRate(SystemInfo* systemInfo) {
-        return systemInfo->getNetworkTransmitRate();
+    size_t getProcessesInfo(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getProcessesInfo(), buffer, capacity);
     }
 
-    const char* getSwapUsage(SystemInfo* systemInfo) {
-        return systemInfo->getSwapUsage();
+    int getProcessRecords(SystemInfo* systemInfo, const int* pids, int count, ProcessRecord* records,
+                          int maxRecords, char* strings, size_t stringsCapacity, size_t* stringsLength) {
+        return systemInfo->getProcessRecords(pids, count, records, maxRecords, strings, stringsCapacity,
+                                             stringsLength);
     }
 
-    const char* getOsInfo(SystemInfo* systemInfo) {
-        return systemInfo->getOsInfo();
+    int startProcessEvents(SystemInfo* systemInfo, int preferred) {
+        return systemInfo->startProcessEvents(preferred);
     }
 
-    const char* getArchitectureInfo(SystemInfo* systemInfo) {
-        return systemInfo->getArchitectureInfo();
+    int watchProcesses(SystemInfo* systemInfo, const int* pids, int count) {
+        return systemInfo->watchProcesses(pids, count);
     }
 
-    const char* getCpuInfo(SystemInfo* systemInfo) {
-        return systemInfo->getCpuInfo();
+    int readProcessEvents(SystemInfo* systemInfo, ProcessEvent* events, int maxEvents, int timeoutMs) {
+        return systemInfo->readProcessEvents(events, maxEvents, timeoutMs);
     }
 
-    const char* getProcessesInfo(SystemInfo* systemInfo) { 
-        return systemInfo->getProcessesInfo();
+    void stopProcessEvents(SystemInfo* systemInfo) {
+        systemInfo->stopProcessEvents();
+    }
+
+    int signalProcesses(SystemInfo* systemInfo, const int* pids, int count, int signal, int flags,
+                        SignalResult* results, int maxResults, int* complete) {
+        return systemInfo->signalProcesses(pids, count, signal, flags, results, maxResults, complete);
+    }
+
+    int getSignalResults(SystemInfo* systemInfo, SignalResult* results, int maxResults) {
+        return systemInfo->getSignalResults(results, maxResults);
     }
 
     const int killProcess(SystemInfo* systemInfo, int pid) {
         return systemInfo->killProcess(pid);
     }
 
-    const char* getSpecificProcess(SystemInfo* systemInfo, int pid) {
-        return systemInfo->getSpecificProcess(pid);
+    size_t getSpecificProcess(SystemInfo* systemInfo, int pid, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getSpecificProcess(pid), buffer, capacity);
+    }
+
+    size_t getFileSystemInfo(SystemInfo* systemInfo, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getFileSystemInfo(), buffer, capacity);
+    }
+
+    size_t listDirectory(SystemInfo* systemInfo, const char* path, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->listDirectory(path), buffer, capacity);
+    }
+
+    size_t getProcessResources(SystemInfo* systemInfo, int pid, char* buffer, size_t capacity) {
+        return copyToBuffer(systemInfo->getProcessResources(pid), buffer, capacity);
+    }
+
+    void getSnapshot(SystemInfo* systemInfo, Snapshot* snapshot) {
+        systemInfo->getSnapshot(snapshot);
+    }
+
+    void* openFdCursor(SystemInfo* systemInfo, int pid, int* count) {
+        return systemInfo->openFdCursor(pid, count);
+    }
+
+    int readFdPage(SystemInfo* systemInfo, void* cursor, FileDescriptorRecord* records, int maxRecords,
+                   char* strings, size_t stringsCapacity, size_t* stringsLength) {
+        return systemInfo->readFdPage((FdCursor*)cursor, records, maxRecords, strings, stringsCapacity, stringsLength);
+    }
+
+    void closeFdCursor(SystemInfo* systemInfo, void* cursor) {
+        systemInfo->closeFdCursor((FdCursor*)cursor);
+    }
+
+    void* openProcessDetail(SystemInfo* systemInfo, int pid, ProcessStaticInfo* info) {
+        return systemInfo->openProcessDetail(pid, info);
+    }
+
+    int readProcessDetail(SystemInfo* systemInfo, void* handle, int sections, ProcessDynamicInfo* info,
+                          ThreadRecord* changed, int maxChanged, int* removed, int maxRemoved, int* removedCount,
+                          char* strings, size_t stringsCapacity, size_t* stringsLength) {
+        return systemInfo->readProcessDetail((ProcessDetailHandle*)handle, sections, info, changed, maxChanged,
+                                             removed, maxRemoved, removedCount, strings, stringsCapacity,
+                                             stringsLength);
+    }
+
+    void closeProcessDetail(SystemInfo* systemInfo, void* handle) {
+        systemInfo->closeProcessDetail((ProcessDetailHandle*)handle);
+    }
+
+    int getTopProcesses(SystemInfo* systemInfo, int sortKey, int n, const char* filter, ProcessRecord* records,
+                        char* strings, size_t stringsCapacity, size_t* stringsLength) {
+        return systemInfo->getTopProcesses(sortKey, n, filter, records, strings, stringsCapacity, stringsLength);
+    }
+
+    void getDiskStats(SystemInfo* systemInfo, DiskStats* stats) {
+        systemInfo->getDiskStats(stats);
+    }
+
+    void getNetworkStats(SystemInfo* systemInfo, NetworkStats* stats) {
+        systemInfo->getNetworkStats(stats);
+    }
+
+    void setNetworkPatterns(SystemInfo* systemInfo, const char* patterns) {
+        systemInfo->setNetworkPatterns(patterns);
+    }
+
+    int getCpuUsagePerCore(SystemInfo* systemInfo, float* values, int maxCores) {
+        return systemInfo->getCpuUsagePerCore(values, maxCores);
+    }
+
+    int getCoreCount(SystemInfo* systemInfo) {
+        return systemInfo->getCoreCount();
+    }
+
+    void getCacheStats(SystemInfo* systemInfo, CacheStats* stats) {
+        systemInfo->getCacheStats(stats);
+    }
+
+    void clearUserCache(SystemInfo* systemInfo) {
+        systemInfo->clearUserCache();
+    }
+
+    void setProcessScanWorkers(SystemInfo* systemInfo, int workers) {
+        systemInfo->setProcessScanWorkers(workers);
+    }
+
+    int getProcessTable(SystemInfo* systemInfo, ProcessRecord* records, int maxRecords,
+                        char* strings, size_t stringsCapacity, size_t* stringsLength) {
+        return systemInfo->getProcessTable(records, maxRecords, strings, stringsCapacity, stringsLength);
+    }
+
+    // leitura paginada de diretorios: o cursor (DIR*) eh aberto por
+    // openDirectory, lido com readDirectoryPage e liberado com closeDirectory
+    void* openDirectory(SystemInfo* systemInfo, const char* path) {
+        return opendir(path);
     }
 
-    const char* getFileSystemInfo(SystemInfo* systemInfo) {
-        return systemInfo->getFileSystemInfo();
+    int readDirectoryPage(SystemInfo* systemInfo, void* cursor, DirectoryEntry* records, int maxRecords,
+                          char* strings, size_t stringsCapacity, size_t* stringsLength, int withStat) {
+        return SystemInfo::readDirectoryPage((DIR*)cursor, records, maxRecords,
+                                             strings, stringsCapacity, stringsLength, withStat);
     }
 
-    const char* listDirectory(SystemInfo* systemInfo, const char* path) {
-        return systemInfo->listDirectory(path);
+    void closeDirectory(SystemInfo* systemInfo, void* cursor) {
+        closedir((DIR*)cursor);
     }
 
-    const char* getProcessResources(SystemInfo* systemInfo, int pid) {
-        return systemInfo->getProcessResources(pid);
+    int statDirectoryEntries(SystemInfo* systemInfo, const char* path, DirectoryEntry* records,
+                             int count, const char* strings) {
+        return SystemInfo::statDirectoryEntries(path, records, count, strings);
     }
 }
\ No newline at end of file
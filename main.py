@@ -1,8 +1,43 @@
+import argparse
+import sys
 import tkinter as tk
-from dashboard_app import DashboardApp
+from shared_snapshot import DEFAULT_NAME, run_collector, SnapshotReader
 
-root = tk.Tk()
-app = DashboardApp(root)
+parser = argparse.ArgumentParser(description="System Dashboard")
+parser.add_argument("--collector", action="store_true",
+                    help="coleta sem interface e publica os snapshots em memoria compartilhada")
+parser.add_argument("--attach", action="store_true",
+                    help="le os snapshots de um coletor em execucao em vez de coletar localmente")
+parser.add_argument("--shm-name", default=DEFAULT_NAME, help="nome da memoria compartilhada")
+parser.add_argument("--interval", type=int, default=500, help="intervalo do coletor (ms)")
+parser.add_argument("--record", metavar="DIR", help="grava todas as amostras neste diretorio")
+parser.add_argument("--replay", metavar="DIR", help="reproduz uma gravacao feita com --record")
+args = parser.parse_args()
 
-root.protocol("WM_DELETE_WINDOW", app.stop)
-root.mainloop()
+if args.collector:
+    run_collector(args.shm_name, args.interval / 1000, record_path=args.record)
+elif args.replay:
+    from replay_view import ReplayWindow
+
+    root = tk.Tk()
+    replay = ReplayWindow(root, args.replay)
+
+    root.protocol("WM_DELETE_WINDOW", root.quit)
+    root.mainloop()
+else:
+    from dashboard_app import DashboardApp
+
+    snapshot_reader = None
+    if args.attach:
+        try:
+            snapshot_reader = SnapshotReader(args.shm_name)
+        except FileNotFoundError:
+            sys.exit(f"no collector is publishing on '{args.shm_name}'; start one with: main.py --collector")
+        except RuntimeError as e:
+            sys.exit(str(e))
+
+    root = tk.Tk()
+    app = DashboardApp(root, snapshot_reader, args.record)
+
+    root.protocol("WM_DELETE_WINDOW", app.stop)
+    root.mainloop()
@@ -0,0 +1,52 @@
+import numpy as np
+
+# historico circular de metricas (linhas x comprimento) em arrays numpy
+# pre-alocados. cada amostra eh gravada duas vezes (posicoes i e i + length),
+# assim a janela do mais antigo ao mais recente eh sempre uma fatia contigua
+# do array e pode ser entregue ao matplotlib (Line2D.set_data) sem copia
+class MetricHistory:
+    def __init__(self, rows, length, fill=0.0):
+        self.rows = rows
+        self.length = length
+        self._data = np.empty((rows, 2 * length), dtype=np.float64)
+        self._cumsum = np.empty((rows, length), dtype=np.float64)
+        self._mean = np.empty((rows, length), dtype=np.float64)
+        self._head = 0  # posicao da amostra mais antiga
+        # eixo x compartilhado por todas as linhas
+        self.xdata = np.arange(length)
+        self.fill(fill)
+
+    # preenche todo o historico com um valor (ou um valor por linha)
+    def fill(self, values):
+        self._data[:] = np.reshape(np.asarray(values, dtype=np.float64), (-1, 1))
+        self._head = 0
+
+    # adiciona uma amostra (um valor por linha) descartando a mais antiga, em O(1)
+    def append(self, values):
+        values = np.asarray(values, dtype=np.float64)[:self.rows]
+        self._data[:len(values), self._head] = values
+        self._data[:len(values), self._head + self.length] = values
+        self._head = (self._head + 1) % self.length
+
+    # visao (sem copia) das amostras, da mais antiga para a mais recente
+    def values(self):
+        return self._data[:, self._head:self._head + self.length]
+
+    def row(self, index):
+        return self.values()[index]
+
+    def latest(self):
+        return self._data[:, self._head + self.length - 1]
+
+    def max(self):
+        return float(self.values().max())
+
+    # media movel das ultimas `window` amostras calculada com somas acumuladas;
+    # no inicio do historico a media usa apenas as amostras disponiveis.
+    # o resultado fica em um buffer reutilizado a cada chamada
+    def rolling_mean(self, window):
+        window = max(1, min(window, self.length))
+        cumsum = np.cumsum(self.values(), axis=1, out=self._cumsum)
+        self._mean[:, :window] = cumsum[:, :window] / np.arange(1, window + 1)
+        self._mean[:, window:] = (cumsum[:, window:] - cumsum[:, :-window]) / window
+        return self._mean
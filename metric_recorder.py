@@ -0,0 +1,243 @@
+import json
+import os
+import threading
+import time
+import numpy as np
+
+CHUNK_SAMPLES = 1024            # amostras por bloco compactado
+TIER_FACTORS = (16, 128, 1024)  # amostras por ponto em cada nivel reduzido
+FLUSH_INTERVAL = 5.0            # segundos entre gravacoes em disco
+META_FILE = "meta.json"
+JOURNAL_FILE = "journal.bin"
+SAMPLES_FILE = "samples.bin"
+RECORDING_FORMAT = 2            # 2: o diario comeca com o indice do seu bloco
+JOURNAL_HEADER_SIZE = 8
+
+# colunas gravadas a partir de um snapshot: horario (relogio de parede),
+# metricas globais e o uso de cada core
+SNAPSHOT_COLUMNS = ("time", "cpuUsage", "memoryUsage", "swapUsage", "networkReceiveRate",
+                    "networkTransmitRate", "diskRead", "diskWrite")
+
+def snapshot_columns(num_cores):
+    return SNAPSHOT_COLUMNS + tuple(f"core{core}" for core in range(num_cores))
+
+def snapshot_values(snapshot, num_cores, when=None):
+    values = [time.time() if when is None else when]
+    values.extend(getattr(snapshot, column) for column in SNAPSHOT_COLUMNS[1:])
+    values.extend(snapshot.coreValues[:num_cores])
+    return values
+
+def _tier_file(factor):
+    return f"tier_{factor}.bin"
+
+def _file_size(path):
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+# gravacao das amostras em um diretorio, em formato binario de largura fixa
+# (float64). as amostras novas vao para um diario de registros por linha,
+# apenas acrescentado; a cada CHUNK_SAMPLES amostras o diario eh compactado em
+# um bloco colunar (coluna a coluna) no fim de samples.bin e os niveis
+# reduzidos (min/max/media a cada N amostras) recebem os pontos do bloco.
+# append() so guarda a amostra em memoria: a escrita, a compactacao e o fsync
+# rodam em lote em uma thread propria, entao quem coleta nunca espera o disco.
+#
+# a compactacao pode ser interrompida em qualquer ponto sem duplicar dados:
+# cada bloco eh escrito na sua posicao (indice * tamanho), os niveis antes
+# de samples.bin, e o bloco so conta como gravado quando samples.bin o
+# contem inteiro. o diario comeca com o indice do bloco a que suas linhas
+# pertencem; um diario com indice menor que o numero de blocos ja foi
+# compactado e eh descartado ao abrir
+class MetricRecorder:
+    def __init__(self, path, columns, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.columns = tuple(columns)
+        self.flush_interval = flush_interval
+        self.record_size = len(self.columns) * 8
+        os.makedirs(path, exist_ok=True)
+
+        meta_path = os.path.join(path, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if (tuple(meta["columns"]) != self.columns or meta["chunk"] != CHUNK_SAMPLES
+                    or meta.get("format", 1) != RECORDING_FORMAT):
+                raise ValueError(f"recording {path} has a different layout")
+        else:
+            with open(meta_path, "w") as f:
+                json.dump({"columns": self.columns, "chunk": CHUNK_SAMPLES,
+                           "tiers": TIER_FACTORS, "format": RECORDING_FORMAT}, f)
+
+        # blocos gravados por inteiro; o resto de uma compactacao
+        # interrompida (em samples.bin e nos niveis) eh descartado
+        chunk_bytes = CHUNK_SAMPLES * self.record_size
+        self.chunks = _file_size(os.path.join(path, SAMPLES_FILE)) // chunk_bytes
+        for name, size in [(SAMPLES_FILE, chunk_bytes)] + [
+                (_tier_file(factor), self._tier_bytes(factor)) for factor in TIER_FACTORS]:
+            file_path = os.path.join(path, name)
+            if _file_size(file_path) > self.chunks * size:
+                os.truncate(file_path, self.chunks * size)
+
+        self.journal = os.open(os.path.join(path, JOURNAL_FILE), os.O_RDWR | os.O_CREAT, 0o644)
+        journal_size = os.fstat(self.journal).st_size
+        if journal_size < JOURNAL_HEADER_SIZE:
+            self._reset_journal()
+        else:
+            index = int.from_bytes(os.pread(self.journal, JOURNAL_HEADER_SIZE, 0), "little")
+            if index > self.chunks:
+                raise ValueError(f"recording {path} is missing compacted samples")
+            if index < self.chunks:
+                # compactacao interrompida depois de gravar o bloco
+                self._reset_journal()
+            else:
+                # descarta um registro incompleto deixado por uma gravacao interrompida
+                rows = (journal_size - JOURNAL_HEADER_SIZE) // self.record_size
+                os.ftruncate(self.journal, JOURNAL_HEADER_SIZE + rows * self.record_size)
+                self.journal_rows = rows
+        os.lseek(self.journal, 0, os.SEEK_END)
+
+        self._pending = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._running = True
+        self._thread = threading.Thread(target=self._writer, name="metric-recorder", daemon=True)
+        self._thread.start()
+
+    # pode ser chamado de qualquer thread; nao faz I/O
+    def append(self, values):
+        with self._lock:
+            self._pending.append(values)
+
+    def _writer(self):
+        while self._running:
+            self._wake.wait(self.flush_interval)
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        rows = np.asarray(pending, dtype=np.float64).reshape(len(pending), len(self.columns))
+        while len(rows):
+            # completa o bloco atual do diario e compacta quando ele enche
+            take = CHUNK_SAMPLES - self.journal_rows
+            os.write(self.journal, rows[:take].tobytes())
+            self.journal_rows += len(rows[:take])
+            rows = rows[take:]
+            if self.journal_rows == CHUNK_SAMPLES:
+                self._compact()
+        os.fsync(self.journal)
+
+    def _tier_bytes(self, factor):
+        return CHUNK_SAMPLES // factor * self.record_size * 3
+
+    # esvazia o diario para as linhas do bloco self.chunks. o indice eh
+    # escrito depois do truncamento: interrompido no meio, fica um diario
+    # vazio com o indice antigo, descartado na proxima abertura
+    def _reset_journal(self):
+        os.ftruncate(self.journal, min(os.fstat(self.journal).st_size, JOURNAL_HEADER_SIZE))
+        os.pwrite(self.journal, self.chunks.to_bytes(JOURNAL_HEADER_SIZE, "little"), 0)
+        os.fsync(self.journal)
+        os.lseek(self.journal, 0, os.SEEK_END)
+        self.journal_rows = 0
+
+    # transforma o diario cheio em um bloco colunar e gera os niveis reduzidos
+    def _compact(self):
+        data = os.pread(self.journal, CHUNK_SAMPLES * self.record_size, JOURNAL_HEADER_SIZE)
+        rows = np.frombuffer(data, dtype=np.float64).reshape(CHUNK_SAMPLES, len(self.columns))
+        chunk = np.ascontiguousarray(rows.T)
+
+        for factor in TIER_FACTORS:
+            buckets = chunk.reshape(len(self.columns), -1, factor)
+            # um registro por ponto: min, max e media de cada coluna
+            tier = np.stack((buckets.min(axis=2), buckets.max(axis=2), buckets.mean(axis=2)), axis=2)
+            self._write_at(_tier_file(factor), self.chunks * self._tier_bytes(factor),
+                           np.ascontiguousarray(tier.transpose(1, 0, 2)).tobytes())
+        # o bloco so passa a contar quando samples.bin o contem inteiro
+        self._write_at(SAMPLES_FILE, self.chunks * CHUNK_SAMPLES * self.record_size, chunk.tobytes())
+
+        self.chunks += 1
+        self._reset_journal()
+
+    def _write_at(self, name, offset, data):
+        fd = os.open(os.path.join(self.path, name), os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            os.pwrite(fd, data, offset)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def close(self):
+        self._running = False
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+        os.close(self.journal)
+
+
+# leitura de uma gravacao: os blocos colunares e os niveis reduzidos sao
+# mapeados em memoria (np.memmap) e o diario eh lido no momento da abertura.
+# so os blocos inteiros de samples.bin contam, como no MetricRecorder
+class RecordingReader:
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, META_FILE)) as f:
+            meta = json.load(f)
+        self.columns = tuple(meta["columns"])
+        self.chunk = meta["chunk"]
+        self.tiers = tuple(meta["tiers"])
+        self.index = {column: i for i, column in enumerate(self.columns)}
+        width = len(self.columns)
+
+        self.chunks = self._map(SAMPLES_FILE, (width, self.chunk))
+        self.journal = self._read_journal(meta.get("format", 1), width)
+        # pontos dos niveis alem dos blocos inteiros sao de uma compactacao interrompida
+        self._tiers = {factor: self._map(_tier_file(factor), (width, 3))[:len(self.chunks) * self.chunk // factor]
+                       for factor in self.tiers}
+
+    def _read_journal(self, recording_format, width):
+        journal_path = os.path.join(self.path, JOURNAL_FILE)
+        offset = JOURNAL_HEADER_SIZE if recording_format >= 2 else 0
+        if _file_size(journal_path) < offset:
+            return np.empty((width, 0), dtype=np.float64)
+        if offset:
+            with open(journal_path, "rb") as f:
+                index = int.from_bytes(f.read(JOURNAL_HEADER_SIZE), "little")
+            if index != len(self.chunks):
+                # linhas ja compactadas (ou de um bloco que falta)
+                return np.empty((width, 0), dtype=np.float64)
+        journal = np.fromfile(journal_path, dtype=np.float64, offset=offset)
+        return journal[:len(journal) - len(journal) % width].reshape(-1, width).T
+
+    def _map(self, name, shape):
+        file_path = os.path.join(self.path, name)
+        record = int(np.prod(shape)) * 8
+        records = _file_size(file_path) // record
+        if records == 0:
+            return np.empty((0,) + shape, dtype=np.float64)
+        return np.memmap(file_path, dtype=np.float64, mode="r", shape=(records,) + shape)
+
+    def __len__(self):
+        return len(self.chunks) * self.chunk + self.journal.shape[1]
+
+    # amostras [start, stop) de uma coluna, em ordem; so os blocos do
+    # intervalo sao lidos do arquivo mapeado
+    def column(self, name, start=0, stop=None):
+        i = self.index[name]
+        stop = len(self) if stop is None else min(stop, len(self))
+        compacted = len(self.chunks) * self.chunk
+        parts = []
+        if start < min(stop, compacted):
+            first = start // self.chunk
+            last = (min(stop, compacted) - 1) // self.chunk + 1
+            part = self.chunks[first:last, i, :].reshape(-1)
+            parts.append(part[start - first * self.chunk:min(stop, compacted) - first * self.chunk])
+        if stop > compacted:
+            parts.append(self.journal[i][max(start - compacted, 0):stop - compacted])
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.float64)
+
+    # nivel reduzido de uma coluna: matriz (pontos, 3) com min, max e media
+    # de cada grupo de `factor` amostras (so cobre os blocos compactados)
+    def tier(self, factor, name):
+        return self._tiers[factor][:, self.index[name], :]
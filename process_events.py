@@ -0,0 +1,51 @@
+from system_info import PROCESS_EVENT_START, PROCESS_EVENT_CHANGE, PROCESS_EVENT_EXIT
+
+
+# acompanha inicios e saidas de processos pela fonte de eventos da
+# biblioteca (SystemInfo.start_process_events) para que a tabela de
+# processos seja atualizada sem reler /proc inteiro:
+#   - netlink: inicios, execs e saidas de todos os processos
+#   - pidfd: so as saidas dos processos observados; os novos continuam
+#     aparecendo apenas na releitura completa, que os passa a observar
+#   - scan: sem eventos (sem permissao ou kernel antigo); so a releitura
+class ProcessEventTracker:
+    def __init__(self, sys_info, mode="auto"):
+        self.sys_info = sys_info
+        self.mode = sys_info.start_process_events(mode)
+
+    # deve ser chamado com cada tabela completa (get_process_table)
+    def on_full_scan(self, process_table):
+        if self.mode == "pidfd":
+            self.sys_info.watch_processes(process_table.records['pid'].tolist())
+
+    # le os eventos pendentes e os reduz ao estado final de cada pid.
+    # retorna ('events', (tabela dos processos novos ou alterados, pids
+    # encerrados)), ('resync', None) se eventos foram perdidos e a tabela
+    # deve ser relida por completo, ou None se nada mudou
+    def poll(self, timeout=0):
+        events = self.sys_info.read_process_events(timeout)
+        if events is None:
+            return ('resync', None)
+        if not events:
+            return None
+
+        changed = {}
+        removed = set()
+        for event_type, pid, ppid, exit_code in events:
+            if event_type in (PROCESS_EVENT_START, PROCESS_EVENT_CHANGE):
+                changed[pid] = True
+                removed.discard(pid)
+            elif event_type == PROCESS_EVENT_EXIT:
+                changed.pop(pid, None)
+                removed.add(pid)
+
+        table = self.sys_info.get_process_records(sorted(changed))
+        if self.mode == "pidfd" and len(table):
+            self.sys_info.watch_processes(table.records['pid'].tolist())
+        # processos que terminaram antes de serem lidos tambem saem da tabela
+        read = set(table.records['pid'].tolist())
+        removed.update(pid for pid in changed if pid not in read)
+        return ('events', (table, sorted(removed)))
+
+    def close(self):
+        self.sys_info.stop_process_events()
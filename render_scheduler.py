@@ -0,0 +1,71 @@
+import time
+
+# agenda o redesenho dos graficos de uma figura matplotlib em um canvas tk.
+# os eixos alterados sao marcados como "sujos" e redesenhados juntos no
+# maximo uma vez por quadro (fps configuravel). as linhas registradas sao
+# animadas: o fundo de cada eixo (grade, rotulos, legenda) fica em cache e
+# apenas as linhas sao repintadas (blitting). quando os limites de um eixo
+# mudam, eh feito um redesenho completo que atualiza o cache
+class RenderScheduler:
+    def __init__(self, root, canvas, fps=10):
+        self.root = root
+        self.canvas = canvas
+        self.interval = 1.0 / fps
+        self._artists = {}       # eixo -> linhas animadas
+        self._backgrounds = {}   # eixo -> fundo em cache
+        self._dirty = set()
+        self._full_redraw = True
+        self._pending = None
+        self._last_render = 0.0
+        # um redesenho completo (inclusive por redimensionamento) recria o cache
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    # registra as linhas de um eixo que serao atualizadas por blitting
+    def register(self, ax, artists):
+        for artist in artists:
+            artist.set_animated(True)
+        self._artists.setdefault(ax, []).extend(artists)
+        self._full_redraw = True
+
+    # marca o eixo para ser redesenhado no proximo quadro; com
+    # full_redraw=True (ex.: apos set_ylim) o fundo tambem eh refeito
+    def mark_dirty(self, ax, full_redraw=False):
+        self._dirty.add(ax)
+        if full_redraw:
+            self._full_redraw = True
+        self._schedule()
+
+    def _schedule(self):
+        if self._pending is not None:
+            return
+        wait = self.interval - (time.monotonic() - self._last_render)
+        self._pending = self.root.after(max(0, int(wait * 1000)), self._render)
+
+    def _render(self):
+        self._pending = None
+        self._last_render = time.monotonic()
+        if self._full_redraw or any(ax not in self._backgrounds for ax in self._dirty):
+            # o draw_event redesenha as linhas e atualiza o cache
+            self.canvas.draw()
+        else:
+            for ax in self._dirty:
+                self.canvas.restore_region(self._backgrounds[ax])
+                self._draw_artists(ax)
+                self.canvas.blit(ax.bbox)
+        self._dirty.clear()
+
+    def _on_draw(self, event):
+        self._full_redraw = False
+        self._backgrounds = {ax: self.canvas.copy_from_bbox(ax.bbox) for ax in self._artists}
+        # o canvas tk copia o buffer para a tela ao final do draw
+        for ax in self._artists:
+            self._draw_artists(ax)
+
+    def _draw_artists(self, ax):
+        for artist in self._artists[ax]:
+            ax.draw_artist(artist)
+
+    def stop(self):
+        if self._pending is not None:
+            self.root.after_cancel(self._pending)
+            self._pending = None
@@ -0,0 +1,165 @@
+import tkinter as tk
+import numpy as np
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from metric_recorder import RecordingReader
+
+SECONDS_PER_DAY = 86400.0  # eixos de data do matplotlib usam dias desde 1970
+LOD_POINTS_PER_COLUMN = 4  # amostras lidas por coluna de pixel antes de usar um nivel reduzido
+
+# reduz (x, y) a no maximo dois pontos (min e max) por coluna de pixel. a
+# linha resultante desenha um traco vertical por coluna e preserva os picos,
+# ao contrario de pegar uma amostra a cada N
+def min_max_decimate(x, ymin, ymax, columns):
+    if len(x) <= 2 * columns:
+        if ymin is ymax:
+            return x, ymin
+        return np.repeat(x, 2), np.column_stack((ymin, ymax)).ravel()
+    edges = np.linspace(x[0], x[-1], columns + 1)[:-1]
+    starts = np.unique(np.searchsorted(x, edges))
+    mins = np.minimum.reduceat(ymin, starts)
+    maxs = np.maximum.reduceat(ymax, starts)
+    return np.repeat(x[starts], 2), np.column_stack((mins, maxs)).ravel()
+
+
+# niveis de detalhe de uma gravacao: para um intervalo de tempo, usa as
+# amostras originais quando sao poucas e, senao, o nivel reduzido (min/max
+# gravados a cada N amostras) mais fino que caiba no orcamento de pontos
+class RecordingLod:
+    def __init__(self, reader):
+        self.reader = reader
+        self.time = reader.column("time")
+        self._levels = {}  # (fator, coluna) -> (x, min, max)
+
+    def time_range(self):
+        return self.time[0], self.time[-1]
+
+    def _level(self, factor, name):
+        key = (factor, name)
+        if key not in self._levels:
+            reader = self.reader
+            tier = reader.tier(factor, name)
+            # o fim da gravacao ainda nao compactado entra com as amostras originais
+            compacted = len(reader.chunks) * reader.chunk
+            tail = reader.column(name, compacted)
+            x = np.concatenate((reader.tier(factor, "time")[:, 0], self.time[compacted:]))
+            self._levels[key] = (x, np.concatenate((tier[:, 0], tail)), np.concatenate((tier[:, 1], tail)))
+        return self._levels[key]
+
+    @staticmethod
+    def _span(x, t0, t1):
+        # inclui um ponto de cada lado para a linha chegar as bordas do eixo
+        start = max(np.searchsorted(x, t0, "left") - 1, 0)
+        stop = min(np.searchsorted(x, t1, "right") + 1, len(x))
+        return start, stop
+
+    def query(self, name, t0, t1, columns):
+        start, stop = self._span(self.time, t0, t1)
+        budget = LOD_POINTS_PER_COLUMN * columns
+        if stop - start <= budget:
+            y = self.reader.column(name, start, stop)
+            return min_max_decimate(self.time[start:stop], y, y, columns)
+
+        factor = self.reader.tiers[-1]
+        for tier_factor in self.reader.tiers:
+            if (stop - start) / tier_factor <= budget:
+                factor = tier_factor
+                break
+        x, ymin, ymax = self._level(factor, name)
+        start, stop = self._span(x, t0, t1)
+        return min_max_decimate(x[start:stop], ymin[start:stop], ymax[start:stop], columns)
+
+
+# reproducao de uma gravacao (main.py --replay) nos mesmos quatro graficos do
+# painel, com eixo x de data/hora. zoom e deslocamento pela barra do
+# matplotlib ou pelo controle deslizante; a cada mudanca de limites as linhas
+# sao recalculadas para a largura do eixo em pixels
+class ReplayWindow:
+    def __init__(self, root, path):
+        self.root = root
+        self.root.title(f"System Dashboard - Replay ({path})")
+        self.root.geometry("1200x600")
+        self.root.minsize(800, 600)
+
+        self.lod = RecordingLod(RecordingReader(path))
+        if len(self.lod.time) < 2:
+            raise ValueError(f"recording {path} has no samples")
+        self.first_time, self.last_time = self.lod.time_range()
+        self._pending = None
+
+        self.fig, ((self.cpu_ax, self.mem_ax), (self.net_ax, self.disk_ax)) = plt.subplots(
+            2, 2, figsize=(12, 8), sharex=True)
+        self.fig.tight_layout(pad=3.0)
+
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.root)
+        toolbar = NavigationToolbar2Tk(self.canvas, self.root, pack_toolbar=False)
+        toolbar.update()
+        toolbar.pack(side=tk.BOTTOM, fill=tk.X)
+
+        # controle deslizante: desloca a janela visivel mantendo a largura
+        self.scrub = tk.Scale(self.root, from_=self.first_time, to=self.last_time, orient=tk.HORIZONTAL,
+                              showvalue=False, resolution=0, command=self.on_scrub)
+        self.scrub.pack(side=tk.BOTTOM, fill=tk.X)
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+
+        # (linha, coluna da gravacao) de cada grafico
+        self.lines = []
+        num_cores = sum(1 for column in self.lod.reader.columns if column.startswith("core"))
+        for core in range(num_cores):
+            self.add_line(self.cpu_ax, f"core{core}", label=f"Core {core + 1}")
+        self.add_line(self.mem_ax, "memoryUsage", color="salmon", label="Memory Usage")
+        self.add_line(self.mem_ax, "swapUsage", color="blue", label="Swap Usage")
+        self.add_line(self.net_ax, "networkReceiveRate", color="lightgreen", label="Download")
+        self.add_line(self.net_ax, "networkTransmitRate", color="orange", label="Upload")
+        self.add_line(self.disk_ax, "diskRead", color="purple", label="Disk Read")
+        self.add_line(self.disk_ax, "diskWrite", color="red", label="Disk Write")
+
+        for ax, title in ((self.cpu_ax, "CPU Usage (%)"), (self.mem_ax, "Memory and Swap Usage (%)"),
+                          (self.net_ax, "Network Usage (KB/s)"), (self.disk_ax, "Disk Usage (MB/s)")):
+            ax.set_title(title)
+            ax.legend(loc="upper left")
+            ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(ax.xaxis.get_major_locator()))
+        self.cpu_ax.set_ylim(0, 100)
+        self.mem_ax.set_ylim(0, 100)
+
+        # os eixos compartilham o x, entao basta observar um deles
+        self.cpu_ax.callbacks.connect("xlim_changed", self.on_xlim_changed)
+        self.canvas.mpl_connect("resize_event", lambda event: self.schedule_refresh())
+        self.cpu_ax.set_xlim(self.first_time / SECONDS_PER_DAY, self.last_time / SECONDS_PER_DAY)
+
+    def add_line(self, ax, column, **kwargs):
+        line, = ax.plot([], [], **kwargs)
+        self.lines.append((line, column))
+
+    def on_xlim_changed(self, ax):
+        self.schedule_refresh()
+
+    def on_scrub(self, value):
+        x0, x1 = self.cpu_ax.get_xlim()
+        half_width = (x1 - x0) / 2
+        center = float(value) / SECONDS_PER_DAY
+        self.cpu_ax.set_xlim(center - half_width, center + half_width)
+
+    # varias mudancas seguidas (ex.: arrastar no modo pan) geram um unico recalculo
+    def schedule_refresh(self):
+        if self._pending is None:
+            self._pending = self.root.after_idle(self.refresh)
+
+    def refresh(self):
+        self._pending = None
+        x0, x1 = self.cpu_ax.get_xlim()
+        t0, t1 = x0 * SECONDS_PER_DAY, x1 * SECONDS_PER_DAY
+        columns = max(int(self.cpu_ax.bbox.width), 1)
+
+        visible_max = {}
+        for line, column in self.lines:
+            x, y = self.lod.query(column, t0, t1, columns)
+            line.set_data(x / SECONDS_PER_DAY, y)
+            if len(y):
+                visible_max[line.axes] = max(visible_max.get(line.axes, 0.0), float(y.max()))
+
+        # graficos sem limite fixo acompanham o maior valor visivel
+        for ax in (self.net_ax, self.disk_ax):
+            ax.set_ylim(0, max(visible_max.get(ax, 0.0) * 1.1, 1.0))
+        self.canvas.draw_idle()
@@ -0,0 +1,97 @@
+import os
+import threading
+import tkinter as tk
+
+# entrega os resultados das threads de trabalho para a thread da interface.
+# cada janela assina os topicos que lhe interessam; as threads publicam
+# (topico, dados) e acordam o loop do tk apenas quando ha dados novos, por
+# meio de um pipe registrado com createfilehandler (ou, onde ele nao existe,
+# de um evento virtual). todos os resultados acumulados ate o loop acordar
+# sao tratados em um unico lote
+class ResultDispatcher:
+    WAKE_EVENT = "<<ResultsReady>>"
+
+    def __init__(self, root):
+        self.root = root
+        self._lock = threading.Lock()
+        self._pending = []          # (topico, dados) na ordem de publicacao
+        self._wake_pending = False  # ja existe um aviso nao tratado
+        self._subscriptions = {}    # topico -> [(handler, batch, latest_only)]
+        self._pipe = None
+
+        try:
+            read_fd, write_fd = os.pipe()
+            os.set_blocking(read_fd, False)
+            self.root.tk.createfilehandler(read_fd, tk.READABLE, self._on_readable)
+            self._pipe = (read_fd, write_fd)
+        except (AttributeError, tk.TclError, OSError):
+            # sem createfilehandler (ex.: windows): acorda com um evento virtual
+            self.root.bind(self.WAKE_EVENT, lambda event: self._dispatch())
+
+    # registra um handler para um topico. por padrao ele eh chamado uma vez por
+    # resultado; com latest_only=True apenas o mais recente do lote eh entregue
+    # e com batch=True o handler recebe a lista de resultados do lote. se owner
+    # for um widget, a assinatura eh removida quando ele for destruido
+    def subscribe(self, topic, handler, owner=None, batch=False, latest_only=False):
+        subscription = (handler, batch, latest_only)
+        self._subscriptions.setdefault(topic, []).append(subscription)
+        if owner is not None:
+            def on_destroy(event):
+                if event.widget is owner:
+                    self.unsubscribe(topic, handler)
+            owner.bind("<Destroy>", on_destroy, add="+")
+
+    def unsubscribe(self, topic, handler):
+        subscriptions = self._subscriptions.get(topic, [])
+        subscriptions[:] = [s for s in subscriptions if s[0] is not handler]
+        if not subscriptions:
+            self._subscriptions.pop(topic, None)
+
+    # pode ser chamado de qualquer thread
+    def publish(self, topic, data):
+        with self._lock:
+            self._pending.append((topic, data))
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+        try:
+            if self._pipe is not None:
+                os.write(self._pipe[1], b"\0")
+            else:
+                self.root.event_generate(self.WAKE_EVENT, when="tail")
+        except (OSError, tk.TclError, RuntimeError):
+            # interface encerrada
+            pass
+
+    def _on_readable(self, fd, mask):
+        try:
+            os.read(fd, 4096)
+        except BlockingIOError:
+            pass
+        self._dispatch()
+
+    def _dispatch(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._wake_pending = False
+
+        batches = {}
+        for topic, data in pending:
+            batches.setdefault(topic, []).append(data)
+
+        for topic, items in batches.items():
+            for handler, batch, latest_only in list(self._subscriptions.get(topic, ())):
+                if batch:
+                    handler(items)
+                elif latest_only:
+                    handler(items[-1])
+                else:
+                    for data in items:
+                        handler(data)
+
+    def close(self):
+        if self._pipe is not None:
+            self.root.tk.deletefilehandler(self._pipe[0])
+            for fd in self._pipe:
+                os.close(fd)
+            self._pipe = None
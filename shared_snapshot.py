@@ -0,0 +1,253 @@
+import ctypes
+import mmap
+import os
+import signal
+import threading
+import time
+from ctypes import Structure, c_uint32, c_int64, c_uint64, c_double
+from multiprocessing import shared_memory
+
+from system_info import SystemInfo, Snapshot
+from metric_recorder import MetricRecorder, snapshot_columns, snapshot_values
+
+DEFAULT_NAME = "dashboard_snapshots"
+SHM_DIR = "/dev/shm"
+DEFAULT_CAPACITY = 3600  # snapshots mantidos no anel (30 minutos a 500 ms)
+SHARED_MAGIC = 0x44534E50
+SHARED_VERSION = 1
+RECONNECT_INTERVAL = 1.0  # segundos entre as verificacoes do coletor pelo leitor
+READ_TIMEOUT = 0.005  # espera maxima (s) por uma escrita do coletor em andamento
+
+# cabecalho da memoria compartilhada, seguido de `capacity` snapshots em anel.
+# sequence funciona como seqlock: eh impar enquanto o coletor escreve
+class SharedHeader(Structure):
+    _fields_ = [
+        ("magic", c_uint32),
+        ("version", c_uint32),
+        ("capacity", c_uint32),
+        ("recordSize", c_uint32),
+        ("pid", c_int64),         # pid do coletor
+        ("interval", c_double),   # intervalo entre amostras (s)
+        ("sequence", c_uint64),
+        ("count", c_uint64),      # total de snapshots publicados
+    ]
+
+HEADER_SIZE = ctypes.sizeof(SharedHeader)
+RECORD_SIZE = ctypes.sizeof(Snapshot)
+SEQUENCE_OFFSET = SharedHeader.sequence.offset
+
+def _segment_size(capacity):
+    return HEADER_SIZE + capacity * RECORD_SIZE
+
+# o segmento eh aberto direto em /dev/shm: anexar com SharedMemory o
+# registraria no resource_tracker, que o removeria ao fim deste processo.
+# retorna (mapeamento, inode); o inode identifica o segmento, ja que um
+# coletor reiniciado recria o arquivo com o mesmo nome
+def _open_segment(name):
+    fd = os.open(os.path.join(SHM_DIR, name), os.O_RDONLY)
+    try:
+        return mmap.mmap(fd, 0, prot=mmap.PROT_READ), os.fstat(fd).st_ino
+    finally:
+        os.close(fd)
+
+def _read_header(name):
+    try:
+        segment, _ = _open_segment(name)
+    except (OSError, ValueError):
+        return None
+    try:
+        if len(segment) < HEADER_SIZE:
+            return None
+        return SharedHeader.from_buffer_copy(segment, 0)
+    finally:
+        segment.close()
+
+def _process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+# lado do coletor: cria o segmento e publica cada snapshot no anel
+class SnapshotPublisher:
+    def __init__(self, name=DEFAULT_NAME, capacity=DEFAULT_CAPACITY, interval=0.5):
+        size = _segment_size(capacity)
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # segmento de um coletor anterior: so eh reaproveitado se ele
+            # nao estiver mais rodando
+            header = _read_header(name)
+            if header is not None and header.magic == SHARED_MAGIC and _process_alive(header.pid):
+                raise RuntimeError(f"collector already running (pid {header.pid})")
+            os.unlink(os.path.join(SHM_DIR, name))
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        self.capacity = capacity
+        self.header = SharedHeader.from_buffer(self.shm.buf)
+        self.header.magic = SHARED_MAGIC
+        self.header.version = SHARED_VERSION
+        self.header.capacity = capacity
+        self.header.recordSize = RECORD_SIZE
+        self.header.pid = os.getpid()
+        self.header.interval = interval
+        self.header.sequence = 0
+        self.header.count = 0
+
+    def publish(self, snapshot):
+        header = self.header
+        offset = HEADER_SIZE + (header.count % self.capacity) * RECORD_SIZE
+        header.sequence += 1
+        self.shm.buf[offset:offset + RECORD_SIZE] = bytes(snapshot)
+        header.count += 1
+        header.sequence += 1
+
+    def close(self):
+        # o cabecalho referencia o buffer e precisa ser liberado antes
+        del self.header
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# lado dos visualizadores: mapeia o segmento somente para leitura. cada
+# leitura copia os registros e confere a sequencia; se o coletor escreveu no
+# meio da copia, a leitura eh repetida. a cada RECONNECT_INTERVAL o leitor
+# confere se o coletor continua vivo e se o segmento ainda eh o mapeado: um
+# coletor reiniciado remove o segmento antigo e cria outro, e o leitor passa
+# a ler o novo. levanta FileNotFoundError se nao houver coletor
+class SnapshotReader:
+    def __init__(self, name=DEFAULT_NAME):
+        self.name = name
+        self.map = None
+        self._attach()
+        self.connected = True
+        self._last_check = time.monotonic()
+
+    def _attach(self):
+        segment, inode = _open_segment(self.name)
+        if len(segment) < HEADER_SIZE:
+            segment.close()
+            raise RuntimeError(f"incompatible shared snapshot segment: {self.name}")
+        header = SharedHeader.from_buffer_copy(segment, 0)
+        if header.magic != SHARED_MAGIC or header.version != SHARED_VERSION or header.recordSize != RECORD_SIZE:
+            segment.close()
+            raise RuntimeError(f"incompatible shared snapshot segment: {self.name}")
+        if self.map is not None:
+            self.map.close()
+        self.map = segment
+        self.inode = inode
+        self.capacity = header.capacity
+        self.interval = header.interval
+        self.pid = header.pid
+        self.last_count = 0
+
+    # atualiza `connected` (coletor vivo e segmento atual) e reanexa se o
+    # segmento foi recriado; um segmento ainda sendo inicializado pelo
+    # coletor novo eh tentado de novo na proxima verificacao
+    def check(self):
+        self._last_check = time.monotonic()
+        try:
+            inode = os.stat(os.path.join(SHM_DIR, self.name)).st_ino
+        except FileNotFoundError:
+            inode = None
+        if inode is not None and inode != self.inode:
+            try:
+                self._attach()
+            except (OSError, ValueError, RuntimeError):
+                pass
+        self.connected = inode == self.inode and self.collector_alive()
+        return self.connected
+
+    def _sequence(self):
+        return c_uint64.from_buffer_copy(self.map, SEQUENCE_OFFSET).value
+
+    # snapshots publicados a partir de `since` (contagem total), limitados aos
+    # `limit` mais recentes. retorna (snapshots, contagem atual). se a escrita
+    # em andamento nao terminar em READ_TIMEOUT (coletor morto no meio de um
+    # publish deixa a sequencia impar), nada eh lido e a proxima read_new
+    # verifica o coletor
+    def read(self, since=0, limit=None):
+        deadline = time.monotonic() + READ_TIMEOUT
+        while True:
+            header = SharedHeader.from_buffer_copy(self.map, 0)
+            if header.sequence & 1:
+                if time.monotonic() >= deadline:
+                    self._last_check = 0
+                    return [], since
+                time.sleep(0)
+                continue
+            count = header.count
+            first = max(since, count - self.capacity)
+            if limit is not None:
+                first = max(first, count - limit)
+            snapshots = []
+            for index in range(first, count):
+                offset = HEADER_SIZE + (index % self.capacity) * RECORD_SIZE
+                snapshots.append(Snapshot.from_buffer_copy(self.map, offset))
+            if self._sequence() == header.sequence:
+                return snapshots, count
+            if time.monotonic() >= deadline:
+                self._last_check = 0
+                return [], since
+
+    # snapshots novos desde a leitura anterior (None se nao houver)
+    def read_new(self):
+        if time.monotonic() - self._last_check >= RECONNECT_INTERVAL:
+            self.check()
+        snapshots, self.last_count = self.read(self.last_count)
+        return snapshots or None
+
+    # os `length` snapshots mais recentes; as leituras seguintes continuam dali
+    def history(self, length):
+        snapshots, self.last_count = self.read(limit=length)
+        return snapshots
+
+    def collector_alive(self):
+        return _process_alive(self.pid)
+
+    def close(self):
+        self.map.close()
+
+
+# modo coletor sem interface: amostra com SystemInfo e publica cada snapshot
+# na memoria compartilhada ate receber SIGINT/SIGTERM. com record_path as
+# amostras tambem sao gravadas em disco. os sinais so marcam a parada, que
+# acontece entre dois ciclos: interromper um publish deixaria a sequencia
+# impar para os leitores
+def run_collector(name=DEFAULT_NAME, interval=0.5, capacity=DEFAULT_CAPACITY, record_path=None):
+    sys_info = SystemInfo()
+    num_cores = sys_info.get_core_count()
+    publisher = SnapshotPublisher(name, capacity, interval)
+    recorder = MetricRecorder(record_path, snapshot_columns(num_cores)) if record_path else None
+
+    stopped = threading.Event()
+
+    def on_terminate(signum, frame):
+        stopped.set()
+    signal.signal(signal.SIGTERM, on_terminate)
+    signal.signal(signal.SIGINT, on_terminate)
+
+    try:
+        deadline = time.monotonic()
+        while not stopped.is_set():
+            snapshot = sys_info.snapshot()
+            publisher.publish(snapshot)
+            if recorder is not None:
+                recorder.append(snapshot_values(snapshot, num_cores))
+            # ciclos perdidos (ex.: maquina suspensa) sao descartados
+            now = time.monotonic()
+            deadline += interval
+            if deadline <= now:
+                deadline = now + interval - (now - deadline) % interval
+            stopped.wait(deadline - now)
+    finally:
+        publisher.close()
+        if recorder is not None:
+            recorder.close()
@@ -1,11 +1,653 @@
-from ctypes import cdll, c_char_p, c_int, c_void_p
+from ctypes import cdll, c_char, c_char_p, c_int, c_uint, c_ubyte, c_ulonglong, c_void_p, c_double, c_float, c_longlong, c_size_t, Structure, POINTER, byref, create_string_buffer, string_at
+import fnmatch
+import os
+import signal
+import stat
+import threading
+import numpy as np
 
 # carrega a biblioteca c++
 lib = cdll.LoadLibrary('./libGetSysInfo.so')
 
+# funcoes que escrevem o resultado em um buffer fornecido pelo chamador:
+# f(SystemInfo*, <argumentos>, char* buffer, size_t capacity) -> tamanho do resultado
+_string_functions = {
+    "getTotalMemory": [],
+    "getFreeMemory": [],
+    "getUptime": [],
+    "getLoadAverage": [],
+    "getProcessCount": [],
+    "getCpuUsage": [],
+    "getCpuIdlePercentage": [],
+    "getThreadCount": [],
+    "getUsedDisk": [],
+    "getFreeDisk": [],
+    "getDiskRead": [],
+    "getDiskWrite": [],
+    "getCpuTemperature": [],
+    "getNetworkReceiveRate": [],
+    "getNetworkTransmitRate": [],
+    "getSwapUsage": [],
+    "getOsInfo": [],
+    "getArchitectureInfo": [],
+    "getCpuInfo": [],
+    "getProcessesInfo": [],
+    "getSpecificProcess": [c_int],
+    "getFileSystemInfo": [],
+    "listDirectory": [c_char_p],
+    "getProcessResources": [c_int],
+}
+for _name, _args in _string_functions.items():
+    getattr(lib, _name).restype = c_size_t
+    getattr(lib, _name).argtypes = [c_void_p] + _args + [c_char_p, c_size_t]
+
+# tamanho inicial dos buffers de resultado (crescem sob demanda)
+DEFAULT_BUFFER_SIZE = 4096
+
+# deve ser igual a CPU_STAT_FIELDS em getSysInfo.cpp
+# (ocupado, iowait, steal e irq em %, para cada core)
+CPU_STAT_FIELDS = 4
+
+lib.getCpuUsagePerCore.restype = c_int
+lib.getCpuUsagePerCore.argtypes = [c_void_p, POINTER(c_float), c_int]
+
+# espelho da struct ProcessRecord de getSysInfo.cpp (memoria em KB, cpu em %
+# de um core e I/O em bytes/s desde a leitura anterior)
+class ProcessRecord(Structure):
+    _fields_ = [
+        ("pid", c_int),
+        ("ppid", c_int),
+        ("uid", c_int),
+        ("threads", c_int),
+        ("vsize", c_ulonglong),
+        ("rss", c_ulonglong),
+        ("cpuUsage", c_double),
+        ("readRate", c_double),
+        ("writeRate", c_double),
+        ("nameOffset", c_uint),
+        ("nameLength", c_uint),
+        ("userOffset", c_uint),
+        ("userLength", c_uint),
+        ("state", c_char),
+        ("padding", c_char * 7),
+    ]
+
+# espelho da struct CacheStats de getSysInfo.cpp
+class CacheStats(Structure):
+    _fields_ = [
+        ("userHits", c_ulonglong),
+        ("userMisses", c_ulonglong),
+        ("userEvictions", c_ulonglong),
+        ("userExpirations", c_ulonglong),
+        ("userEntries", c_ulonglong),
+        ("staticHits", c_ulonglong),
+        ("staticMisses", c_ulonglong),
+    ]
+
+lib.getCoreCount.restype = c_int
+lib.getCoreCount.argtypes = [c_void_p]
+lib.getCacheStats.restype = None
+lib.getCacheStats.argtypes = [c_void_p, POINTER(CacheStats)]
+lib.clearUserCache.restype = None
+lib.clearUserCache.argtypes = [c_void_p]
+
+lib.setProcessScanWorkers.restype = None
+lib.setProcessScanWorkers.argtypes = [c_void_p, c_int]
+
+lib.getProcessTable.restype = c_int
+lib.getProcessTable.argtypes = [c_void_p, POINTER(ProcessRecord), c_int, c_char_p, c_size_t, POINTER(c_size_t)]
+
+# chaves de ordenacao de getTopProcesses (PROCESS_SORT_* em getSysInfo.cpp)
+TOP_SORT_KEYS = {"cpu": 0, "rss": 1, "vsize": 2, "io": 3, "threads": 4}
+
+lib.getTopProcesses.restype = c_int
+lib.getTopProcesses.argtypes = [c_void_p, c_int, c_int, c_char_p, POINTER(ProcessRecord),
+                                c_char_p, c_size_t, POINTER(c_size_t)]
+
+# espelho da struct DirectoryEntry de getSysInfo.cpp
+class DirectoryEntry(Structure):
+    _fields_ = [
+        ("inode", c_ulonglong),
+        ("device", c_ulonglong),
+        ("size", c_longlong),
+        ("blocks", c_longlong),
+        ("mtime", c_longlong),
+        ("mode", c_uint),
+        ("links", c_uint),
+        ("nameOffset", c_uint),
+        ("nameLength", c_uint),
+        ("type", c_ubyte),
+        ("padding", c_char * 7),
+    ]
+
+# valores de d_type (dirent.h)
+DT_UNKNOWN = 0
+DT_DIR = 4
+DT_REG = 8
+DT_LNK = 10
+
+# entradas por pagina na leitura de diretorios
+DIRECTORY_PAGE_SIZE = 512
+NAME_MAX = 255
+
+lib.openDirectory.restype = c_void_p
+lib.openDirectory.argtypes = [c_void_p, c_char_p]
+lib.readDirectoryPage.restype = c_int
+lib.readDirectoryPage.argtypes = [c_void_p, c_void_p, POINTER(DirectoryEntry), c_int,
+                                  c_char_p, c_size_t, POINTER(c_size_t), c_int]
+lib.closeDirectory.restype = None
+lib.closeDirectory.argtypes = [c_void_p, c_void_p]
+lib.statDirectoryEntries.restype = c_int
+lib.statDirectoryEntries.argtypes = [c_void_p, c_char_p, POINTER(DirectoryEntry), c_int, c_char_p]
+
+# campos de uma Structure como dicionario; campos char[] chegam como bytes
+# e sao decodificados
+def _structure_dict(record):
+    values = {name: getattr(record, name) for name, _ in record._fields_}
+    return {name: os.fsdecode(value) if isinstance(value, bytes) else value for name, value in values.items()}
+
+# limites de DiskStats, iguais aos de getSysInfo.cpp
+DISK_MAX_DEVICES = 64
+DISK_MAX_MOUNTS = 64
+
+# espelho da struct DiskDeviceStats de getSysInfo.cpp (taxas em bytes/s e
+# operacoes/s, utilizacao em %)
+class DiskDeviceStats(Structure):
+    _fields_ = [
+        ("name", c_char * 32),
+        ("major", c_uint),
+        ("minor", c_uint),
+        ("isPartition", c_int),
+        ("isPhysical", c_int),
+        ("readBytes", c_ulonglong),
+        ("writeBytes", c_ulonglong),
+        ("readRate", c_double),
+        ("writeRate", c_double),
+        ("readIops", c_double),
+        ("writeIops", c_double),
+        ("utilization", c_double),
+    ]
+
+# espelho da struct MountStats de getSysInfo.cpp (capacidades em bytes)
+class MountStats(Structure):
+    _fields_ = [
+        ("mountPoint", c_char * 256),
+        ("source", c_char * 128),
+        ("fsType", c_char * 32),
+        ("major", c_uint),
+        ("minor", c_uint),
+        ("totalBytes", c_ulonglong),
+        ("usedBytes", c_ulonglong),
+        ("availableBytes", c_ulonglong),
+        ("usage", c_double),
+    ]
+
+# espelho da struct DiskStats de getSysInfo.cpp: todos os dispositivos de
+# bloco e todos os sistemas de arquivos montados em uma unica chamada
+class DiskStats(Structure):
+    _fields_ = [
+        ("interval", c_double),
+        ("deviceCount", c_int),
+        ("mountCount", c_int),
+        ("deviceStats", DiskDeviceStats * DISK_MAX_DEVICES),
+        ("mountStats", MountStats * DISK_MAX_MOUNTS),
+    ]
+
+    # dispositivos como dicionarios; physical_only deixa so os discos reais
+    def devices(self, physical_only=False):
+        return [_structure_dict(device) for device in self.deviceStats[:self.deviceCount]
+                if device.isPhysical or not physical_only]
+
+    def mounts(self):
+        return [_structure_dict(mount) for mount in self.mountStats[:self.mountCount]]
+
+lib.getDiskStats.restype = None
+lib.getDiskStats.argtypes = [c_void_p, POINTER(DiskStats)]
+
+NET_MAX_INTERFACES = 64
+
+# espelho da struct NetInterfaceStats de getSysInfo.cpp (totais desde o
+# boot e taxas por segundo; bytes/s para rxRate e txRate)
+class NetInterfaceStats(Structure):
+    _fields_ = [
+        ("name", c_char * 32),
+        ("isLoopback", c_int),
+        ("isPhysical", c_int),
+        ("selected", c_int),
+        ("padding", c_int),
+        ("rxBytes", c_ulonglong),
+        ("rxPackets", c_ulonglong),
+        ("rxErrors", c_ulonglong),
+        ("rxDrops", c_ulonglong),
+        ("txBytes", c_ulonglong),
+        ("txPackets", c_ulonglong),
+        ("txErrors", c_ulonglong),
+        ("txDrops", c_ulonglong),
+        ("rxRate", c_double),
+        ("txRate", c_double),
+        ("rxPacketRate", c_double),
+        ("txPacketRate", c_double),
+        ("rxErrorRate", c_double),
+        ("txErrorRate", c_double),
+        ("rxDropRate", c_double),
+        ("txDropRate", c_double),
+    ]
+
+# espelho da struct NetworkStats de getSysInfo.cpp: todas as interfaces de
+# uma mesma leitura de /proc/net/dev
+class NetworkStats(Structure):
+    _fields_ = [
+        ("interval", c_double),
+        ("interfaceCount", c_int),
+        ("padding", c_int),
+        ("interfaceStats", NetInterfaceStats * NET_MAX_INTERFACES),
+    ]
+
+    def interfaces(self, selected_only=False):
+        return [_structure_dict(interface) for interface in self.interfaceStats[:self.interfaceCount]
+                if interface.selected or not selected_only]
+
+    # taxas (recebimento, transmissao) em KB/s das interfaces selecionadas.
+    # groups: pares (rotulo, padrao fnmatch); as interfaces que casam com um
+    # padrao sao somadas sob o rotulo, as demais aparecem pelo proprio nome
+    def rates(self, groups=()):
+        rates = {}
+        for interface in self.interfaceStats[:self.interfaceCount]:
+            if not interface.selected:
+                continue
+            name = os.fsdecode(interface.name)
+            label = next((label for label, pattern in groups if fnmatch.fnmatchcase(name, pattern)), name)
+            receive, transmit = rates.get(label, (0.0, 0.0))
+            rates[label] = (receive + interface.rxRate / 1024, transmit + interface.txRate / 1024)
+        return rates
+
+lib.getNetworkStats.restype = None
+lib.getNetworkStats.argtypes = [c_void_p, POINTER(NetworkStats)]
+lib.setNetworkPatterns.restype = None
+lib.setNetworkPatterns.argtypes = [c_void_p, c_char_p]
+
+# descricao dos estados de processo, como em /proc/[pid]/status
+PROCESS_STATES = {
+    "R": "R (running)",
+    "S": "S (sleeping)",
+    "D": "D (disk sleep)",
+    "T": "T (stopped)",
+    "t": "t (tracing stop)",
+    "Z": "Z (zombie)",
+    "X": "X (dead)",
+    "I": "I (idle)",
+}
+
+# tabela de processos retornada por SystemInfo.get_process_table. `records`
+# eh um array estruturado numpy sobre o buffer ctypes (sem copia), com uma
+# coluna por campo de ProcessRecord; nomes ficam no bloco `strings`
+class ProcessTable:
+    def __init__(self, buffer, count, strings):
+        self.buffer = buffer  # mantem o buffer vivo enquanto houver visoes
+        self.records = np.ctypeslib.as_array(buffer)[:count]
+        self.strings = strings
+
+    def __len__(self):
+        return len(self.records)
+
+    def _string(self, offset, length):
+        return self.strings[offset:offset + length].decode('utf-8', errors='ignore')
+
+    def name(self, index):
+        record = self.records[index]
+        return self._string(record['nameOffset'], record['nameLength'])
+
+    def user(self, index):
+        record = self.records[index]
+        return self._string(record['userOffset'], record['userLength'])
+
+    # converte a tabela em tuplas python (pid, ppid, nome, usuario, estado,
+    # threads, vsize, rss, cpu %, leitura/s, escrita/s)
+    def rows(self):
+        records = self.records
+        columns = [records[field].tolist() for field in
+                   ("pid", "ppid", "nameOffset", "nameLength", "userOffset", "userLength",
+                    "state", "threads", "vsize", "rss", "cpuUsage", "readRate", "writeRate")]
+        rows = []
+        for (pid, ppid, name_offset, name_length, user_offset, user_length, state, threads, vsize, rss,
+             cpu, read_rate, write_rate) in zip(*columns):
+            rows.append((pid, ppid, self._string(name_offset, name_length),
+                         self._string(user_offset, user_length), state.decode(), threads, vsize, rss,
+                         cpu, read_rate, write_rate))
+        return rows
+
+PROCESS_NAME_LENGTH = 64
+PROCESS_TEXT_LENGTH = 4096
+
+# secoes de readProcessDetail (PROCESS_DETAIL_* em getSysInfo.cpp)
+PROCESS_DETAIL_FIELDS = 1
+PROCESS_DETAIL_THREADS = 2
+
+# espelho da struct ProcessStaticInfo de getSysInfo.cpp
+class ProcessStaticInfo(Structure):
+    _fields_ = [
+        ("pid", c_int),
+        ("ppid", c_int),
+        ("uid", c_int),
+        ("gid", c_int),
+        ("startTime", c_longlong),
+        ("name", c_char * PROCESS_NAME_LENGTH),
+        ("user", c_char * PROCESS_NAME_LENGTH),
+        ("exe", c_char * PROCESS_TEXT_LENGTH),
+        ("cmdline", c_char * PROCESS_TEXT_LENGTH),
+    ]
+
+# espelho da struct ProcessDynamicInfo de getSysInfo.cpp (memoria em KB)
+class ProcessDynamicInfo(Structure):
+    _fields_ = [
+        ("state", c_char),
+        ("padding", c_char * 3),
+        ("threads", c_int),
+        ("cpuUsage", c_double),
+        ("vmPeak", c_ulonglong),
+        ("vmSize", c_ulonglong),
+        ("vmRSS", c_ulonglong),
+        ("rssAnon", c_ulonglong),
+        ("rssFile", c_ulonglong),
+        ("rssShmem", c_ulonglong),
+        ("vmData", c_ulonglong),
+        ("vmStk", c_ulonglong),
+        ("vmExe", c_ulonglong),
+        ("vmLib", c_ulonglong),
+        ("vmSwap", c_ulonglong),
+        ("voluntarySwitches", c_ulonglong),
+        ("involuntarySwitches", c_ulonglong),
+    ]
+
+# espelho da struct ThreadRecord de getSysInfo.cpp
+class ThreadRecord(Structure):
+    _fields_ = [
+        ("tid", c_int),
+        ("priority", c_int),
+        ("nice", c_int),
+        ("processor", c_int),
+        ("cpuUsage", c_double),
+        ("nameOffset", c_uint),
+        ("nameLength", c_uint),
+        ("state", c_char),
+        ("padding", c_char * 7),
+    ]
+
+lib.openProcessDetail.restype = c_void_p
+lib.openProcessDetail.argtypes = [c_void_p, c_int, POINTER(ProcessStaticInfo)]
+lib.readProcessDetail.restype = c_int
+lib.readProcessDetail.argtypes = [c_void_p, c_void_p, c_int, POINTER(ProcessDynamicInfo), POINTER(ThreadRecord),
+                                  c_int, POINTER(c_int), c_int, POINTER(c_int), c_char_p, c_size_t, POINTER(c_size_t)]
+lib.closeProcessDetail.restype = None
+lib.closeProcessDetail.argtypes = [c_void_p, c_void_p]
+
+# detalhes de um processo para uma janela de detalhes. `static` (nome,
+# linha de comando, executavel, usuario, inicio) eh lido uma unica vez na
+# abertura; cada refresh devolve os campos variaveis e apenas as threads
+# novas, alteradas ou encerradas desde a chamada anterior. refresh e close
+# podem ser chamados de threads diferentes
+class ProcessDetail:
+    def __init__(self, sys_info, pid):
+        self.sys_info = sys_info
+        self.pid = pid
+        info = ProcessStaticInfo()
+        self._handle = lib.openProcessDetail(sys_info.obj, pid, byref(info))
+        if not self._handle:
+            raise ProcessLookupError(f"process {pid} not found")
+        self.static = _structure_dict(info)
+        self._lock = threading.Lock()
+        self._thread_capacity = 256
+
+    # retorna (campos, threads alteradas, tids encerrados), ou None se o
+    # processo terminou ou os detalhes foram fechados. campos eh None sem
+    # with_fields; sem with_threads as listas ficam vazias e a diferenca
+    # continua a partir da ultima leitura com threads
+    def refresh(self, with_fields=True, with_threads=True):
+        sections = (PROCESS_DETAIL_FIELDS if with_fields else 0) | (PROCESS_DETAIL_THREADS if with_threads else 0)
+        with self._lock:
+            if self._handle is None:
+                return None
+            while True:
+                capacity = self._thread_capacity
+                info = ProcessDynamicInfo()
+                changed = (ThreadRecord * capacity)()
+                removed = (c_int * capacity)()
+                removed_count = c_int(0)
+                strings = create_string_buffer(capacity * 16)
+                strings_length = c_size_t(0)
+                count = lib.readProcessDetail(self.sys_info.obj, self._handle, sections, byref(info), changed,
+                                              capacity, removed, capacity, byref(removed_count),
+                                              strings, len(strings), byref(strings_length))
+                if count < 0:
+                    return None
+                needed = max(count, removed_count.value, strings_length.value // 16 + 1)
+                if needed <= capacity:
+                    break
+                self._thread_capacity = needed + needed // 4
+
+        fields = _structure_dict(info) if with_fields else None
+        names = string_at(strings, strings_length.value)
+        threads = []
+        for record in changed[:count]:
+            name = names[record.nameOffset:record.nameOffset + record.nameLength].decode('utf-8', errors='ignore')
+            threads.append((record.tid, name, record.state.decode(), record.priority, record.nice,
+                            record.processor, record.cpuUsage))
+        return fields, threads, removed[:removed_count.value]
+
+    def close(self):
+        with self._lock:
+            if self._handle is not None:
+                lib.closeProcessDetail(self.sys_info.obj, self._handle)
+                self._handle = None
+
+# fontes de eventos de processos (PROCESS_EVENTS_* em getSysInfo.cpp);
+# "auto" tenta o netlink e depois os pidfds
+PROCESS_EVENT_MODES = {"auto": -1, "scan": 0, "netlink": 1, "pidfd": 2}
+PROCESS_EVENT_MODE_NAMES = {value: name for name, value in PROCESS_EVENT_MODES.items()}
+
+# tipos de ProcessEvent
+PROCESS_EVENT_START = 1
+PROCESS_EVENT_CHANGE = 2
+PROCESS_EVENT_EXIT = 3
+
+# espelho da struct ProcessEvent de getSysInfo.cpp
+class ProcessEvent(Structure):
+    _fields_ = [
+        ("type", c_int),
+        ("pid", c_int),
+        ("ppid", c_int),
+        ("exitCode", c_int),
+    ]
+
+lib.getProcessRecords.restype = c_int
+lib.getProcessRecords.argtypes = [c_void_p, POINTER(c_int), c_int, POINTER(ProcessRecord), c_int, c_char_p,
+                                  c_size_t, POINTER(c_size_t)]
+lib.startProcessEvents.restype = c_int
+lib.startProcessEvents.argtypes = [c_void_p, c_int]
+lib.watchProcesses.restype = c_int
+lib.watchProcesses.argtypes = [c_void_p, POINTER(c_int), c_int]
+lib.readProcessEvents.restype = c_int
+lib.readProcessEvents.argtypes = [c_void_p, POINTER(ProcessEvent), c_int, c_int]
+lib.stopProcessEvents.restype = None
+lib.stopProcessEvents.argtypes = [c_void_p]
+
+# flags de signalProcesses (SIGNAL_* em getSysInfo.cpp)
+SIGNAL_DESCENDANTS = 1
+
+# espelho da struct SignalResult de getSysInfo.cpp
+class SignalResult(Structure):
+    _fields_ = [
+        ("pid", c_int),
+        ("error", c_int),
+    ]
+
+lib.signalProcesses.restype = c_int
+lib.signalProcesses.argtypes = [c_void_p, POINTER(c_int), c_int, c_int, c_int, POINTER(SignalResult), c_int,
+                                POINTER(c_int)]
+lib.getSignalResults.restype = c_int
+lib.getSignalResults.argtypes = [c_void_p, POINTER(SignalResult), c_int]
+
+# tipos de FileDescriptorRecord (FD_TYPE_* em getSysInfo.cpp)
+FD_TYPES = {0: "other", 1: "file", 2: "socket", 3: "pipe", 4: "anon"}
+FD_PAGE_SIZE = 512
+
+# espelho da struct FileDescriptorRecord de getSysInfo.cpp
+class FileDescriptorRecord(Structure):
+    _fields_ = [
+        ("fd", c_int),
+        ("type", c_int),
+        ("inode", c_ulonglong),
+        ("targetOffset", c_uint),
+        ("targetLength", c_uint),
+        ("detailOffset", c_uint),
+        ("detailLength", c_uint),
+    ]
+
+lib.openFdCursor.restype = c_void_p
+lib.openFdCursor.argtypes = [c_void_p, c_int, POINTER(c_int)]
+lib.readFdPage.restype = c_int
+lib.readFdPage.argtypes = [c_void_p, c_void_p, POINTER(FileDescriptorRecord), c_int, c_char_p, c_size_t,
+                           POINTER(c_size_t)]
+lib.closeFdCursor.restype = None
+lib.closeFdCursor.argtypes = [c_void_p, c_void_p]
+
+# descritores abertos de um processo, lidos em paginas sob demanda. os
+# numeros sao listados na abertura (`count`); cada pagina le os links e
+# resolve os sockets para protocolo, enderecos e estado pelo indice de
+# inodes que a biblioteca monta uma vez por cursor. para atualizar, abre-se
+# um novo cursor. read_page e close podem ser chamados de threads diferentes
+class FdCursor:
+    def __init__(self, sys_info, pid):
+        self.sys_info = sys_info
+        self.pid = pid
+        count = c_int(0)
+        self._handle = lib.openFdCursor(sys_info.obj, pid, byref(count))
+        if not self._handle:
+            raise OSError(f"Error opening file descriptors of process {pid}")
+        self.count = count.value
+        self._lock = threading.Lock()
+
+    # retorna [(fd, tipo, alvo, descricao)], vazia no fim ou se o cursor
+    # foi fechado
+    def read_page(self, page_size=FD_PAGE_SIZE):
+        buffer = (FileDescriptorRecord * page_size)()
+        strings = create_string_buffer(page_size * 256)
+        strings_length = c_size_t(0)
+        with self._lock:
+            if self._handle is None:
+                return []
+            count = lib.readFdPage(self.sys_info.obj, self._handle, buffer, page_size, strings, len(strings),
+                                   byref(strings_length))
+        data = string_at(strings, strings_length.value)
+        rows = []
+        for record in buffer[:count]:
+            target = os.fsdecode(data[record.targetOffset:record.targetOffset + record.targetLength])
+            detail = data[record.detailOffset:record.detailOffset + record.detailLength].decode('utf-8', errors='replace')
+            rows.append((record.fd, FD_TYPES.get(record.type, "other"), target, detail))
+        return rows
+
+    def close(self):
+        with self._lock:
+            if self._handle is not None:
+                lib.closeFdCursor(self.sys_info.obj, self._handle)
+                self._handle = None
+
+# pagina de um diretorio retornada por SystemInfo.iter_directory. `records`
+# eh um array estruturado numpy sobre o buffer ctypes, como em ProcessTable.
+# os nomes sao decodificados com surrogateescape para que qualquer nome
+# volte ao mesmo caminho em bytes (os.fsencode)
+class DirectoryPage:
+    def __init__(self, path, buffer, count, strings):
+        self.path = path
+        self.buffer = buffer
+        self.records = np.ctypeslib.as_array(buffer)[:count]
+        self.strings = strings
+
+    def __len__(self):
+        return len(self.records)
+
+    def name(self, index):
+        record = self.records[index]
+        offset, length = record['nameOffset'], record['nameLength']
+        return os.fsdecode(self.strings[offset:offset + length])
+
+    def is_directory(self, index):
+        return self.records[index]['type'] == DT_DIR
+
+    # copia independente da pagina com o buffer do tamanho exato das entradas
+    # (iter_directory reserva page_size entradas por pagina)
+    def copy(self):
+        buffer = (DirectoryEntry * len(self)).from_buffer_copy(self.buffer)
+        return DirectoryPage(self.path, buffer, len(self), self.strings)
+
+    # preenche tamanho, modo e mtime das entradas (stat relativo ao diretorio).
+    # entradas que sumiram ficam com mode 0. retorna o numero de entradas
+    # lidas, ou -1 se o diretorio nao puder ser aberto
+    def stat(self, sys_info):
+        self.records['mode'] = 0
+        strings = create_string_buffer(self.strings, len(self.strings))
+        return lib.statDirectoryEntries(sys_info.obj, os.fsencode(self.path), self.buffer, len(self), strings)
+
+    # (nome, eh_diretorio, tamanho, permissoes, mtime); tamanho, permissoes e
+    # mtime sao None enquanto o stat nao foi feito
+    def rows(self):
+        records = self.records
+        rows = []
+        for index, (entry_type, size, mode, mtime) in enumerate(zip(
+                records['type'].tolist(), records['size'].tolist(),
+                records['mode'].tolist(), records['mtime'].tolist())):
+            if mode:
+                rows.append((self.name(index), entry_type == DT_DIR, size, stat.filemode(mode), mtime))
+            else:
+                rows.append((self.name(index), entry_type == DT_DIR, None, None, None))
+        return rows
+
+# deve ser igual a SNAPSHOT_MAX_CORES em getSysInfo.cpp
+SNAPSHOT_MAX_CORES = 256
+
+# espelho da struct Snapshot de getSysInfo.cpp (mesma ordem e tipos)
+class Snapshot(Structure):
+    _fields_ = [
+        ("timestamp", c_double),
+        ("uptime", c_longlong),
+        ("loadAverage", c_double * 3),
+        ("processCount", c_int),
+        ("threadCount", c_int),
+        ("totalMemory", c_double),
+        ("freeMemory", c_double),
+        ("memoryUsage", c_double),
+        ("swapUsage", c_double),
+        ("cpuUsage", c_double),
+        ("cpuIdlePercentage", c_double),
+        ("hasCpuTemperature", c_int),
+        ("cpuTemperature", c_double),
+        ("networkReceiveRate", c_double),
+        ("networkTransmitRate", c_double),
+        ("diskRead", c_double),
+        ("diskWrite", c_double),
+        ("usedDisk", c_double),
+        ("freeDisk", c_double),
+        ("coreCount", c_int),
+        ("coreValues", c_double * SNAPSHOT_MAX_CORES),
+    ]
+
+    def core_values(self):
+        return list(self.coreValues[:self.coreCount])
+
 class SystemInfo:
-    def __init__(self):
-        self.obj = lib.SystemInfo_new()
+    # process_scan_workers: threads usadas para percorrer /proc (1 = sequencial)
+    def __init__(self, process_scan_workers=1):
+        # o ponteiro deve ser mantido como c_void_p para nao ser truncado em 64 bits
+        lib.SystemInfo_new.restype = c_void_p
+        self.obj = c_void_p(lib.SystemInfo_new())
+
+        # cada thread reutiliza o seu proprio buffer de resultado, entao
+        # varias threads podem chamar a biblioteca ao mesmo tempo
+        self._buffers = threading.local()
+        # signalProcesses e getSignalResults formam uma unica operacao
+        self._signal_lock = threading.Lock()
+
+        self.set_process_scan_workers(process_scan_workers)
 
         # dicionario de funcoes a serem chamadas
         self.fields = {
@@ -20,19 +662,38 @@ class SystemInfo:
             "Thread Count": lib.getThreadCount
         }
 
-        lib.getTotalMemory.restype = c_char_p
-        lib.getFreeMemory.restype = c_char_p
-        lib.getNetworkReceiveRate.restype = c_char_p
-        lib.getNetworkTransmitRate.restype = c_char_p
-        lib.getSwapUsage.restype = c_char_p
+        lib.getSnapshot.restype = None
+        lib.getSnapshot.argtypes = [c_void_p, POINTER(Snapshot)]
+
+        # campos imutaveis: obtidos uma unica vez, nao precisam de atualizacao
+        self.static_fields = {"OS Info", "Architecture Info"}
+
+        # campos que podem ser formatados a partir de um snapshot
+        self.snapshot_fields = {
+            "Uptime": lambda s: f"{s.uptime // 3600} hours, {s.uptime % 3600 // 60} minutes, {s.uptime % 60} seconds",
+            "CPU Usage": lambda s: f"{s.cpuUsage:g}%",
+            "CPU Idle Percentage": lambda s: f"{s.cpuIdlePercentage:g}%",
+            "CPU Temperature": lambda s: f"{s.cpuTemperature:.2f} °C" if s.hasCpuTemperature else "",
+            "Load Average": lambda s: "Load Average: 1 min: {:g}, 5 min: {:g}, 15 min: {:g}".format(*s.loadAverage),
+            "Process Count": lambda s: f"{s.processCount} processes",
+            "Thread Count": lambda s: f"{s.threadCount} threads",
+        }
 
-        # define o tipo de retorno para cada funcao
-        for func in self.fields.values():
-            func.restype = c_char_p
+    # chama uma funcao da biblioteca que escreve em um buffer do chamador,
+    # aumentando o buffer da thread atual quando o resultado nao couber
+    def _call(self, func, *args, errors='strict'):
+        buffer = getattr(self._buffers, 'buffer', None)
+        if buffer is None:
+            buffer = self._buffers.buffer = create_string_buffer(DEFAULT_BUFFER_SIZE)
+        length = func(self.obj, *args, buffer, len(buffer))
+        while length >= len(buffer):
+            buffer = self._buffers.buffer = create_string_buffer(length * 2)
+            length = func(self.obj, *args, buffer, len(buffer))
+        return string_at(buffer, length).decode('utf-8', errors=errors)
 
     def get_info(self, field):
         func = self.fields[field]
-        value = func(self.obj).decode('utf-8')
+        value = self._call(func)
 
         if field in ["Network Receive Rate", "Network Transmit Rate"]:
             value += " KB/s"
@@ -45,19 +706,36 @@ class SystemInfo:
 
         return value
 
-    def get_cpu_usage_per_core(self):
-        lib.getCpuInfo.restype = c_char_p
-        cpu_usage_str = lib.getCpuInfo(self.obj).decode('utf-8')
-        cpu_usage_list = cpu_usage_str.split("\t")
-        
-        # remove strings vazias e converte para float
-        cpu_usage_list = [float(usage.strip()) for usage in cpu_usage_list if usage.strip()]
-        return cpu_usage_list
+    # obtem todas as metricas periodicas com uma unica chamada a biblioteca
+    def snapshot(self):
+        snapshot = Snapshot()
+        lib.getSnapshot(self.obj, byref(snapshot))
+        return snapshot
+
+    def format_snapshot_field(self, field, snapshot):
+        return self.snapshot_fields[field](snapshot)
+
+    # percentuais de cada core no intervalo desde a ultima amostra. com
+    # details=True retorna tuplas (ocupado, iowait, steal, irq)
+    def get_cpu_usage_per_core(self, details=False):
+        values = getattr(self._buffers, 'cpu_values', None)
+        if values is None:
+            values = self._buffers.cpu_values = (c_float * (CPU_STAT_FIELDS * SNAPSHOT_MAX_CORES))()
+        max_cores = len(values) // CPU_STAT_FIELDS
+        core_count = lib.getCpuUsagePerCore(self.obj, values, max_cores)
+        if core_count > max_cores:
+            values = self._buffers.cpu_values = (c_float * (CPU_STAT_FIELDS * core_count))()
+            core_count = lib.getCpuUsagePerCore(self.obj, values, core_count)
+
+        packed = values[:core_count * CPU_STAT_FIELDS]
+        if details:
+            return [tuple(packed[i:i + CPU_STAT_FIELDS]) for i in range(0, len(packed), CPU_STAT_FIELDS)]
+        return packed[::CPU_STAT_FIELDS]
 
     def get_memory_usage(self):
         # obtem memoria total e livre da biblioteca c++
-        total_memory = float(lib.getTotalMemory(self.obj).decode('utf-8'))
-        free_memory = float(lib.getFreeMemory(self.obj).decode('utf-8'))
+        total_memory = float(self._call(lib.getTotalMemory))
+        free_memory = float(self._call(lib.getFreeMemory))
 
         # calcula o uso de memoria como a diferença entre memoria total e livre
         used_memory = total_memory - free_memory
@@ -66,33 +744,141 @@ class SystemInfo:
         return (used_memory / total_memory) * 100
     
     def get_swap_usage(self):
-        return float(lib.getSwapUsage(self.obj).decode('utf-8'))
+        return float(self._call(lib.getSwapUsage))
 
     def get_network_receive_rate(self):
-        return float(lib.getNetworkReceiveRate(self.obj).decode('utf-8'))
+        return float(self._call(lib.getNetworkReceiveRate))
 
     def get_network_transmit_rate(self):
-        return float(lib.getNetworkTransmitRate(self.obj).decode('utf-8'))
+        return float(self._call(lib.getNetworkTransmitRate))
+
+    # contadores e taxas de cada interface, de uma unica leitura de
+    # /proc/net/dev (ver NetworkStats)
+    def get_network_stats(self):
+        stats = NetworkStats()
+        lib.getNetworkStats(self.obj, byref(stats))
+        return stats
+
+    # padroes fnmatch das interfaces somadas nas taxas de rede (ex.:
+    # ["eth*", "wl*"] ou ["!lo", "!veth*"]); vazio = interfaces fisicas
+    def set_network_patterns(self, patterns):
+        lib.setNetworkPatterns(self.obj, ",".join(patterns).encode('utf-8'))
     
     def get_processes_info(self):
-        lib.getProcessesInfo.restype = c_char_p
-        return lib.getProcessesInfo(self.obj).decode('utf-8', errors='ignore')
+        return self._call(lib.getProcessesInfo, errors='ignore')
+
+    # numero de cores online (obtido uma unica vez pela biblioteca)
+    def get_core_count(self):
+        return lib.getCoreCount(self.obj)
+
+    # contadores de acertos/faltas dos caches de metadados da biblioteca
+    def get_cache_stats(self):
+        stats = CacheStats()
+        lib.getCacheStats(self.obj, byref(stats))
+        return {name: getattr(stats, name) for name, _ in CacheStats._fields_}
+
+    def clear_user_cache(self):
+        lib.clearUserCache(self.obj)
+
+    def set_process_scan_workers(self, workers):
+        lib.setProcessScanWorkers(self.obj, int(workers))
+
+    # tabela de processos em formato binario (ver ProcessTable). os buffers
+    # sao alocados a cada chamada, com folga sobre o tamanho anterior, para
+    # que a tabela possa ser entregue a outra thread sem copia
+    def get_process_table(self):
+        capacity = getattr(self, '_process_capacity', 1024)
+        strings_capacity = getattr(self, '_process_strings_capacity', 32 * 1024)
+        while True:
+            buffer = (ProcessRecord * capacity)()
+            strings = create_string_buffer(strings_capacity)
+            strings_length = c_size_t(0)
+            count = lib.getProcessTable(self.obj, buffer, capacity, strings, strings_capacity, byref(strings_length))
+            if count <= capacity and strings_length.value <= strings_capacity:
+                break
+            capacity = max(capacity, count + count // 4)
+            strings_capacity = max(strings_capacity, strings_length.value + strings_length.value // 4)
+        self._process_capacity = max(1024, count + count // 4)
+        self._process_strings_capacity = max(32 * 1024, strings_length.value + strings_length.value // 4)
+        return ProcessTable(buffer, count, string_at(strings, strings_length.value))
     
+    # registros apenas dos pids pedidos (ex.: processos recem iniciados), como
+    # uma ProcessTable; os que ja terminaram ficam de fora
+    def get_process_records(self, pids):
+        pids = (c_int * len(pids))(*pids)
+        capacity = len(pids)
+        strings_capacity = capacity * 64
+        while True:
+            buffer = (ProcessRecord * capacity)()
+            strings = create_string_buffer(strings_capacity)
+            strings_length = c_size_t(0)
+            count = lib.getProcessRecords(self.obj, pids, len(pids), buffer, capacity, strings, strings_capacity,
+                                          byref(strings_length))
+            if strings_length.value <= strings_capacity:
+                return ProcessTable(buffer, count, string_at(strings, strings_length.value))
+            strings_capacity = strings_length.value
+
+    # inicia a fonte de eventos de processos (ver PROCESS_EVENT_MODES) e
+    # retorna o nome da obtida; "scan" significa que nao ha eventos
+    def start_process_events(self, mode="auto"):
+        return PROCESS_EVENT_MODE_NAMES[lib.startProcessEvents(self.obj, PROCESS_EVENT_MODES[mode])]
+
+    # no modo pidfd, passa a observar a saida destes processos
+    def watch_processes(self, pids):
+        return lib.watchProcesses(self.obj, (c_int * len(pids))(*pids), len(pids))
+
+    # [(tipo, pid, ppid, codigo de saida)] disponiveis, esperando ate
+    # `timeout` segundos pelo primeiro; None se eventos foram perdidos e a
+    # tabela deve ser relida por completo
+    def read_process_events(self, timeout=0, max_events=1024):
+        events = []
+        buffer = (ProcessEvent * max_events)()
+        while True:
+            count = lib.readProcessEvents(self.obj, buffer, max_events, int(timeout * 1000))
+            if count < 0:
+                return None
+            events.extend((event.type, event.pid, event.ppid, event.exitCode) for event in buffer[:count])
+            if count < max_events:
+                return events
+            timeout = 0
+
+    def stop_process_events(self):
+        lib.stopProcessEvents(self.obj)
+
+    # os `n` maiores processos por sort_key (ver TOP_SORT_KEYS), ja ordenados,
+    # como uma ProcessTable pequena. a selecao eh feita na biblioteca, que so
+    # devolve esses registros, sobre a ultima leitura completa de /proc se
+    # ela tiver menos de 2 s. pattern (fnmatch) filtra por nome ou usuario
+    def get_top_processes(self, sort_key="cpu", n=10, pattern=""):
+        buffer = (ProcessRecord * n)()
+        strings_capacity = n * 64
+        while True:
+            strings = create_string_buffer(strings_capacity)
+            strings_length = c_size_t(0)
+            count = lib.getTopProcesses(self.obj, TOP_SORT_KEYS[sort_key], n, pattern.encode('utf-8'),
+                                        buffer, strings, strings_capacity, byref(strings_length))
+            if strings_length.value <= strings_capacity:
+                return ProcessTable(buffer, count, string_at(strings, strings_length.value))
+            strings_capacity = strings_length.value
+
     def get_used_disk(self):
-        lib.getUsedDisk.restype = c_char_p
-        return float(lib.getUsedDisk(self.obj).decode('utf-8'))
+        return float(self._call(lib.getUsedDisk))
     
     def get_free_disk(self):
-        lib.getFreeDisk.restype = c_char_p
-        return float(lib.getFreeDisk(self.obj).decode('utf-8'))
+        return float(self._call(lib.getFreeDisk))
     
     def get_disk_read(self):
-        lib.getDiskRead.restype = c_char_p
-        return float(lib.getDiskRead(self.obj).decode('utf-8'))
+        return float(self._call(lib.getDiskRead))
     
     def get_disk_write(self):
-        lib.getDiskWrite.restype = c_char_p
-        return float(lib.getDiskWrite(self.obj).decode('utf-8'))
+        return float(self._call(lib.getDiskWrite))
+
+    # vazao, iops e utilizacao de cada dispositivo e capacidade de cada
+    # ponto de montagem, lidos de uma vez (ver DiskStats)
+    def get_disk_stats(self):
+        stats = DiskStats()
+        lib.getDiskStats(self.obj, byref(stats))
+        return stats
 
     def kill_process(self, pid):
         lib.killProcess.restype = c_int
@@ -100,14 +886,66 @@ class SystemInfo:
         result = lib.killProcess(self.obj, pid)
         return result
     
+    # envia `sig` aos pids (e, com descendants=True, a todas as suas arvores)
+    # em uma unica chamada a biblioteca, que usa pidfds para nao atingir um
+    # pid reutilizado. retorna ([(pid, errno)], completo): errno 0 nos envios
+    # bem sucedidos, os pids pedidos primeiro e depois os descendentes;
+    # completo eh False se a arvore continuou crescendo e nao pode ser toda
+    # congelada (descendentes criados no fim podem nao ter recebido o sinal)
+    def signal_processes(self, pids, sig=signal.SIGTERM, descendants=False):
+        pids = [int(pid) for pid in pids]
+        flags = SIGNAL_DESCENDANTS if descendants else 0
+        capacity = max(1024, 2 * len(pids))
+        results = (SignalResult * capacity)()
+        complete = c_int(1)
+        with self._signal_lock:
+            count = lib.signalProcesses(self.obj, (c_int * len(pids))(*pids), len(pids), int(sig), flags, results,
+                                        capacity, byref(complete))
+            # os sinais ja foram enviados: os resultados que nao couberam sao
+            # lidos de novo da biblioteca, sem repetir o envio
+            if count > capacity:
+                results = (SignalResult * count)()
+                count = lib.getSignalResults(self.obj, results, count)
+        return [(result.pid, result.error) for result in results[:count]], bool(complete.value)
+
     def get_specific_process(self, pid):
-        lib.getSpecificProcess.restype = c_char_p        
-        return lib.getSpecificProcess(self.obj, c_int(int(pid))).decode('utf-8')
+        return self._call(lib.getSpecificProcess, int(pid))
+
+    # detalhes estruturados de um processo (ver ProcessDetail); levanta
+    # ProcessLookupError se ele nao existir
+    def open_process_detail(self, pid):
+        return ProcessDetail(self, int(pid))
+
+    # descritores abertos de um processo (ver FdCursor); levanta OSError se
+    # /proc/<pid>/fd nao puder ser lido
+    def open_fd_cursor(self, pid):
+        return FdCursor(self, int(pid))
+
+    def get_process_resources(self, pid):
+        return self._call(lib.getProcessResources, int(pid), errors='surrogateescape')
     
     def list_directory(self, path):
-        lib.listDirectory.restype = c_char_p
-        return lib.listDirectory(self.obj, c_char_p(path.encode('utf-8'))).decode('utf-8')
+        return self._call(lib.listDirectory, path.encode('utf-8'))
+
+    # le um diretorio em paginas de ate `page_size` entradas sem stat (o tipo
+    # vem do d_type); com with_stat=True cada pagina ja vem com tamanho, modo
+    # e mtime. levanta OSError se o diretorio nao puder ser aberto
+    def iter_directory(self, path, page_size=DIRECTORY_PAGE_SIZE, with_stat=False):
+        cursor = lib.openDirectory(self.obj, os.fsencode(path))
+        if not cursor:
+            raise OSError(f"Error opening directory: {path}")
+        try:
+            while True:
+                buffer = (DirectoryEntry * page_size)()
+                strings = create_string_buffer(page_size * (NAME_MAX + 1))
+                strings_length = c_size_t(0)
+                count = lib.readDirectoryPage(self.obj, cursor, buffer, page_size, strings, len(strings),
+                                              byref(strings_length), int(with_stat))
+                if count <= 0:
+                    return
+                yield DirectoryPage(path, buffer, count, string_at(strings, strings_length.value))
+        finally:
+            lib.closeDirectory(self.obj, cursor)
     
     def get_file_system_info(self):
-        lib.getFileSystemInfo.restype = c_char_p
-        return lib.getFileSystemInfo(self.obj).decode('utf-8')
+        return self._call(lib.getFileSystemInfo)